@@ -11,13 +11,20 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-fileConfig(config.config_file_name)
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
 # for 'autogenerate' support
-# from myapp import mymodel
-# target_metadata = mymodel.Base.metadata
-target_metadata = None
+from app.config import DATABASE_URL
+from app.database import Base
+import app.models  # noqa: F401
+
+target_metadata = Base.metadata
+
+# 🇪🇸 La URL de la base de datos sale de la configuración de la aplicación
+# 🇺🇸 The database URL comes from the application settings
+config.set_main_option("sqlalchemy.url", DATABASE_URL.replace("%", "%%"))
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -56,6 +63,13 @@ def run_migrations_online():
     and associate a connection with the context.
 
     """
+    # 🇪🇸 Permite migrar una conexión ya abierta (p. ej. desde los tests)
+    # 🇺🇸 Allows migrating an already open connection (e.g. from the tests)
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _migrar(connection)
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section),
         prefix="sqlalchemy.",
@@ -63,12 +77,18 @@ def run_migrations_online():
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection, target_metadata=target_metadata
-        )
+        _migrar(connection)
+
+
+def _migrar(connection):
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
 
-        with context.begin_transaction():
-            context.run_migrations()
+    with context.begin_transaction():
+        context.run_migrations()
 
 
 if context.is_offline_mode():
@@ -0,0 +1,57 @@
+"""contadores prestamo
+
+🇪🇸 Contadores de cuotas, saldo y próxima cuota en los préstamos
+🇺🇸 Installment, balance and next due date counters on loans
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 17:48:02.114305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('prestamos', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('cuotas_pagadas', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('cuotas_pendientes', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('saldo_pendiente', sa.Float(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('fecha_proxima_cuota', sa.DateTime(), nullable=True))
+
+    # 🇪🇸 Inicializar los contadores desde las cuotas existentes
+    # 🇺🇸 Initialize the counters from the existing installments
+    op.execute("""
+        UPDATE prestamos SET
+            cuotas_pagadas = (
+                SELECT COUNT(*) FROM pagos
+                WHERE pagos.prestamo_id = prestamos.id AND pagos.estado = 'PAGADO'
+            ),
+            cuotas_pendientes = (
+                SELECT COUNT(*) FROM pagos
+                WHERE pagos.prestamo_id = prestamos.id AND pagos.estado != 'PAGADO'
+            ),
+            saldo_pendiente = (
+                SELECT COALESCE(SUM(pagos.monto), 0) FROM pagos
+                WHERE pagos.prestamo_id = prestamos.id AND pagos.estado != 'PAGADO'
+            ),
+            fecha_proxima_cuota = (
+                SELECT MIN(pagos.fecha_programada) FROM pagos
+                WHERE pagos.prestamo_id = prestamos.id AND pagos.estado != 'PAGADO'
+            )
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('prestamos', schema=None) as batch_op:
+        batch_op.drop_column('fecha_proxima_cuota')
+        batch_op.drop_column('saldo_pendiente')
+        batch_op.drop_column('cuotas_pendientes')
+        batch_op.drop_column('cuotas_pagadas')
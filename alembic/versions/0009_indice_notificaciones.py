@@ -0,0 +1,34 @@
+"""indice notificaciones
+
+🇪🇸 Índice de notificaciones por estado, tipo y canal para el resumen agrupado
+🇺🇸 Notifications index by state, type and channel for the grouped summary
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 19:05:12.412903
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 🇪🇸 Bases creadas con una versión anterior de 0001 ya tienen el índice
+    # 🇺🇸 Databases created with an earlier version of 0001 already have the index
+    indices = {i['name'] for i in sa.inspect(op.get_bind()).get_indexes('notificaciones')}
+    if 'ix_notificaciones_estado_tipo_canal' in indices:
+        return
+    with op.batch_alter_table('notificaciones', schema=None) as batch_op:
+        batch_op.create_index('ix_notificaciones_estado_tipo_canal', ['estado', 'tipo', 'canal'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('notificaciones', schema=None) as batch_op:
+        batch_op.drop_index('ix_notificaciones_estado_tipo_canal')
@@ -0,0 +1,58 @@
+"""resumen cobranzas diario
+
+🇪🇸 Resumen diario de cobranzas por zona, cobrador y estado
+🇺🇸 Daily collections rollup by zone, collector and state
+
+🇪🇸 Para cargar el historial existente: python -m app.utils.resumen_cobranzas <desde> <hasta>
+🇺🇸 To load existing history: python -m app.utils.resumen_cobranzas <desde> <hasta>
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17 19:05:40.118275
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+ESTADOS_COBRANZA = ('PENDIENTE', 'EN_PROCESO', 'COMPLETADA', 'FALLIDA', 'REPROGRAMADA')
+
+
+def upgrade():
+    # 🇪🇸 Bases creadas con una versión anterior de 0001 ya tienen la tabla
+    # 🇺🇸 Databases created with an earlier version of 0001 already have the table
+    if sa.inspect(op.get_bind()).has_table('resumen_cobranzas_diario'):
+        return
+    op.create_table('resumen_cobranzas_diario',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('fecha', sa.Date(), nullable=False),
+    sa.Column('zona', sa.String(length=100), nullable=False),
+    sa.Column('cobrador_id', sa.Integer(), nullable=False),
+    # 🇪🇸 El tipo enum ya existe en PostgreSQL (tabla cobranzas)
+    # 🇺🇸 The enum type already exists on PostgreSQL (cobranzas table)
+    sa.Column('estado', sa.Enum(*ESTADOS_COBRANZA, name='estadocobranza').with_variant(
+        postgresql.ENUM(*ESTADOS_COBRANZA, name='estadocobranza', create_type=False), 'postgresql'
+    ), nullable=False),
+    sa.Column('cantidad', sa.Integer(), nullable=False),
+    sa.Column('monto_esperado', sa.Float(), nullable=False),
+    sa.Column('monto_recibido', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['cobrador_id'], ['usuarios.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('fecha', 'zona', 'cobrador_id', 'estado', name='uq_resumen_cobranzas_diario')
+    )
+    with op.batch_alter_table('resumen_cobranzas_diario', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_resumen_cobranzas_diario_id'), ['id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('resumen_cobranzas_diario', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_resumen_cobranzas_diario_id'))
+
+    op.drop_table('resumen_cobranzas_diario')
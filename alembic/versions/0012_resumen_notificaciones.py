@@ -0,0 +1,61 @@
+"""resumen notificaciones
+
+🇪🇸 Contadores de notificaciones por estado, tipo y canal, cargados desde las existentes
+🇺🇸 Notification counters by state, type and channel, loaded from the existing ones
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17 18:41:25.366244
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0012'
+down_revision = '0011'
+branch_labels = None
+depends_on = None
+
+ESTADOS = ('PENDIENTE', 'ENVIADA', 'FALLIDA', 'LEIDA')
+TIPOS = ('SISTEMA', 'PAGO', 'PRESTAMO', 'COBRANZA', 'ALERTA')
+CANALES = ('EMAIL', 'SMS', 'WHATSAPP', 'TELEGRAM', 'PUSH')
+
+
+def _enum(valores, nombre):
+    # 🇪🇸 Los tipos enum ya existen en PostgreSQL (tabla notificaciones)
+    # 🇺🇸 The enum types already exist on PostgreSQL (notificaciones table)
+    return sa.Enum(*valores, name=nombre).with_variant(
+        postgresql.ENUM(*valores, name=nombre, create_type=False), 'postgresql'
+    )
+
+
+def upgrade():
+    op.create_table('resumen_notificaciones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('estado', _enum(ESTADOS, 'estadonotificacion'), nullable=False),
+    sa.Column('tipo', _enum(TIPOS, 'tiponotificacion'), nullable=False),
+    sa.Column('canal', _enum(CANALES, 'canalnotificacion'), nullable=False),
+    sa.Column('cantidad', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('estado', 'tipo', 'canal', name='uq_resumen_notificaciones')
+    )
+    with op.batch_alter_table('resumen_notificaciones', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_resumen_notificaciones_id'), ['id'], unique=False)
+
+    # 🇪🇸 Carga inicial; las notificaciones sin estado cuentan como pendientes
+    # 🇺🇸 Initial load; notifications without a state count as pending
+    op.execute(
+        "INSERT INTO resumen_notificaciones (estado, tipo, canal, cantidad) "
+        "SELECT COALESCE(estado, 'PENDIENTE'), tipo, canal, COUNT(*) "
+        "FROM notificaciones GROUP BY COALESCE(estado, 'PENDIENTE'), tipo, canal"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('resumen_notificaciones', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_resumen_notificaciones_id'))
+
+    op.drop_table('resumen_notificaciones')
@@ -2,7 +2,8 @@
 🇪🇸 Configuración de la aplicación
 🇺🇸 Application configuration
 """
-from typing import List
+from datetime import date
+from typing import Dict, List
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -25,11 +26,63 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = "your-password"
     DB_NAME: str = "prestamos_gota_a_gota"
     DATABASE_URL: str = "sqlite:///./prestamos.db"  # Default for testing
+    DB_ECHO: bool = False  # 🇪🇸 Solo tiene efecto con DEBUG / 🇺🇸 Only effective with DEBUG
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # 🇪🇸 Hilos para los endpoints síncronos; conviene >= DB_POOL_SIZE + DB_MAX_OVERFLOW
+    # 🇺🇸 Threads for the synchronous endpoints; best kept >= DB_POOL_SIZE + DB_MAX_OVERFLOW
+    THREADPOOL_TAMANO: int = 40
     
     # JWT
     JWT_SECRET_KEY: str = "your-secret-key-here"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    AUTH_CACHE_TTL_SEGUNDOS: float = 60.0
+    AUTH_CACHE_MAX_USUARIOS: int = 10000
+    # 🇪🇸 Costo de bcrypt (al cambiarlo, cada hash se rehace en el siguiente login) e
+    # hilos dedicados a calcularlo (0 = uno por núcleo)
+    # 🇺🇸 Bcrypt cost (when changed, each hash is redone on the next login) and
+    # threads dedicated to computing it (0 = one per core)
+    BCRYPT_ROUNDS: int = 12
+    BCRYPT_HILOS: int = 0
+    
+    # 🇪🇸 Cronograma de pagos
+    # 🇺🇸 Payment schedule
+    CRONOGRAMA_OMITIR_DOMINGOS: bool = False
+    CRONOGRAMA_FERIADOS: List[date] = []
+    
+    # 🇪🇸 Barrido de morosidad (0 desactiva la ejecución periódica)
+    # 🇺🇸 Overdue sweep (0 disables the periodic run)
+    MOROSIDAD_INTERVALO_SEGUNDOS: int = 3600
+    MOROSIDAD_TAMANO_LOTE: int = 1000
+    
+    # 🇪🇸 Generación nocturna de cobranzas: hora UTC (-1 la desactiva; activarla
+    # en un solo worker o programar `python -m app.utils.generador_cobranzas`)
+    # 🇺🇸 Nightly collection generation: UTC hour (-1 disables it; enable it in a
+    # single worker or schedule `python -m app.utils.generador_cobranzas`)
+    COBRANZAS_HORA_GENERACION: int = -1
+    COBRANZAS_TAMANO_LOTE: int = 1000
+    
+    # 🇪🇸 Optimización de rutas (0 = un proceso por núcleo, 1 = sin pool de procesos)
+    # 🇺🇸 Route optimization (0 = one process per core, 1 = no process pool)
+    RUTAS_PROCESOS: int = 0
+    
+    # 🇪🇸 Caché de la proyección de flujo de caja (por día; 0 la desactiva)
+    # 🇺🇸 Cash-flow projection cache (per day; 0 disables it)
+    FLUJO_CAJA_CACHE_TTL_SEGUNDOS: float = 3600.0
+    FLUJO_CAJA_CACHE_MAX_ENTRADAS: int = 256
+    
+    # 🇪🇸 Despacho de notificaciones
+    # 🇺🇸 Notification dispatch
+    NOTIFICACIONES_TAMANO_LOTE: int = 500
+    NOTIFICACIONES_CONCURRENCIA: int = 10
+    NOTIFICACIONES_CONCURRENCIA_POR_CANAL: Dict[str, int] = {}
+    NOTIFICACIONES_TASA_POR_CANAL: Dict[str, float] = {}
+    NOTIFICACIONES_HTTP_TIMEOUT: float = 10.0
+    NOTIFICACIONES_HTTP_MAX_CONEXIONES: int = 20
     
     # Email (SMTP)
     SMTP_HOST: str = "smtp.gmail.com"
@@ -37,6 +90,7 @@ class Settings(BaseSettings):
     SMTP_USERNAME: str = ""
     SMTP_PASSWORD: str = ""
     SMTP_FROM_EMAIL: str = ""
+    SMTP_MAX_CONEXIONES: int = 4
     
     # WhatsApp Business API
     WHATSAPP_TOKEN: str = ""
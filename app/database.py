@@ -3,32 +3,118 @@
 🇺🇸 Database configuration
 """
 import logging
-from sqlalchemy import create_engine
+import threading
+import time
+from typing import Any, Dict
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from .config import DATABASE_URL
+from sqlalchemy.pool import QueuePool
+from .config import DATABASE_URL, settings
 
 # 🇪🇸 Configurar logging
 # 🇺🇸 Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# 🇪🇸 Crear el motor de SQLAlchemy
-# 🇺🇸 Create SQLAlchemy engine
-try:
-    logger.info(f"Intentando conectar a la base de datos con URL: {DATABASE_URL}")
-    engine = create_engine(
-        DATABASE_URL,
-        pool_pre_ping=True,
-        pool_recycle=3600,
-        echo=True  # Esto mostrará todas las consultas SQL
+class PoolMedido(QueuePool):
+    """
+    🇪🇸 QueuePool que mide cuánto esperan las peticiones por una conexión libre
+    🇺🇸 QueuePool that measures how long requests wait for a free connection
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock_metricas = threading.Lock()
+        self.esperas = 0
+        self.segundos_espera = 0.0
+        self.espera_maxima = 0.0
+        self.timeouts = 0
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._lock_metricas:
+                self.timeouts += 1
+            raise
+        finally:
+            espera = time.perf_counter() - inicio
+            with self._lock_metricas:
+                self.esperas += 1
+                self.segundos_espera += espera
+                self.espera_maxima = max(self.espera_maxima, espera)
+
+    def estadisticas(self) -> Dict[str, Any]:
+        """
+        🇪🇸 Uso del pool y tiempos de espera acumulados
+        🇺🇸 Pool usage and accumulated wait times
+        """
+        with self._lock_metricas:
+            return {
+                "tamano": self.size(),
+                "max_overflow": self._max_overflow,
+                "en_uso": self.checkedout(),
+                "libres": self.checkedin(),
+                "overflow": self.overflow(),
+                "esperas": self.esperas,
+                "espera_promedio_ms": 1000 * self.segundos_espera / self.esperas if self.esperas else 0.0,
+                "espera_maxima_ms": 1000 * self.espera_maxima,
+                "timeouts": self.timeouts,
+            }
+
+def opciones_engine(url: str) -> Dict[str, Any]:
+    """
+    🇪🇸 Argumentos de `create_engine` según la configuración. SQLite en memoria
+    conserva su pool por defecto (una única conexión compartida).
+    🇺🇸 `create_engine` arguments from the settings. In-memory SQLite keeps its
+    default pool (a single shared connection).
+    """
+    opciones: Dict[str, Any] = {
+        "echo": settings.DEBUG and settings.DB_ECHO,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    url_db = make_url(url)
+    if url_db.get_backend_name() == "sqlite" and url_db.database in (None, "", ":memory:"):
+        return opciones
+    if url_db.get_backend_name() == "sqlite":
+        opciones["connect_args"] = {"check_same_thread": False}
+    opciones.update(
+        poolclass=PoolMedido,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
     )
-    # Probar la conexión
-    with engine.connect() as conn:
-        logger.info("¡Conexión exitosa a la base de datos!")
-except Exception as e:
-    logger.error(f"Error al conectar a la base de datos: {str(e)}")
-    raise
+    return opciones
+
+# 🇪🇸 Crear el motor de SQLAlchemy (la primera conexión se abre al usarlo)
+# 🇺🇸 Create SQLAlchemy engine (the first connection opens on first use)
+engine = create_engine(DATABASE_URL, **opciones_engine(DATABASE_URL))
+
+def verificar_conexion() -> None:
+    """
+    🇪🇸 Comprueba la conexión a la base de datos (se llama al iniciar la aplicación)
+    🇺🇸 Checks the database connection (called on application startup)
+    """
+    url = engine.url.render_as_string(hide_password=True)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        logger.info(f"Conexión exitosa a la base de datos: {url}")
+    except Exception as e:
+        logger.error(f"Error al conectar a la base de datos {url}: {str(e)}")
+        raise
+
+def estadisticas_pool() -> Dict[str, Any]:
+    """
+    🇪🇸 Métricas del pool de conexiones del motor
+    🇺🇸 Metrics of the engine's connection pool
+    """
+    if isinstance(engine.pool, PoolMedido):
+        return engine.pool.estadisticas()
+    return {"clase": type(engine.pool).__name__, "estado": engine.pool.status()}
 
 # 🇪🇸 Crear la sesión local
 # 🇺🇸 Create local session
@@ -45,4 +131,4 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
@@ -2,10 +2,21 @@
 🇪🇸 Punto de entrada principal de la aplicación
 🇺🇸 Main application entry point
 """
-from fastapi import FastAPI
+import asyncio
+import anyio
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .routers import usuarios, prestamos, pagos, notificaciones, cobranza, auth, clientes, rutas
+from .routers import usuarios, prestamos, pagos, notificaciones, cobranza, auth, clientes, rutas, sincronizacion, reportes
 from .config import settings
+from .database import verificar_conexion, estadisticas_pool
+from .utils.paginacion import CABECERA_CURSOR
+from .models.usuario import Usuario
+from .utils.auth import cache_usuarios, get_current_active_user
+from .utils.flujo_caja import cache_proyecciones
+from .utils.notification_providers import registro_proveedores
+from .utils.morosidad import barrido_periodico
+from .utils.generador_cobranzas import generacion_nocturna
+from .utils import optimizacion_rutas
 
 # 🇪🇸 Crear la aplicación FastAPI
 # 🇺🇸 Create FastAPI application
@@ -32,6 +43,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[CABECERA_CURSOR],
 )
 
 # 🇪🇸 Incluir los routers
@@ -92,6 +104,58 @@ app.include_router(
     responses={404: {"description": "No encontrado"}},
 )
 
+app.include_router(
+    sincronizacion.router,
+    prefix="/api/v1/sincronizacion",
+    tags=["Sincronización"],
+    responses={404: {"description": "No encontrado"}},
+)
+
+app.include_router(
+    reportes.router,
+    prefix="/api/v1/reportes",
+    tags=["Reportes"],
+    responses={404: {"description": "No encontrado"}},
+)
+
+# 🇪🇸 Tareas de fondo iniciadas con la aplicación
+# 🇺🇸 Background tasks started with the application
+tareas_fondo = []
+
+@app.on_event("startup")
+async def startup():
+    """
+    🇪🇸 Verifica la base de datos, dimensiona el pool de hilos de los endpoints
+    síncronos, crea el pool de procesos de las rutas, inicia los proveedores de
+    notificaciones y programa el barrido de morosidad y la generación nocturna de
+    cobranzas
+    🇺🇸 Checks the database, sizes the thread pool of the synchronous endpoints,
+    creates the route process pool, starts the notification providers and
+    schedules the overdue sweep and the nightly collection generation
+    """
+    verificar_conexion()
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_TAMANO
+    optimizacion_rutas.iniciar_pool()
+    await registro_proveedores.iniciar()
+    if settings.MOROSIDAD_INTERVALO_SEGUNDOS > 0:
+        tareas_fondo.append(asyncio.create_task(barrido_periodico(settings.MOROSIDAD_INTERVALO_SEGUNDOS)))
+    if 0 <= settings.COBRANZAS_HORA_GENERACION <= 23:
+        tareas_fondo.append(asyncio.create_task(generacion_nocturna(settings.COBRANZAS_HORA_GENERACION)))
+
+@app.on_event("shutdown")
+async def shutdown():
+    """
+    🇪🇸 Detiene las tareas de fondo, cierra las conexiones de los proveedores y el
+    pool de procesos de las rutas
+    🇺🇸 Stops the background tasks, closes the providers' connections and the
+    route process pool
+    """
+    for tarea in tareas_fondo:
+        tarea.cancel()
+    tareas_fondo.clear()
+    await registro_proveedores.cerrar()
+    await anyio.to_thread.run_sync(optimizacion_rutas.cerrar_pool)
+
 @app.get("/", tags=["Root"])
 async def root():
     """
@@ -103,4 +167,16 @@ async def root():
         "version": "1.0.0",
         "docs": "/api/v1/docs",
         "redoc": "/api/v1/redoc"
-    } 
\ No newline at end of file
+    }
+
+@app.get("/api/v1/metricas", tags=["Root"])
+async def metricas(current_user: Usuario = Depends(get_current_active_user)):
+    """
+    🇪🇸 Métricas internas del proceso (cachés y pool de conexiones); requiere autenticación
+    🇺🇸 Internal process metrics (caches and connection pool); requires authentication
+    """
+    return {
+        "cache_usuarios": cache_usuarios.estadisticas(),
+        "cache_flujo_caja": cache_proyecciones.estadisticas(),
+        "pool_db": estadisticas_pool()
+    }
@@ -10,6 +10,9 @@ from .pago import Pago
 from .notificacion import Notificacion
 from .cobranza import Cobranza
 from .ruta import Ruta
+from .resumen_cobranza import ResumenCobranzaDiario
+from .resumen_notificacion import ResumenNotificaciones
+from .sincronizacion import OperacionSincronizada
 
 # Asegurar que todos los modelos estén disponibles
 __all__ = [
@@ -20,5 +23,8 @@ __all__ = [
     "Pago",
     "Notificacion",
     "Cobranza",
-    "Ruta"
+    "Ruta",
+    "ResumenCobranzaDiario",
+    "ResumenNotificaciones",
+    "OperacionSincronizada"
 ] 
\ No newline at end of file
@@ -2,13 +2,33 @@
 🇪🇸 Modelo de Cliente
 🇺🇸 Client Model
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, event
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..database import Base
+from ..utils.texto import compactar, normalizar
+
+# 🇪🇸 Columnas de búsqueda: el LIKE 'prefijo%' usa el índice en SQLite con NOCASE,
+# en PostgreSQL con text_pattern_ops y en MySQL sin nada más
+# 🇺🇸 Search columns: LIKE 'prefix%' uses the index in SQLite with NOCASE, in
+# PostgreSQL with text_pattern_ops and in MySQL as is
+COLUMNAS_BUSQUEDA = (
+    "cedula_busqueda",
+    "nombre_busqueda",
+    "apellido_busqueda",
+    "telefono_busqueda",
+    "direccion_busqueda",
+)
+
+def _texto_busqueda(largo: int) -> String:
+    return String(largo).with_variant(String(largo, collation="NOCASE"), "sqlite")
 
 class Cliente(Base):
     __tablename__ = "clientes"
+    __table_args__ = tuple(
+        Index(f"ix_clientes_{columna}", columna, postgresql_ops={columna: "text_pattern_ops"})
+        for columna in COLUMNAS_BUSQUEDA
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     cedula = Column(String(20), unique=True, index=True)
@@ -19,9 +39,45 @@ class Cliente(Base):
     email = Column(String(100), unique=True, index=True)
     fecha_registro = Column(DateTime, default=datetime.utcnow)
     activo = Column(Boolean, default=True)
+    ruta_id = Column(Integer, ForeignKey("rutas.id"), nullable=True, index=True)
+
+    # 🇪🇸 Copias normalizadas (sin tildes, minúsculas) para la búsqueda por prefijo
+    # 🇺🇸 Normalized copies (accent-free, lowercase) for prefix search
+    cedula_busqueda = Column(_texto_busqueda(20))
+    nombre_busqueda = Column(_texto_busqueda(201))
+    apellido_busqueda = Column(_texto_busqueda(201))
+    telefono_busqueda = Column(_texto_busqueda(20))
+    direccion_busqueda = Column(_texto_busqueda(200))
     
     # Relaciones
     prestamos = relationship("Prestamo", back_populates="cliente")
+    ruta = relationship("Ruta", back_populates="clientes")
 
     class Config:
-        orm_mode = True 
\ No newline at end of file
+        orm_mode = True
+
+def campos_busqueda(cedula, nombre, apellido, telefono, direccion) -> dict:
+    """
+    🇪🇸 Valores de las columnas de búsqueda; también para inserciones masivas
+    🇺🇸 Search column values; also for bulk inserts
+    """
+    return {
+        "cedula_busqueda": compactar(cedula),
+        "nombre_busqueda": normalizar(f"{nombre or ''} {apellido or ''}"),
+        "apellido_busqueda": normalizar(f"{apellido or ''} {nombre or ''}"),
+        "telefono_busqueda": compactar(telefono),
+        "direccion_busqueda": normalizar(direccion)[:200],
+    }
+
+@event.listens_for(Cliente, "before_insert")
+@event.listens_for(Cliente, "before_update")
+def _actualizar_busqueda(mapper, connection, cliente: Cliente) -> None:
+    """
+    🇪🇸 Mantiene las columnas de búsqueda en cada alta o cambio por el ORM
+    🇺🇸 Keeps the search columns up to date on every ORM insert or change
+    """
+    campos = campos_busqueda(
+        cliente.cedula, cliente.nombre, cliente.apellido, cliente.telefono, cliente.direccion
+    )
+    for campo, valor in campos.items():
+        setattr(cliente, campo, valor)
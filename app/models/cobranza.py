@@ -2,7 +2,8 @@
 🇪🇸 Modelo de Cobranza
 🇺🇸 Collection Model
 """
-from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Enum, Boolean
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Enum, Boolean, Index, UniqueConstraint, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -35,11 +36,22 @@ class Cobranza(Base):
     🇺🇸 Main collection model
     """
     __tablename__ = "cobranzas"
+    __table_args__ = (
+        # 🇪🇸 Agenda diaria de un cobrador
+        # 🇺🇸 A collector's daily agenda
+        Index("ix_cobranzas_cobrador_fecha", "cobrador_id", "fecha_programada"),
+        # 🇪🇸 Rutas del día ordenadas por zona, cobrador y orden de visita
+        # 🇺🇸 Day routes ordered by zone, collector and visit order
+        Index("ix_cobranzas_fecha_zona_cobrador_orden", "fecha_programada", "zona", "cobrador_id", "orden_ruta"),
+        # 🇪🇸 Una cobranza por cuota y fecha: la generación nocturna corre en cada worker
+        # 🇺🇸 One collection per installment and date: nightly generation runs in every worker
+        UniqueConstraint("pago_id", "fecha_programada", name="uq_cobranzas_pago_fecha"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
     # Referencias
-    pago_id = Column(Integer, ForeignKey("pagos.id"), nullable=False)
+    pago_id = Column(Integer, ForeignKey("pagos.id"), nullable=False, index=True)
     cobrador_id = Column(Integer, ForeignKey("usuarios.id"), nullable=False)
     
     # Información de la cobranza
@@ -53,6 +65,8 @@ class Cobranza(Base):
     direccion_cobro = Column(String(500), nullable=False)
     ruta_id = Column(Integer, ForeignKey("rutas.id"), nullable=True)
     orden_ruta = Column(Integer, nullable=True)
+    latitud = Column(Float, nullable=True)
+    longitud = Column(Float, nullable=True)
     
     # Timestamps
     fecha_programada = Column(DateTime(timezone=True), nullable=False)
@@ -72,4 +86,24 @@ class Cobranza(Base):
     notificaciones = relationship("Notificacion", back_populates="cobranza")
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True 
+
+def a_utc(fecha: datetime) -> datetime:
+    """
+    🇪🇸 Pasa a UTC una fecha con zona horaria; las fechas sin zona ya son UTC
+    🇺🇸 Converts a timezone-aware datetime to UTC; naive datetimes already are UTC
+    """
+    if fecha is not None and fecha.tzinfo is not None:
+        return fecha.astimezone(timezone.utc)
+    return fecha
+
+@event.listens_for(Cobranza, "before_insert")
+@event.listens_for(Cobranza, "before_update")
+def _normalizar_fecha_programada(mapper, connection, cobranza: Cobranza) -> None:
+    """
+    🇪🇸 Guarda `fecha_programada` en UTC: SQLite y MySQL descartan el desfase, y el
+    día del resumen diario se calcula sobre la hora UTC (ver utils/resumen_cobranzas.py)
+    🇺🇸 Stores `fecha_programada` in UTC: SQLite and MySQL drop the offset, and the
+    daily summary's day is computed on the UTC time (see utils/resumen_cobranzas.py)
+    """
+    cobranza.fecha_programada = a_utc(cobranza.fecha_programada)
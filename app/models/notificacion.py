@@ -2,8 +2,8 @@
 🇪🇸 Modelo de Notificación
 🇺🇸 Notification Model
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, JSON, Index
+from sqlalchemy.orm import column_property, relationship
 from sqlalchemy.sql import func
 import enum
 from ..database import Base
@@ -46,12 +46,21 @@ class Notificacion(Base):
     🇺🇸 Notification model
     """
     __tablename__ = "notificaciones"
+    __table_args__ = (
+        # 🇪🇸 Índice de cobertura para el resumen agrupado por estado, tipo y canal
+        # 🇺🇸 Covering index for the summary grouped by state, type and channel
+        Index("ix_notificaciones_estado_tipo_canal", "estado", "tipo", "canal"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
     # Tipo y canal
-    tipo = Column(Enum(TipoNotificacion), nullable=False)
-    canal = Column(Enum(CanalNotificacion), nullable=False)
+    # 🇪🇸 active_history: al cambiarlos se carga el valor previo, que necesitan los
+    # contadores de models/resumen_notificacion.py aunque el objeto esté expirado
+    # 🇺🇸 active_history: changing them loads the previous value, which the counters
+    # in models/resumen_notificacion.py need even when the object is expired
+    tipo = column_property(Column(Enum(TipoNotificacion), nullable=False), active_history=True)
+    canal = column_property(Column(Enum(CanalNotificacion), nullable=False), active_history=True)
     
     # Contenido
     titulo = Column(String(255), nullable=False)
@@ -65,7 +74,10 @@ class Notificacion(Base):
     cobranza_id = Column(Integer, ForeignKey("cobranzas.id"), nullable=True)
     
     # Estado y fechas
-    estado = Column(Enum(EstadoNotificacion), default=EstadoNotificacion.PENDIENTE)
+    estado = column_property(
+        Column(Enum(EstadoNotificacion), default=EstadoNotificacion.PENDIENTE),
+        active_history=True
+    )
     fecha_creacion = Column(DateTime(timezone=True), server_default=func.now())
     fecha_envio = Column(DateTime(timezone=True), nullable=True)
     fecha_lectura = Column(DateTime(timezone=True), nullable=True)
@@ -2,7 +2,7 @@
 🇪🇸 Modelo de Pago
 🇺🇸 Payment Model
 """
-from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -15,6 +15,14 @@ class EstadoPago(str, enum.Enum):
 
 class Pago(Base):
     __tablename__ = "pagos"
+    __table_args__ = (
+        # 🇪🇸 Cuotas de un préstamo por estado (cierre del préstamo, cuotas pendientes)
+        # 🇺🇸 A loan's installments by state (loan completion, pending installments)
+        Index("ix_pagos_prestamo_estado", "prestamo_id", "estado"),
+        # 🇪🇸 Cuotas vencidas: estado + rango de fecha programada
+        # 🇺🇸 Overdue installments: state + scheduled date range
+        Index("ix_pagos_estado_fecha_programada", "estado", "fecha_programada"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     prestamo_id = Column(Integer, ForeignKey("prestamos.id"))
@@ -38,11 +38,18 @@ class Prestamo(Base):
     # Campos calculados almacenados
     monto_total = Column(Float)  # Monto + interés
     valor_cuota = Column(Float)
+
+    # 🇪🇸 Contadores mantenidos en la misma transacción que cada cambio de pago
+    # 🇺🇸 Counters maintained in the same transaction as every payment change
+    cuotas_pagadas = Column(Integer, nullable=False, default=0, server_default="0")
+    cuotas_pendientes = Column(Integer, nullable=False, default=0, server_default="0")
+    saldo_pendiente = Column(Float, nullable=False, default=0.0, server_default="0")
+    fecha_proxima_cuota = Column(DateTime, nullable=True)
     
     # Relaciones
     cliente = relationship("Cliente", back_populates="prestamos")
     creado_por = relationship("Usuario", back_populates="prestamos_creados")
-    pagos = relationship("Pago", back_populates="prestamo")
+    pagos = relationship("Pago", back_populates="prestamo", order_by="Pago.numero_cuota")
     notificaciones = relationship("Notificacion", back_populates="prestamo")
 
     class Config:
@@ -0,0 +1,29 @@
+"""
+🇪🇸 Modelo de resumen diario de cobranzas
+🇺🇸 Daily collection summary model
+"""
+from sqlalchemy import Column, Integer, Float, String, Date, ForeignKey, Enum, UniqueConstraint
+from ..database import Base
+from .cobranza import EstadoCobranza
+
+class ResumenCobranzaDiario(Base):
+    """
+    🇪🇸 Acumulado por día × zona × cobrador × estado, mantenido al escribir cobranzas
+    🇺🇸 Rollup per day × zone × collector × state, maintained when collections are written
+    """
+    __tablename__ = "resumen_cobranzas_diario"
+    __table_args__ = (
+        UniqueConstraint("fecha", "zona", "cobrador_id", "estado", name="uq_resumen_cobranzas_diario"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    fecha = Column(Date, nullable=False)
+    zona = Column(String(100), nullable=False)
+    cobrador_id = Column(Integer, ForeignKey("usuarios.id"), nullable=False)
+    estado = Column(Enum(EstadoCobranza), nullable=False)
+    
+    # 🇪🇸 Acumulados
+    # 🇺🇸 Running totals
+    cantidad = Column(Integer, nullable=False, default=0)
+    monto_esperado = Column(Float, nullable=False, default=0)
+    monto_recibido = Column(Float, nullable=False, default=0)
@@ -0,0 +1,99 @@
+"""
+🇪🇸 Modelo de contadores de notificaciones
+🇺🇸 Notification counters model
+"""
+from collections import Counter
+from typing import Iterable, List, Tuple
+from sqlalchemy import Column, Integer, Enum, UniqueConstraint, event, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from ..database import Base
+from ..utils.upsert import upsert_acumulado
+from .notificacion import Notificacion, TipoNotificacion, CanalNotificacion, EstadoNotificacion
+
+# 🇪🇸 Fila de los contadores: (estado, tipo, canal)
+# 🇺🇸 Counter row: (state, type, channel)
+Clave = Tuple[EstadoNotificacion, TipoNotificacion, CanalNotificacion]
+
+CLAVE = ("estado", "tipo", "canal")
+
+class ResumenNotificaciones(Base):
+    """
+    🇪🇸 Cantidad de notificaciones por estado × tipo × canal, mantenida al escribirlas
+    🇺🇸 Notification count per state × type × channel, maintained when they are written
+    """
+    __tablename__ = "resumen_notificaciones"
+    __table_args__ = (
+        UniqueConstraint("estado", "tipo", "canal", name="uq_resumen_notificaciones"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    estado = Column(Enum(EstadoNotificacion), nullable=False)
+    tipo = Column(Enum(TipoNotificacion), nullable=False)
+    canal = Column(Enum(CanalNotificacion), nullable=False)
+    cantidad = Column(Integer, nullable=False, default=0)
+
+def acumular(conexion: Connection, antes: Iterable[Clave] = (), despues: Iterable[Clave] = ()) -> None:
+    """
+    🇪🇸 Resta una notificación de cada clave de `antes` y suma una a cada clave de
+    `despues`. Debe llamarse en la misma transacción que el cambio; las escrituras del
+    ORM lo hacen solas (ver `_actualizar_contadores`), las masivas deben llamarlo.
+    🇺🇸 Subtracts one notification from each key in `antes` and adds one to each
+    key in `despues`. Must be called in the same transaction as the change; ORM
+    writes do it on their own (see `_actualizar_contadores`), bulk ones must call it.
+    """
+    deltas = Counter(despues)
+    deltas.subtract(antes)
+    filas = [
+        {"estado": clave[0], "tipo": clave[1], "canal": clave[2], "cantidad": cantidad}
+        for clave, cantidad in deltas.items()
+        if cantidad
+    ]
+    if filas:
+        upsert_acumulado(conexion, ResumenNotificaciones.__table__, CLAVE, filas)
+
+def _clave(notificacion: Notificacion) -> Clave:
+    return (
+        notificacion.estado or EstadoNotificacion.PENDIENTE,
+        notificacion.tipo,
+        notificacion.canal,
+    )
+
+def _clave_anterior(notificacion: Notificacion) -> Clave:
+    """
+    🇪🇸 Clave con los valores cargados de la base, antes de los cambios sin guardar
+    🇺🇸 Key with the values loaded from the database, before unsaved changes
+    """
+    atributos = inspect(notificacion).attrs
+    valores = []
+    for campo in CLAVE:
+        historial = atributos[campo].history
+        valores.append(historial.deleted[0] if historial.deleted else getattr(notificacion, campo))
+    estado, tipo, canal = valores
+    return (estado or EstadoNotificacion.PENDIENTE, tipo, canal)
+
+@event.listens_for(Session, "before_flush")
+def _actualizar_contadores(session: Session, flush_context, instances) -> None:
+    """
+    🇪🇸 Ajusta los contadores con las notificaciones nuevas, modificadas y borradas.
+    Se registra junto al modelo, así que vale para cualquier sesión de la aplicación.
+    🇺🇸 Adjusts the counters for new, modified and deleted notifications. Registered
+    next to the model, so it applies to every session in the application.
+    """
+    antes: List[Clave] = []
+    despues: List[Clave] = []
+    with session.no_autoflush:
+        for objeto in session.new:
+            if isinstance(objeto, Notificacion):
+                despues.append(_clave(objeto))
+        for objeto in session.dirty:
+            if isinstance(objeto, Notificacion) and session.is_modified(objeto):
+                anterior, actual = _clave_anterior(objeto), _clave(objeto)
+                if anterior != actual:
+                    antes.append(anterior)
+                    despues.append(actual)
+        for objeto in session.deleted:
+            if isinstance(objeto, Notificacion):
+                antes.append(_clave_anterior(objeto))
+    if antes or despues:
+        acumular(session.connection(), antes, despues)
@@ -24,6 +24,7 @@ class Ruta(Base):
     # Relaciones
     cobrador = relationship("Usuario", back_populates="rutas_asignadas")
     cobranzas = relationship("Cobranza", back_populates="ruta")
+    clientes = relationship("Cliente", back_populates="ruta")
 
     class Config:
         from_attributes = True 
\ No newline at end of file
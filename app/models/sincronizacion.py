@@ -0,0 +1,29 @@
+"""
+🇪🇸 Modelo de operaciones sincronizadas desde la app móvil
+🇺🇸 Model for operations synced from the mobile app
+"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from ..database import Base
+
+class OperacionSincronizada(Base):
+    """
+    🇪🇸 Resultado de cada operación recibida por la sincronización, por usuario y
+    clave de idempotencia, para que reenviarla no la aplique dos veces
+    🇺🇸 Outcome of each operation received through sync, by user and idempotency
+    key, so that resending it does not apply it twice
+    """
+    __tablename__ = "operaciones_sincronizadas"
+    __table_args__ = (
+        # 🇪🇸 Las claves las genera cada teléfono: solo son únicas por usuario
+        # 🇺🇸 Keys are generated by each phone: they are only unique per user
+        UniqueConstraint("usuario_id", "clave", name="uq_operaciones_sincronizadas_usuario_clave"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    clave = Column(String(64), nullable=False)
+    usuario_id = Column(Integer, ForeignKey("usuarios.id"), nullable=False)
+    tipo = Column(String(20), nullable=False)
+    objeto_id = Column(Integer, nullable=False)
+    resultado = Column(String(20), nullable=False)
+    fecha_creacion = Column(DateTime(timezone=True), server_default=func.now())
@@ -3,28 +3,56 @@
 🇺🇸 Authentication router
 """
 from datetime import timedelta
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from ..database import get_db
 from ..models.usuario import Usuario
-from ..utils.auth import verify_password, create_access_token
+from ..utils.auth import verificar_y_actualizar_password, create_access_token, invalidar_usuario
 from ..config import settings
 
 router = APIRouter()
 
+def _buscar_usuario(db: Session, email: str):
+    """
+    🇪🇸 Columnas del usuario para el login; termina la transacción para devolver la
+    conexión al pool antes de esperar a bcrypt
+    🇺🇸 User columns for the login; ends the transaction to return the connection
+    to the pool before waiting on bcrypt
+    """
+    user = db.query(
+        Usuario.id, Usuario.email, Usuario.nombre, Usuario.rol_id,
+        Usuario.is_active, Usuario.hashed_password
+    ).filter(Usuario.email == email).first()
+    db.rollback()
+    return user
+
+def _guardar_hash(db: Session, usuario_id: int, email: str, hashed_password: str) -> None:
+    """
+    🇪🇸 Guarda el hash rehecho con el costo actual de bcrypt
+    🇺🇸 Stores the hash redone with the current bcrypt cost
+    """
+    db.query(Usuario).filter(Usuario.id == usuario_id).update(
+        {Usuario.hashed_password: hashed_password}, synchronize_session=False
+    )
+    db.commit()
+    invalidar_usuario(email)
+
 @router.post("/login")
 async def login(
     db: Session = Depends(get_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ):
     """
-    🇪🇸 Endpoint de login que devuelve un token JWT
-    🇺🇸 Login endpoint that returns a JWT token
+    🇪🇸 Endpoint de login que devuelve un token JWT. Las consultas van al pool de
+    hilos y bcrypt a sus propios hilos, así el event loop sigue atendiendo al resto.
+    🇺🇸 Login endpoint that returns a JWT token. Queries go to the thread pool and
+    bcrypt to its own threads, so the event loop keeps serving everything else.
     """
     # 🇪🇸 Buscar usuario por email
     # 🇺🇸 Find user by email
-    user = db.query(Usuario).filter(Usuario.email == form_data.username).first()
+    user = await anyio.to_thread.run_sync(_buscar_usuario, db, form_data.username)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -34,7 +62,8 @@ async def login(
     
     # 🇪🇸 Verificar contraseña
     # 🇺🇸 Verify password
-    if not verify_password(form_data.password, user.hashed_password):
+    valida, nuevo_hash = await verificar_y_actualizar_password(form_data.password, user.hashed_password)
+    if not valida:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Credenciales incorrectas",
@@ -49,6 +78,11 @@ async def login(
             detail="Usuario inactivo"
         )
     
+    # 🇪🇸 Rehacer el hash si BCRYPT_ROUNDS cambió desde que se generó
+    # 🇺🇸 Redo the hash if BCRYPT_ROUNDS changed since it was generated
+    if nuevo_hash is not None:
+        await anyio.to_thread.run_sync(_guardar_hash, db, user.id, user.email, nuevo_hash)
+    
     # 🇪🇸 Crear token de acceso
     # 🇺🇸 Create access token
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -66,4 +100,4 @@ async def login(
             "nombre": user.nombre,
             "rol_id": user.rol_id
         }
-    } 
\ No newline at end of file
+    }
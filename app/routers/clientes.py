@@ -2,18 +2,20 @@
 🇪🇸 Router para la gestión de clientes
 🇺🇸 Router for client management
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from ..database import get_db
 from ..models.cliente import Cliente
-from ..schemas.cliente import ClienteCreate, ClienteUpdate, Cliente as ClienteSchema
+from ..schemas.cliente import ClienteCreate, ClienteUpdate, Cliente as ClienteSchema, ClienteBusqueda
 from ..utils.auth import get_current_active_user
+from ..utils.busqueda_clientes import buscar_clientes
+from ..utils.paginacion import paginar, publicar_cursor, LIMITE_POR_DEFECTO, LIMITE_MAXIMO
 
 router = APIRouter()
 
 @router.post("/", response_model=ClienteSchema)
-async def create_cliente(
+def create_cliente(
     cliente: ClienteCreate,
     db: Session = Depends(get_db),
     current_user: Cliente = Depends(get_current_active_user)
@@ -36,21 +38,45 @@ async def create_cliente(
     return db_cliente
 
 @router.get("/", response_model=List[ClienteSchema])
-async def get_clientes(
-    skip: int = 0,
-    limit: int = 100,
+def get_clientes(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO),
+    orden: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: Cliente = Depends(get_current_active_user)
 ):
     """
-    🇪🇸 Obtener lista de clientes
-    🇺🇸 Get list of clients
+    🇪🇸 Obtener lista de clientes (paginada por cursor)
+    🇺🇸 Get list of clients (cursor paginated)
     """
-    clientes = db.query(Cliente).offset(skip).limit(limit).all()
+    clientes, siguiente = paginar(
+        db.query(Cliente), Cliente, cursor, limit, orden,
+        columnas_orden={
+            "apellido": Cliente.apellido,
+            "fecha_registro": Cliente.fecha_registro,
+        }
+    )
+    publicar_cursor(response, siguiente)
     return clientes
 
+@router.get("/buscar", response_model=List[ClienteBusqueda])
+def buscar(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: Cliente = Depends(get_current_active_user)
+):
+    """
+    🇪🇸 Buscar clientes por prefijo de cédula, teléfono, nombre o dirección, sin
+    distinguir tildes ni mayúsculas, ordenados por relevancia
+    🇺🇸 Search clients by ID, phone, name or address prefix, ignoring accents and
+    case, ordered by relevance
+    """
+    return buscar_clientes(db, q, limit)
+
 @router.get("/{cliente_id}", response_model=ClienteSchema)
-async def get_cliente(
+def get_cliente(
     cliente_id: int,
     db: Session = Depends(get_db),
     current_user: Cliente = Depends(get_current_active_user)
@@ -68,7 +94,7 @@ async def get_cliente(
     return cliente
 
 @router.put("/{cliente_id}", response_model=ClienteSchema)
-async def update_cliente(
+def update_cliente(
     cliente_id: int,
     cliente: ClienteUpdate,
     db: Session = Depends(get_db),
@@ -93,7 +119,7 @@ async def update_cliente(
     return db_cliente
 
 @router.delete("/{cliente_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_cliente(
+def delete_cliente(
     cliente_id: int,
     db: Session = Depends(get_db),
     current_user: Cliente = Depends(get_current_active_user)
@@ -2,28 +2,109 @@
 🇪🇸 Router para la gestión de cobranzas
 🇺🇸 Router for collection management
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from itertools import groupby
+from operator import itemgetter
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import datetime, date, timedelta
 from sqlalchemy.sql import func
 from ..database import get_db
 from ..models.cobranza import Cobranza, EstadoCobranza
 from ..models.usuario import Usuario
+from ..models.resumen_cobranza import ResumenCobranzaDiario
 from ..schemas.cobranza import (
     CobranzaCreate,
     CobranzaUpdate,
     Cobranza as CobranzaSchema,
     CobranzaResumen,
     RutaCobranza,
-    AsignacionCobranza
+    OptimizacionRutas,
+    GeneracionCobranzas,
+    AsignacionCobranza,
+    ResultadoAsignacion
 )
+from ..utils.asignacion_cobranzas import condiciones_asignacion, reasignar
 from ..utils.auth import get_current_active_user, verificar_rol_cobrador
+from ..utils.generador_cobranzas import generar_cobranzas
+from ..utils.resumen_cobranzas import acumular, aporte
+from ..utils.optimizacion_rutas import optimizar_rutas_del_dia
+from ..utils.paginacion import paginar, publicar_cursor, LIMITE_POR_DEFECTO, LIMITE_MAXIMO
 
 router = APIRouter()
 
+# 🇪🇸 Columnas de `CobranzaSchema`, leídas como tuplas sin construir objetos ORM
+# 🇺🇸 `CobranzaSchema` columns, read as tuples without building ORM objects
+COLUMNAS_COBRANZA = (
+    Cobranza.id,
+    Cobranza.pago_id,
+    Cobranza.cobrador_id,
+    Cobranza.monto_esperado,
+    Cobranza.zona,
+    Cobranza.direccion_cobro,
+    Cobranza.fecha_programada,
+    Cobranza.ruta_id,
+    Cobranza.orden_ruta,
+    Cobranza.latitud,
+    Cobranza.longitud,
+    Cobranza.monto_recibido,
+    Cobranza.metodo_pago,
+    Cobranza.estado,
+    Cobranza.fecha_realizada,
+    Cobranza.fecha_creacion,
+    Cobranza.fecha_actualizacion,
+    Cobranza.intentos,
+    Cobranza.notas,
+    Cobranza.requiere_supervisor,
+)
+CLAVES_COBRANZA = tuple(columna.key for columna in COLUMNAS_COBRANZA)
+
+def json_por_defecto(valor):
+    """
+    🇪🇸 Serializa lo que `json` no conoce; los enums ya son `str` y salen tal cual
+    🇺🇸 Serializes what `json` does not know; enums already are `str` and pass through
+    """
+    if isinstance(valor, (datetime, date)):
+        return valor.isoformat()
+    raise TypeError(f"No serializable: {type(valor).__name__}")
+
+def rutas_del_dia(db: Session, fecha: date) -> List[dict]:
+    """
+    🇪🇸 Rutas del día agrupadas por (zona, cobrador) en una sola pasada sobre
+    tuplas ya ordenadas, listas para `json.dumps(..., default=json_por_defecto)`
+    🇺🇸 The day's routes grouped by (zone, collector) in a single pass over
+    already sorted tuples, ready for `json.dumps(..., default=json_por_defecto)`
+    """
+    filas = db.query(*COLUMNAS_COBRANZA).filter(
+        Cobranza.fecha_programada >= fecha,
+        Cobranza.fecha_programada < fecha + timedelta(days=1)
+    ).order_by(
+        Cobranza.zona,
+        Cobranza.cobrador_id,
+        Cobranza.orden_ruta,
+        Cobranza.id
+    ).all()
+
+    fecha_ruta = datetime.combine(fecha, datetime.min.time()).isoformat()
+    i_zona = CLAVES_COBRANZA.index("zona")
+    i_cobrador = CLAVES_COBRANZA.index("cobrador_id")
+    rutas = []
+    for i, ((zona, cobrador_id), grupo) in enumerate(
+        groupby(filas, key=itemgetter(i_zona, i_cobrador)), 1
+    ):
+        rutas.append({
+            "id": i,
+            "fecha": fecha_ruta,
+            "cobrador_id": cobrador_id,
+            "zona": zona,
+            "cobranzas": [dict(zip(CLAVES_COBRANZA, fila)) for fila in grupo],
+        })
+    return rutas
+
 @router.post("/", response_model=CobranzaSchema)
-async def crear_cobranza(
+def crear_cobranza(
     cobranza: CobranzaCreate,
     db: Session = Depends(get_db),
     current_user: Usuario = Depends(get_current_active_user)
@@ -42,12 +123,21 @@ async def crear_cobranza(
     
     db_cobranza = Cobranza(**cobranza.dict())
     db.add(db_cobranza)
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="La cuota ya tiene una cobranza en esa fecha"
+        )
+    acumular(db, despues=[aporte(db_cobranza)])
     db.commit()
     db.refresh(db_cobranza)
     return db_cobranza
 
 @router.put("/{cobranza_id}", response_model=CobranzaSchema)
-async def actualizar_cobranza(
+def actualizar_cobranza(
     cobranza_id: int,
     cobranza: CobranzaUpdate,
     db: Session = Depends(get_db),
@@ -57,43 +147,56 @@ async def actualizar_cobranza(
     🇪🇸 Actualiza una cobranza existente
     🇺🇸 Updates an existing collection
     """
-    db_cobranza = db.query(Cobranza).filter(Cobranza.id == cobranza_id).first()
+    # 🇪🇸 Bloqueo de la fila: dos PUT simultáneos restarían el mismo aporte del resumen
+    # 🇺🇸 Row lock: two concurrent PUTs would subtract the same summary contribution
+    db_cobranza = db.query(Cobranza).filter(Cobranza.id == cobranza_id).with_for_update().first()
     if not db_cobranza:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Cobranza no encontrada"
         )
     
+    antes = aporte(db_cobranza)
     for key, value in cobranza.dict(exclude_unset=True).items():
         setattr(db_cobranza, key, value)
     
     if cobranza.estado == EstadoCobranza.COMPLETADA:
         db_cobranza.fecha_realizada = datetime.utcnow()
     
+    acumular(db, antes=[antes], despues=[aporte(db_cobranza)])
     db.commit()
     db.refresh(db_cobranza)
     return db_cobranza
 
 @router.get("/cobrador/{cobrador_id}", response_model=List[CobranzaSchema])
-async def obtener_cobranzas_por_cobrador(
+def obtener_cobranzas_por_cobrador(
     cobrador_id: int,
     fecha: date,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO),
+    orden: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: Usuario = Depends(get_current_active_user)
 ):
     """
-    🇪🇸 Obtiene las cobranzas asignadas a un cobrador en una fecha
-    🇺🇸 Gets collections assigned to a collector on a date
+    🇪🇸 Obtiene las cobranzas asignadas a un cobrador en una fecha (paginadas por cursor)
+    🇺🇸 Gets collections assigned to a collector on a date (cursor paginated)
     """
-    cobranzas = db.query(Cobranza).filter(
+    query = db.query(Cobranza).filter(
         Cobranza.cobrador_id == cobrador_id,
         Cobranza.fecha_programada >= fecha,
         Cobranza.fecha_programada < fecha + timedelta(days=1)
-    ).all()
+    )
+    cobranzas, siguiente = paginar(
+        query, Cobranza, cursor, limit, orden,
+        columnas_orden={"fecha_programada": Cobranza.fecha_programada}
+    )
+    publicar_cursor(response, siguiente)
     return cobranzas
 
 @router.get("/resumen", response_model=CobranzaResumen)
-async def obtener_resumen(
+def obtener_resumen(
     fecha_inicio: date,
     fecha_fin: date,
     db: Session = Depends(get_db),
@@ -103,88 +206,122 @@ async def obtener_resumen(
     🇪🇸 Obtiene un resumen de las cobranzas en un período
     🇺🇸 Gets a collection summary for a period
     """
-    # Conteos por estado
-    estados = db.query(
-        Cobranza.estado,
-        func.count(Cobranza.id)
-    ).filter(
-        Cobranza.fecha_programada >= fecha_inicio,
-        Cobranza.fecha_programada <= fecha_fin
-    ).group_by(Cobranza.estado).all()
-    
-    estados_dict = dict(estados)
-    
-    # Montos totales
-    montos = db.query(
-        func.sum(Cobranza.monto_esperado).label("esperado"),
-        func.sum(Cobranza.monto_recibido).label("recibido")
-    ).filter(
-        Cobranza.fecha_programada >= fecha_inicio,
-        Cobranza.fecha_programada <= fecha_fin
-    ).first()
-    
-    # Conteos por zona
-    zonas = db.query(
-        Cobranza.zona,
-        func.count(Cobranza.id)
+    # 🇪🇸 Una sola consulta sobre el resumen diario materializado
+    # 🇺🇸 A single query over the materialized daily summary
+    grupos = db.query(
+        ResumenCobranzaDiario.zona,
+        Usuario.nombre,
+        ResumenCobranzaDiario.estado,
+        func.sum(ResumenCobranzaDiario.cantidad),
+        func.sum(ResumenCobranzaDiario.monto_esperado),
+        func.sum(ResumenCobranzaDiario.monto_recibido)
+    ).join(
+        Usuario, Usuario.id == ResumenCobranzaDiario.cobrador_id
     ).filter(
-        Cobranza.fecha_programada >= fecha_inicio,
-        Cobranza.fecha_programada <= fecha_fin
-    ).group_by(Cobranza.zona).all()
-    
-    # Conteos por cobrador
-    cobradores = db.query(
+        ResumenCobranzaDiario.fecha >= fecha_inicio,
+        ResumenCobranzaDiario.fecha <= fecha_fin
+    ).group_by(
+        ResumenCobranzaDiario.zona,
         Usuario.nombre,
-        func.count(Cobranza.id)
-    ).join(Cobranza).filter(
-        Cobranza.fecha_programada >= fecha_inicio,
-        Cobranza.fecha_programada <= fecha_fin
-    ).group_by(Usuario.nombre).all()
+        ResumenCobranzaDiario.estado
+    ).all()
+    
+    estados_dict = {estado: 0 for estado in EstadoCobranza}
+    por_zona = {}
+    por_cobrador = {}
+    monto_esperado = monto_recibido = 0.0
+    for zona, nombre, estado, cantidad, esperado, recibido in grupos:
+        monto_esperado += esperado or 0
+        monto_recibido += recibido or 0
+        if not cantidad:
+            continue
+        estados_dict[estado] += cantidad
+        por_zona[zona] = por_zona.get(zona, 0) + cantidad
+        por_cobrador[nombre] = por_cobrador.get(nombre, 0) + cantidad
     
     return CobranzaResumen(
-        total_pendientes=estados_dict.get(EstadoCobranza.PENDIENTE, 0),
-        total_completadas=estados_dict.get(EstadoCobranza.COMPLETADA, 0),
-        total_fallidas=estados_dict.get(EstadoCobranza.FALLIDA, 0),
-        monto_total_esperado=montos.esperado or 0,
-        monto_total_recibido=montos.recibido or 0,
-        por_zona={zona: count for zona, count in zonas},
-        por_cobrador={nombre: count for nombre, count in cobradores},
-        por_estado={estado.value: estados_dict.get(estado, 0) for estado in EstadoCobranza}
+        total_pendientes=estados_dict[EstadoCobranza.PENDIENTE],
+        total_completadas=estados_dict[EstadoCobranza.COMPLETADA],
+        total_fallidas=estados_dict[EstadoCobranza.FALLIDA],
+        monto_total_esperado=monto_esperado,
+        monto_total_recibido=monto_recibido,
+        por_zona=por_zona,
+        por_cobrador=por_cobrador,
+        por_estado={estado.value: cantidad for estado, cantidad in estados_dict.items()}
     )
 
-@router.post("/asignar", response_model=List[CobranzaSchema])
-async def asignar_cobranzas(
+@router.post("/asignar", response_model=ResultadoAsignacion)
+def asignar_cobranzas(
     asignacion: AsignacionCobranza,
     db: Session = Depends(get_db),
     current_user: Usuario = Depends(get_current_active_user)
 ):
     """
-    🇪🇸 Asigna múltiples cobranzas a un cobrador
-    🇺🇸 Assigns multiple collections to a collector
+    🇪🇸 Asigna a un cobrador las cobranzas indicadas por ids, zona, ruta y/o
+    rango de fechas, con un solo UPDATE
+    🇺🇸 Assigns to a collector the collections selected by ids, zone, route
+    and/or date range, with a single UPDATE
     """
-    # Verificar que el cobrador existe
-    cobrador = db.query(Usuario).filter(Usuario.id == asignacion.cobrador_id).first()
-    if not cobrador:
+    condiciones = condiciones_asignacion(
+        asignacion.cobranza_ids,
+        asignacion.zona,
+        asignacion.ruta_id,
+        asignacion.fecha_desde,
+        asignacion.fecha_hasta
+    )
+    if not condiciones:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Debe indicar cobranza_ids, zona, ruta_id o un rango de fechas"
+        )
+
+    # Verificar que el cobrador existe y está activo
+    activo = db.query(Usuario.is_active).filter(Usuario.id == asignacion.cobrador_id).scalar()
+    if activo is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Cobrador no encontrado"
         )
-    
-    # Actualizar las cobranzas
-    cobranzas = db.query(Cobranza).filter(
-        Cobranza.id.in_(asignacion.cobranza_ids)
-    ).all()
-    
-    for cobranza in cobranzas:
-        cobranza.cobrador_id = asignacion.cobrador_id
-        if asignacion.fecha_programada:
-            cobranza.fecha_programada = asignacion.fecha_programada
-    
-    db.commit()
-    return cobranzas
+    if not activo:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cobrador inactivo"
+        )
+
+    try:
+        actualizadas = reasignar(
+            db, asignacion.cobrador_id, condiciones, asignacion.fecha_programada
+        )
+        db.commit()
+    except IntegrityError:
+        # 🇪🇸 La nueva fecha juntaría dos cobranzas de la misma cuota
+        # 🇺🇸 The new date would put two collections of the same installment together
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Alguna cuota ya tiene una cobranza en la nueva fecha"
+        )
+    except Exception:
+        db.rollback()
+        raise
+    return {"cobrador_id": asignacion.cobrador_id, "actualizadas": actualizadas}
+
+@router.post("/generar", response_model=GeneracionCobranzas)
+def generar_cobranzas_del_dia(
+    fecha: Optional[date] = None,
+    db: Session = Depends(get_db),
+    current_user: Usuario = Depends(get_current_active_user)
+):
+    """
+    🇪🇸 Genera las cobranzas de `fecha` (por defecto, mañana) desde las cuotas que
+    vencen ese día. Repetirla no duplica cobranzas.
+    🇺🇸 Generates the collections for `fecha` (tomorrow by default) from the
+    installments falling due that day. Repeating it does not duplicate collections.
+    """
+    return generar_cobranzas(db, fecha)
 
 @router.get("/ruta/{fecha}", response_model=List[RutaCobranza])
-async def obtener_rutas_cobranza(
+def obtener_rutas_cobranza(
     fecha: date,
     db: Session = Depends(get_db),
     current_user: Usuario = Depends(get_current_active_user)
@@ -193,31 +330,30 @@ async def obtener_rutas_cobranza(
     🇪🇸 Obtiene las rutas de cobranza para una fecha
     🇺🇸 Gets collection routes for a date
     """
-    rutas = db.query(Cobranza).filter(
-        Cobranza.fecha_programada >= fecha,
-        Cobranza.fecha_programada < fecha + timedelta(days=1)
-    ).order_by(
-        Cobranza.zona,
-        Cobranza.cobrador_id,
-        Cobranza.orden_ruta
-    ).all()
-    
-    # Agrupar por zona y cobrador
-    rutas_agrupadas = {}
-    for cobranza in rutas:
-        key = (cobranza.zona, cobranza.cobrador_id)
-        if key not in rutas_agrupadas:
-            rutas_agrupadas[key] = []
-        rutas_agrupadas[key].append(cobranza)
-    
-    # Convertir a lista de RutaCobranza
-    return [
-        RutaCobranza(
-            id=i,
-            fecha=fecha,
-            cobrador_id=cobrador_id,
-            zona=zona,
-            cobranzas=cobranzas
+    return Response(
+        content=json.dumps(rutas_del_dia(db, fecha), separators=(",", ":"), default=json_por_defecto),
+        media_type="application/json"
+    )
+
+@router.post("/ruta/{fecha}/optimizar", response_model=OptimizacionRutas)
+def optimizar_rutas_cobranza(
+    fecha: date,
+    cobrador_id: Optional[int] = None,
+    latitud_origen: Optional[float] = Query(None, ge=-90, le=90),
+    longitud_origen: Optional[float] = Query(None, ge=-180, le=180),
+    db: Session = Depends(get_db),
+    current_user: Usuario = Depends(get_current_active_user)
+):
+    """
+    🇪🇸 Recalcula el orden de visita (`orden_ruta`) de las cobranzas del día,
+    opcionalmente de un solo cobrador y partiendo de un punto de origen
+    🇺🇸 Recomputes the visiting order (`orden_ruta`) of the day's collections,
+    optionally for a single collector and starting from an origin point
+    """
+    if (latitud_origen is None) != (longitud_origen is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El origen requiere latitud y longitud"
         )
-        for i, ((zona, cobrador_id), cobranzas) in enumerate(rutas_agrupadas.items(), 1)
-    ] 
\ No newline at end of file
+    origen = (latitud_origen, longitud_origen) if latitud_origen is not None else None
+    return optimizar_rutas_del_dia(db, fecha, cobrador_id, origen)
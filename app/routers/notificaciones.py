@@ -2,11 +2,11 @@
 🇪🇸 Router para la gestión de notificaciones
 🇺🇸 Router for notification management
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from ..database import get_db
-from ..models.notificacion import Notificacion
+from ..models.notificacion import Notificacion, EstadoNotificacion
 from ..schemas.notificacion import (
     NotificacionCreate,
     NotificacionUpdate,
@@ -19,7 +19,7 @@ from ..utils.auth import get_current_active_user
 router = APIRouter()
 
 @router.post("/", response_model=NotificacionSchema)
-async def crear_notificacion(
+def crear_notificacion(
     notificacion: NotificacionCreate,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_active_user)
@@ -29,7 +29,7 @@ async def crear_notificacion(
     🇺🇸 Creates a new notification
     """
     service = NotificationService(db)
-    return await service.crear_notificacion(notificacion)
+    return service.crear_notificacion(notificacion)
 
 @router.post("/{notificacion_id}/enviar")
 async def enviar_notificacion(
@@ -51,7 +51,7 @@ async def enviar_notificacion(
     return {"message": "Notificación enviada exitosamente"}
 
 @router.post("/{notificacion_id}/leer", response_model=NotificacionSchema)
-async def marcar_como_leida(
+def marcar_como_leida(
     notificacion_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_active_user)
@@ -61,7 +61,7 @@ async def marcar_como_leida(
     🇺🇸 Marks a notification as read
     """
     service = NotificationService(db)
-    notificacion = await service.marcar_como_leida(notificacion_id)
+    notificacion = service.marcar_como_leida(notificacion_id)
     if not notificacion:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -70,7 +70,7 @@ async def marcar_como_leida(
     return notificacion
 
 @router.get("/resumen", response_model=NotificacionResumen)
-async def obtener_resumen(
+def obtener_resumen(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_active_user)
 ):
@@ -95,4 +95,17 @@ async def reenviar_fallidas(
     return {
         "message": f"Se reenviaron exitosamente {exitos} notificaciones",
         "notificaciones_reenviadas": exitos
-    } 
\ No newline at end of file
+    }
+
+@router.post("/despachar")
+async def despachar_notificaciones(
+    estados: Optional[List[EstadoNotificacion]] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_active_user)
+):
+    """
+    🇪🇸 Despacha las notificaciones pendientes y fallidas por lotes concurrentes
+    🇺🇸 Dispatches pending and failed notifications in concurrent chunks
+    """
+    service = NotificationService(db)
+    return await service.despachar(estados)
@@ -2,20 +2,66 @@
 🇪🇸 Router para la gestión de pagos
 🇺🇸 Router for payment management
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime
+from typing import Iterator, List, Optional
+from datetime import datetime, timedelta
 from ..database import get_db
+from ..models.cobranza import Cobranza
 from ..models.pago import Pago, EstadoPago
-from ..models.prestamo import Prestamo, EstadoPrestamo
+from ..models.prestamo import Prestamo
 from ..schemas.pago import PagoCreate, PagoUpdate, Pago as PagoSchema
 from ..utils.auth import get_current_active_user
+from ..utils.paginacion import paginar, publicar_cursor, LIMITE_POR_DEFECTO, LIMITE_MAXIMO
+from ..utils.saldos import actualizar_saldo, estado_cuota
+from ..utils.morosidad import sincronizar_atraso
 
 router = APIRouter()
 
+# 🇪🇸 Columnas del schema de pago, leídas sin construir objetos ORM
+# 🇺🇸 Payment schema columns, read without building ORM objects
+COLUMNAS_PAGO = (
+    Pago.id,
+    Pago.prestamo_id,
+    Pago.numero_cuota,
+    Pago.monto,
+    Pago.fecha_programada,
+    Pago.fecha_pago,
+    Pago.estado,
+)
+
+ORDEN_ATRASADOS = {"fecha_programada": Pago.fecha_programada}
+
+def filtrar_atrasados(
+    query,
+    zona: Optional[str] = None,
+    cobrador_id: Optional[int] = None,
+    dias_atraso_min: Optional[int] = None
+):
+    """
+    🇪🇸 Filtra las cuotas atrasadas por zona y cobrador (según sus cobranzas)
+    y por días mínimos de atraso
+    🇺🇸 Filters overdue installments by zone and collector (through their
+    collections) and by minimum days overdue
+    """
+    query = query.filter(Pago.estado == EstadoPago.ATRASADO)
+    if dias_atraso_min:
+        query = query.filter(Pago.fecha_programada <= datetime.utcnow() - timedelta(days=dias_atraso_min))
+    if zona is not None or cobrador_id is not None:
+        condiciones = [Cobranza.pago_id == Pago.id]
+        if zona is not None:
+            condiciones.append(Cobranza.zona == zona)
+        if cobrador_id is not None:
+            condiciones.append(Cobranza.cobrador_id == cobrador_id)
+        query = query.filter(exists().where(*condiciones))
+    return query
+
 @router.post("/", response_model=PagoSchema)
-async def create_pago(
+def create_pago(
     pago: PagoCreate,
     db: Session = Depends(get_db),
     current_user: Prestamo = Depends(get_current_active_user)
@@ -25,46 +71,53 @@ async def create_pago(
     🇺🇸 Register a new payment
     """
     # Verificar que el préstamo existe
-    prestamo = db.query(Prestamo).filter(Prestamo.id == pago.prestamo_id).first()
-    if not prestamo:
+    prestamo_existe = db.query(Prestamo.id).filter(Prestamo.id == pago.prestamo_id).first()
+    if not prestamo_existe:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Préstamo no encontrado"
         )
     
-    # Crear el pago
-    db_pago = Pago(**pago.dict())
-    db.add(db_pago)
-    db.commit()
-    db.refresh(db_pago)
-    
-    # Actualizar estado del préstamo si es necesario
-    pagos_pendientes = db.query(Pago).filter(
-        Pago.prestamo_id == prestamo.id,
-        Pago.estado == EstadoPago.PENDIENTE
-    ).count()
-    
-    if pagos_pendientes == 0:
-        prestamo.estado = EstadoPrestamo.COMPLETADO
+    # 🇪🇸 Crear el pago y actualizar los contadores del préstamo en la misma transacción
+    # 🇺🇸 Create the payment and update the loan counters in the same transaction
+    db_pago = Pago(**pago.dict(), estado=EstadoPago.PENDIENTE)
+    try:
+        db.add(db_pago)
+        actualizar_saldo(db, pago.prestamo_id, despues=estado_cuota(db_pago))
         db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    db.refresh(db_pago)
     
     return db_pago
 
 @router.get("/prestamo/{prestamo_id}", response_model=List[PagoSchema])
-async def get_pagos_by_prestamo(
+def get_pagos_by_prestamo(
     prestamo_id: int,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO),
+    orden: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: Prestamo = Depends(get_current_active_user)
 ):
     """
-    🇪🇸 Obtener pagos de un préstamo
-    🇺🇸 Get payments of a loan
+    🇪🇸 Obtener pagos de un préstamo (paginados por cursor)
+    🇺🇸 Get payments of a loan (cursor paginated)
     """
-    pagos = db.query(Pago).filter(Pago.prestamo_id == prestamo_id).all()
+    pagos, siguiente = paginar(
+        db.query(Pago).filter(Pago.prestamo_id == prestamo_id), Pago, cursor, limit, orden,
+        columnas_orden={
+            "numero_cuota": Pago.numero_cuota,
+            "fecha_programada": Pago.fecha_programada,
+        }
+    )
+    publicar_cursor(response, siguiente)
     return pagos
 
 @router.put("/{pago_id}", response_model=PagoSchema)
-async def update_pago(
+def update_pago(
     pago_id: int,
     pago: PagoUpdate,
     db: Session = Depends(get_db),
@@ -74,7 +127,7 @@ async def update_pago(
     🇪🇸 Actualizar un pago
     🇺🇸 Update a payment
     """
-    db_pago = db.query(Pago).filter(Pago.id == pago_id).first()
+    db_pago = db.query(Pago).filter(Pago.id == pago_id).with_for_update().first()
     if db_pago is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -85,36 +138,82 @@ async def update_pago(
     if pago.estado == EstadoPago.PAGADO and db_pago.estado != EstadoPago.PAGADO:
         db_pago.fecha_pago = datetime.utcnow()
     
+    antes = estado_cuota(db_pago)
     for field, value in pago.dict(exclude_unset=True).items():
         setattr(db_pago, field, value)
     
-    db.commit()
-    db.refresh(db_pago)
-    
-    # Actualizar estado del préstamo si es necesario
-    prestamo = db.query(Prestamo).filter(Prestamo.id == db_pago.prestamo_id).first()
-    pagos_pendientes = db.query(Pago).filter(
-        Pago.prestamo_id == prestamo.id,
-        Pago.estado == EstadoPago.PENDIENTE
-    ).count()
-    
-    if pagos_pendientes == 0:
-        prestamo.estado = EstadoPrestamo.COMPLETADO
+    # 🇪🇸 Actualizar los contadores del préstamo en la misma transacción
+    # 🇺🇸 Update the loan counters in the same transaction
+    try:
+        actualizar_saldo(db, db_pago.prestamo_id, antes, estado_cuota(db_pago))
+        if EstadoPago.ATRASADO in (antes[0], db_pago.estado):
+            sincronizar_atraso(db, db_pago.prestamo_id)
         db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    db.refresh(db_pago)
     
     return db_pago
 
 @router.get("/atrasados", response_model=List[PagoSchema])
-async def get_pagos_atrasados(
+def get_pagos_atrasados(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO),
+    orden: Optional[str] = None,
+    zona: Optional[str] = None,
+    cobrador_id: Optional[int] = None,
+    dias_atraso_min: Optional[int] = Query(None, ge=0),
     db: Session = Depends(get_db),
     current_user: Prestamo = Depends(get_current_active_user)
 ):
     """
-    🇪🇸 Obtener lista de pagos atrasados
-    🇺🇸 Get list of overdue payments
+    🇪🇸 Obtener lista de pagos atrasados (paginada por cursor, por defecto desde el
+    vencimiento más antiguo). Lee las cuotas ya marcadas por el barrido de morosidad.
+    🇺🇸 Get list of overdue payments (cursor paginated, oldest due date first by
+    default). Reads the installments already marked by the overdue sweep.
     """
-    pagos_atrasados = db.query(Pago).filter(
-        Pago.fecha_programada < datetime.utcnow(),
-        Pago.estado == EstadoPago.PENDIENTE
-    ).all()
-    return pagos_atrasados 
\ No newline at end of file
+    query = filtrar_atrasados(db.query(*COLUMNAS_PAGO), zona, cobrador_id, dias_atraso_min)
+    pagos_atrasados, siguiente = paginar(
+        query, Pago, cursor, limit, orden or "fecha_programada",
+        columnas_orden=ORDEN_ATRASADOS
+    )
+    publicar_cursor(response, siguiente)
+    return pagos_atrasados
+
+@router.get("/atrasados/stream")
+def stream_pagos_atrasados(
+    cursor: Optional[str] = None,
+    orden: Optional[str] = None,
+    zona: Optional[str] = None,
+    cobrador_id: Optional[int] = None,
+    dias_atraso_min: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db),
+    current_user: Prestamo = Depends(get_current_active_user)
+):
+    """
+    🇪🇸 Transmite todos los pagos atrasados como NDJSON (un pago por línea), leyendo
+    por páginas de LIMITE_MAXIMO para que la memoria no crezca con el resultado
+    🇺🇸 Streams every overdue payment as NDJSON (one payment per line), reading in
+    pages of LIMITE_MAXIMO so memory does not grow with the result size
+    """
+    query = filtrar_atrasados(db.query(*COLUMNAS_PAGO), zona, cobrador_id, dias_atraso_min)
+    orden = orden or "fecha_programada"
+
+    # 🇪🇸 Validar orden y cursor antes de empezar a responder
+    # 🇺🇸 Validate sort and cursor before starting the response
+    primera, siguiente = paginar(query, Pago, cursor, LIMITE_MAXIMO, orden, columnas_orden=ORDEN_ATRASADOS)
+
+    def lineas() -> Iterator[str]:
+        pagina, siguiente_cursor = primera, siguiente
+        while True:
+            for fila in pagina:
+                yield json.dumps(jsonable_encoder(dict(fila._mapping))) + "\n"
+            if not siguiente_cursor:
+                return
+            pagina, siguiente_cursor = paginar(
+                query, Pago, siguiente_cursor, LIMITE_MAXIMO, orden, columnas_orden=ORDEN_ATRASADOS
+            )
+
+    return StreamingResponse(lineas(), media_type="application/x-ndjson") 
\ No newline at end of file
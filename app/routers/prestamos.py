@@ -2,44 +2,105 @@
 🇪🇸 Router para la gestión de préstamos
 🇺🇸 Router for loan management
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime, timedelta
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import List, Optional
+from datetime import datetime
+from ..config import settings
 from ..database import get_db
 from ..models.prestamo import Prestamo, EstadoPrestamo
-from ..models.pago import Pago, EstadoPago
-from ..schemas.prestamo import PrestamoCreate, PrestamoUpdate, Prestamo as PrestamoSchema, PrestamoDetalle
+from ..models.pago import Pago
+from ..schemas.prestamo import (
+    MAXIMO_PRESTAMOS_LOTE, PrestamoCreate, PrestamoUpdate, Prestamo as PrestamoSchema, PrestamoDetalle
+)
 from ..utils.auth import get_current_active_user
+from ..utils.cronograma import calcular_cronogramas
+from ..utils.paginacion import paginar, publicar_cursor, LIMITE_POR_DEFECTO, LIMITE_MAXIMO
 
 router = APIRouter()
 
-def calcular_fechas_pagos(
-    fecha_inicio: datetime,
-    plazo: int,
-    frecuencia_pago: str
-) -> List[datetime]:
-    """Calcula las fechas de pago basadas en la frecuencia"""
-    fechas = []
-    fecha_actual = fecha_inicio
-    
-    for _ in range(plazo):
-        if frecuencia_pago == "diario":
-            fecha_actual += timedelta(days=1)
-        elif frecuencia_pago == "semanal":
-            fecha_actual += timedelta(weeks=1)
-        elif frecuencia_pago == "quincenal":
-            fecha_actual += timedelta(days=15)
-        elif frecuencia_pago == "mensual":
-            # Aproximación simple del mes
-            fecha_actual += timedelta(days=30)
-        
-        fechas.append(fecha_actual)
-    
-    return fechas
+# 🇪🇸 Carga de PrestamoDetalle: cliente en el mismo SELECT (muchos a uno) y las
+# cuotas de todos los préstamos en un segundo SELECT ... IN, sin cargas perezosas
+# 🇺🇸 PrestamoDetalle loading: client in the same SELECT (many-to-one) and the
+# installments of every loan in a second SELECT ... IN, with no lazy loads
+CARGA_DETALLE = (
+    joinedload(Prestamo.cliente),
+    selectinload(Prestamo.pagos),
+)
+
+LIMITE_DETALLES = 100
+
+def originar_prestamos(
+    db: Session,
+    prestamos: List[PrestamoCreate],
+    opciones: tuple = ()
+) -> List[Prestamo]:
+    """
+    🇪🇸 Crea préstamos y todas sus cuotas en una sola transacción.
+    Los cronogramas se calculan juntos y las cuotas se escriben con un único INSERT masivo.
+    🇺🇸 Creates loans and all their installments in a single transaction.
+    Schedules are computed together and installments are written with a single bulk INSERT.
+    """
+    fecha_inicio = datetime.utcnow()
+    cronograma = calcular_cronogramas(
+        fechas_inicio=[fecha_inicio] * len(prestamos),
+        montos=[prestamo.monto for prestamo in prestamos],
+        intereses=[prestamo.interes for prestamo in prestamos],
+        plazos=[prestamo.plazo for prestamo in prestamos],
+        frecuencias=[prestamo.frecuencia_pago for prestamo in prestamos],
+        omitir_domingos=settings.CRONOGRAMA_OMITIR_DOMINGOS,
+        feriados=settings.CRONOGRAMA_FERIADOS
+    )
+
+    db_prestamos = [
+        Prestamo(
+            **prestamo.dict(),
+            monto_total=monto_total,
+            valor_cuota=valor_cuota,
+            estado=EstadoPrestamo.ACTIVO,
+            fecha_inicio=fecha_inicio,
+            fecha_fin=fecha_fin,
+            cuotas_pagadas=0,
+            cuotas_pendientes=prestamo.plazo,
+            saldo_pendiente=saldo,
+            fecha_proxima_cuota=fecha_proxima
+        )
+        for prestamo, monto_total, valor_cuota, fecha_fin, saldo, fecha_proxima in zip(
+            prestamos,
+            cronograma.monto_total.tolist(),
+            cronograma.valor_cuota.tolist(),
+            cronograma.fechas_fin(),
+            cronograma.saldos(),
+            cronograma.fechas_primera_cuota()
+        )
+    ]
+
+    try:
+        # 🇪🇸 Un flush para obtener los IDs de los préstamos
+        # 🇺🇸 One flush to obtain the loan IDs
+        db.add_all(db_prestamos)
+        db.flush()
+
+        ids = [db_prestamo.id for db_prestamo in db_prestamos]
+        filas = cronograma.filas_pagos(ids)
+        if filas:
+            db.execute(insert(Pago), filas)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    # 🇪🇸 Recargar todos los préstamos con una sola consulta (más las de `opciones`)
+    # 🇺🇸 Reload every loan with a single query (plus those from `opciones`)
+    recargados = {
+        db_prestamo.id: db_prestamo
+        for db_prestamo in db.query(Prestamo).options(*opciones).filter(Prestamo.id.in_(ids)).all()
+    }
+    return [recargados[prestamo_id] for prestamo_id in ids]
 
 @router.post("/", response_model=PrestamoDetalle)
-async def create_prestamo(
+def create_prestamo(
     prestamo: PrestamoCreate,
     db: Session = Depends(get_db),
     current_user: Prestamo = Depends(get_current_active_user)
@@ -48,59 +109,79 @@ async def create_prestamo(
     🇪🇸 Crear un nuevo préstamo
     🇺🇸 Create a new loan
     """
-    # Calcular montos
-    monto_total = prestamo.monto * (1 + prestamo.interes/100)
-    valor_cuota = monto_total / prestamo.plazo
-    
-    # Crear el préstamo
-    db_prestamo = Prestamo(
-        **prestamo.dict(),
-        monto_total=monto_total,
-        valor_cuota=valor_cuota,
-        estado=EstadoPrestamo.ACTIVO,
-        fecha_inicio=datetime.utcnow()
-    )
-    db.add(db_prestamo)
-    db.commit()
-    db.refresh(db_prestamo)
-    
-    # Generar los pagos
-    fechas_pago = calcular_fechas_pagos(
-        db_prestamo.fecha_inicio,
-        prestamo.plazo,
-        prestamo.frecuencia_pago
-    )
-    
-    for i, fecha in enumerate(fechas_pago, 1):
-        pago = Pago(
-            prestamo_id=db_prestamo.id,
-            numero_cuota=i,
-            monto=valor_cuota,
-            fecha_programada=fecha,
-            estado=EstadoPago.PENDIENTE
-        )
-        db.add(pago)
-    
-    db.commit()
-    db.refresh(db_prestamo)
+    db_prestamo, = originar_prestamos(db, [prestamo], CARGA_DETALLE)
     return db_prestamo
 
+@router.post("/lote", response_model=List[PrestamoSchema])
+def create_prestamos_lote(
+    prestamos: List[PrestamoCreate] = Body(..., max_length=MAXIMO_PRESTAMOS_LOTE),
+    db: Session = Depends(get_db),
+    current_user: Prestamo = Depends(get_current_active_user)
+):
+    """
+    🇪🇸 Crear varios préstamos con sus cuotas en una sola operación (desembolsos
+    masivos), hasta MAXIMO_PRESTAMOS_LOTE por petición (422 si se supera)
+    🇺🇸 Create several loans with their installments in a single operation (bulk
+    disbursements), up to MAXIMO_PRESTAMOS_LOTE per request (422 when exceeded)
+    """
+    if not prestamos:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El lote de préstamos está vacío"
+        )
+    return originar_prestamos(db, prestamos)
+
 @router.get("/", response_model=List[PrestamoSchema])
-async def get_prestamos(
-    skip: int = 0,
-    limit: int = 100,
+def get_prestamos(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO),
+    orden: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: Prestamo = Depends(get_current_active_user)
+):
+    """
+    🇪🇸 Obtener lista de préstamos (paginada por cursor)
+    🇺🇸 Get list of loans (cursor paginated)
+    """
+    prestamos, siguiente = paginar(
+        db.query(Prestamo), Prestamo, cursor, limit, orden,
+        columnas_orden={
+            "fecha_inicio": Prestamo.fecha_inicio,
+            "fecha_fin": Prestamo.fecha_fin,
+            "monto": Prestamo.monto,
+        }
+    )
+    publicar_cursor(response, siguiente)
+    return prestamos
+
+@router.get("/detalle", response_model=List[PrestamoDetalle])
+def get_prestamos_detalle(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=LIMITE_DETALLES),
+    cliente_id: Optional[int] = None,
+    estado: Optional[EstadoPrestamo] = None,
     db: Session = Depends(get_db),
     current_user: Prestamo = Depends(get_current_active_user)
 ):
     """
-    🇪🇸 Obtener lista de préstamos
-    🇺🇸 Get list of loans
+    🇪🇸 Obtener préstamos con su cliente y sus cuotas (paginado por cursor), con un
+    número fijo de consultas sin importar cuántos préstamos haya en la página
+    🇺🇸 Get loans with their client and installments (cursor paginated), with a
+    fixed number of queries regardless of how many loans the page holds
     """
-    prestamos = db.query(Prestamo).offset(skip).limit(limit).all()
+    query = db.query(Prestamo).options(*CARGA_DETALLE)
+    if cliente_id is not None:
+        query = query.filter(Prestamo.cliente_id == cliente_id)
+    if estado is not None:
+        query = query.filter(Prestamo.estado == estado)
+    prestamos, siguiente = paginar(query, Prestamo, cursor, limit)
+    publicar_cursor(response, siguiente)
     return prestamos
 
 @router.get("/{prestamo_id}", response_model=PrestamoDetalle)
-async def get_prestamo(
+def get_prestamo(
     prestamo_id: int,
     db: Session = Depends(get_db),
     current_user: Prestamo = Depends(get_current_active_user)
@@ -109,7 +190,7 @@ async def get_prestamo(
     🇪🇸 Obtener un préstamo por ID
     🇺🇸 Get a loan by ID
     """
-    prestamo = db.query(Prestamo).filter(Prestamo.id == prestamo_id).first()
+    prestamo = db.query(Prestamo).options(*CARGA_DETALLE).filter(Prestamo.id == prestamo_id).first()
     if prestamo is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -118,7 +199,7 @@ async def get_prestamo(
     return prestamo
 
 @router.put("/{prestamo_id}", response_model=PrestamoSchema)
-async def update_prestamo(
+def update_prestamo(
     prestamo_id: int,
     prestamo: PrestamoUpdate,
     db: Session = Depends(get_db),
@@ -144,7 +225,7 @@ async def update_prestamo(
     return db_prestamo
 
 @router.delete("/{prestamo_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_prestamo(
+def delete_prestamo(
     prestamo_id: int,
     db: Session = Depends(get_db),
     current_user: Prestamo = Depends(get_current_active_user)
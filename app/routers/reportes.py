@@ -0,0 +1,61 @@
+"""
+🇪🇸 Router de reportes
+🇺🇸 Reports router
+"""
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from ..database import get_db
+from ..models.usuario import Usuario
+from ..schemas.reporte import ProyeccionFlujoCaja, ReporteCartera
+from ..utils.auth import get_current_active_user
+from ..utils.cartera import reporte_cartera
+from ..utils.flujo_caja import proyeccion_del_dia
+
+router = APIRouter()
+
+@router.get("/cartera", response_model=ReporteCartera)
+def get_reporte_cartera(
+    fecha_corte: Optional[date] = None,
+    zona: Optional[str] = None,
+    cobrador_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: Usuario = Depends(get_current_active_user)
+):
+    """
+    🇪🇸 Cartera vencida por tramos de atraso (al día, 1-7, 8-30, 31-60 y más de 60
+    días), por zona y cobrador, con saldo, capital e interés. `fecha_corte` no puede
+    ser anterior a hoy.
+    🇺🇸 Portfolio aging by days-past-due bucket (current, 1-7, 8-30, 31-60 and over
+    60 days), per zone and collector, with balance, principal and interest.
+    `fecha_corte` cannot be before today.
+    """
+    try:
+        return reporte_cartera(db, fecha_corte, zona, cobrador_id)
+    except ValueError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(error)
+        )
+
+@router.get("/flujo-caja", response_model=ProyeccionFlujoCaja)
+def get_flujo_caja(
+    dias: int = Query(30, ge=1, le=365),
+    zona: Optional[str] = None,
+    cobrador_id: Optional[int] = None,
+    descontar: bool = False,
+    db: Session = Depends(get_db),
+    current_user: Usuario = Depends(get_current_active_user)
+):
+    """
+    🇪🇸 Ingresos esperados de los próximos `dias` días por zona y cobrador,
+    opcionalmente descontados por la tasa histórica de pago a tiempo de cada cliente.
+    Se calcula una vez por día y se sirve desde caché.
+    🇺🇸 Expected inflows over the next `dias` days per zone and collector, optionally
+    discounted by each client's historic on-time rate. Computed once per day and
+    served from cache.
+    """
+    return proyeccion_del_dia(
+        db, dias=dias, zona=zona, cobrador_id=cobrador_id, descontar=descontar
+    )
@@ -18,7 +18,7 @@ from ..utils.auth import get_current_active_user, verificar_rol_cobrador
 router = APIRouter()
 
 @router.post("/", response_model=RutaSchema)
-async def crear_ruta(
+def crear_ruta(
     ruta: RutaCreate,
     db: Session = Depends(get_db),
     current_user: Usuario = Depends(get_current_active_user)
@@ -42,7 +42,7 @@ async def crear_ruta(
     return db_ruta
 
 @router.put("/{ruta_id}", response_model=RutaSchema)
-async def actualizar_ruta(
+def actualizar_ruta(
     ruta_id: int,
     ruta: RutaUpdate,
     db: Session = Depends(get_db),
@@ -67,7 +67,7 @@ async def actualizar_ruta(
     return db_ruta
 
 @router.get("/{ruta_id}", response_model=RutaSchema)
-async def obtener_ruta(
+def obtener_ruta(
     ruta_id: int,
     db: Session = Depends(get_db),
     current_user: Usuario = Depends(get_current_active_user)
@@ -85,7 +85,7 @@ async def obtener_ruta(
     return ruta
 
 @router.get("/cobrador/{cobrador_id}", response_model=List[RutaSchema])
-async def obtener_rutas_por_cobrador(
+def obtener_rutas_por_cobrador(
     cobrador_id: int,
     db: Session = Depends(get_db),
     current_user: Usuario = Depends(get_current_active_user)
@@ -98,7 +98,7 @@ async def obtener_rutas_por_cobrador(
     return rutas
 
 @router.delete("/{ruta_id}")
-async def eliminar_ruta(
+def eliminar_ruta(
     ruta_id: int,
     db: Session = Depends(get_db),
     current_user: Usuario = Depends(get_current_active_user)
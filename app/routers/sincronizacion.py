@@ -0,0 +1,45 @@
+"""
+🇪🇸 Router para la sincronización de la app móvil
+🇺🇸 Router for mobile app sync
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..database import get_db
+from ..models.usuario import Usuario
+from ..schemas.sincronizacion import LoteSincronizacion, ResultadoSincronizacion
+from ..utils.auth import get_current_active_user
+from ..utils.sincronizacion import aplicar_lote
+
+router = APIRouter()
+
+@router.post("/", response_model=ResultadoSincronizacion)
+def sincronizar(
+    lote: LoteSincronizacion,
+    db: Session = Depends(get_db),
+    current_user: Usuario = Depends(get_current_active_user)
+):
+    """
+    🇪🇸 Aplica en una sola transacción los resultados de cobranzas y pagos
+    registrados sin conexión. Reenviar un lote es seguro: las operaciones con una
+    clave de idempotencia ya recibida se devuelven como `duplicada`.
+    🇺🇸 Applies in a single transaction the collection results and payments
+    recorded offline. Resending a batch is safe: operations with an idempotency
+    key already received come back as `duplicada`.
+    """
+    usuario_id = current_user.id
+    try:
+        resultados = aplicar_lote(db, lote, usuario_id)
+        db.commit()
+    except IntegrityError:
+        # 🇪🇸 Otra petición registró las mismas claves al mismo tiempo
+        # 🇺🇸 Another request recorded the same keys at the same time
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="El lote se está sincronizando en otra petición; reintente"
+        )
+    except Exception:
+        db.rollback()
+        raise
+    return {"resultados": resultados}
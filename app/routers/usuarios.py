@@ -2,32 +2,42 @@
 🇪🇸 Router para la gestión de usuarios
 🇺🇸 Router for user management
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from ..database import get_db
 from ..models.usuario import Usuario
 from ..schemas.usuario import UsuarioCreate, UsuarioUpdate, Usuario as UsuarioSchema
-from ..utils.auth import get_current_active_user, get_password_hash
+from ..utils.auth import get_current_active_user, get_password_hash, invalidar_usuario
+from ..utils.paginacion import paginar, publicar_cursor, LIMITE_POR_DEFECTO, LIMITE_MAXIMO
 
 router = APIRouter()
 
 @router.get("/", response_model=List[UsuarioSchema])
-async def get_usuarios(
-    skip: int = 0,
-    limit: int = 100,
+def get_usuarios(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO),
+    orden: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: Usuario = Depends(get_current_active_user)
 ):
     """
-    🇪🇸 Obtener lista de usuarios
-    🇺🇸 Get list of users
+    🇪🇸 Obtener lista de usuarios (paginada por cursor)
+    🇺🇸 Get list of users (cursor paginated)
     """
-    usuarios = db.query(Usuario).offset(skip).limit(limit).all()
+    usuarios, siguiente = paginar(
+        db.query(Usuario), Usuario, cursor, limit, orden,
+        columnas_orden={
+            "nombre": Usuario.nombre,
+            "created_at": Usuario.created_at,
+        }
+    )
+    publicar_cursor(response, siguiente)
     return usuarios
 
 @router.post("/", response_model=UsuarioSchema)
-async def create_usuario(
+def create_usuario(
     usuario: UsuarioCreate,
     db: Session = Depends(get_db),
     current_user: Usuario = Depends(get_current_active_user)
@@ -56,7 +66,7 @@ async def create_usuario(
     return db_usuario
 
 @router.get("/{usuario_id}", response_model=UsuarioSchema)
-async def get_usuario(
+def get_usuario(
     usuario_id: int,
     db: Session = Depends(get_db),
     current_user: Usuario = Depends(get_current_active_user)
@@ -74,7 +84,7 @@ async def get_usuario(
     return usuario
 
 @router.put("/{usuario_id}", response_model=UsuarioSchema)
-async def update_usuario(
+def update_usuario(
     usuario_id: int,
     usuario: UsuarioUpdate,
     db: Session = Depends(get_db),
@@ -95,15 +105,17 @@ async def update_usuario(
     if "password" in update_data:
         update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
     
+    email_anterior = db_usuario.email
     for field, value in update_data.items():
         setattr(db_usuario, field, value)
     
     db.commit()
     db.refresh(db_usuario)
+    invalidar_usuario(email_anterior, db_usuario.email)
     return db_usuario
 
 @router.delete("/{usuario_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_usuario(
+def delete_usuario(
     usuario_id: int,
     db: Session = Depends(get_db),
     current_user: Usuario = Depends(get_current_active_user)
@@ -118,6 +130,8 @@ async def delete_usuario(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Usuario no encontrado"
         )
+    email = usuario.email
     db.delete(usuario)
     db.commit()
+    invalidar_usuario(email)
     return None 
\ No newline at end of file
@@ -13,6 +13,7 @@ class ClienteBase(BaseModel):
     telefono: str
     direccion: str
     email: EmailStr
+    ruta_id: Optional[int] = None
 
 class ClienteCreate(ClienteBase):
     pass
@@ -24,6 +25,7 @@ class ClienteUpdate(BaseModel):
     direccion: Optional[str] = None
     email: Optional[EmailStr] = None
     activo: Optional[bool] = None
+    ruta_id: Optional[int] = None
 
 class Cliente(ClienteBase):
     id: int
@@ -31,4 +33,12 @@ class Cliente(ClienteBase):
     activo: bool
 
     class Config:
-        orm_mode = True 
\ No newline at end of file
+        orm_mode = True
+
+class ClienteBusqueda(Cliente):
+    """
+    🇪🇸 Cliente encontrado por la búsqueda, con el campo que coincidió y su relevancia
+    🇺🇸 Client found by search, with the matching field and its relevance
+    """
+    coincidencia: str
+    relevancia: int 
\ No newline at end of file
@@ -3,7 +3,7 @@
 🇺🇸 Collection Schemas
 """
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, List
 from ..models.cobranza import EstadoCobranza, MetodoPago
 
@@ -20,6 +20,8 @@ class CobranzaBase(BaseModel):
     fecha_programada: datetime
     ruta_id: Optional[int] = None
     orden_ruta: Optional[int] = None
+    latitud: Optional[float] = Field(None, ge=-90, le=90)
+    longitud: Optional[float] = Field(None, ge=-180, le=180)
 
 class CobranzaCreate(CobranzaBase):
     """
@@ -41,6 +43,8 @@ class CobranzaUpdate(BaseModel):
     requiere_supervisor: Optional[bool] = None
     ruta_id: Optional[int] = None
     orden_ruta: Optional[int] = None
+    latitud: Optional[float] = Field(None, ge=-90, le=90)
+    longitud: Optional[float] = Field(None, ge=-180, le=180)
 
 class Cobranza(CobranzaBase):
     """
@@ -89,11 +93,43 @@ class RutaCobranza(BaseModel):
     class Config:
         from_attributes = True
 
+class OptimizacionRutas(BaseModel):
+    """
+    🇪🇸 Resultado de la optimización de rutas del día
+    🇺🇸 Result of the day's route optimization
+    """
+    cobradores: int
+    rutas: int
+    paradas: int
+    segundos: float
+
+class GeneracionCobranzas(BaseModel):
+    """
+    🇪🇸 Resultado de la generación de cobranzas de un día
+    🇺🇸 Result of generating one day's collections
+    """
+    cobranzas_creadas: int
+    sin_ruta: int
+
 class AsignacionCobranza(BaseModel):
     """
-    🇪🇸 Schema para asignar cobranzas a cobradores
-    🇺🇸 Schema for assigning collections to collectors
+    🇪🇸 Schema para asignar cobranzas a cobradores. Los filtros se combinan
+    (AND) y se requiere al menos uno.
+    🇺🇸 Schema for assigning collections to collectors. Filters are combined
+    (AND) and at least one is required.
+    """
+    cobrador_id: int
+    cobranza_ids: Optional[List[int]] = None
+    zona: Optional[str] = None
+    ruta_id: Optional[int] = None
+    fecha_desde: Optional[date] = None
+    fecha_hasta: Optional[date] = None
+    fecha_programada: Optional[datetime] = None
+
+class ResultadoAsignacion(BaseModel):
+    """
+    🇪🇸 Resultado de una asignación masiva
+    🇺🇸 Result of a bulk assignment
     """
     cobrador_id: int
-    cobranza_ids: List[int]
-    fecha_programada: Optional[datetime] = None 
\ No newline at end of file
+    actualizadas: int
@@ -2,18 +2,22 @@
 🇪🇸 Schemas de Préstamo
 🇺🇸 Loan Schemas
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import List, Optional
 from ..models.prestamo import FrecuenciaPago, EstadoPrestamo
 from .cliente import Cliente
 from .pago import Pago
 
+# 🇪🇸 Préstamos admitidos por lote de desembolsos (POST /prestamos/lote)
+# 🇺🇸 Loans accepted per disbursement batch (POST /prestamos/lote)
+MAXIMO_PRESTAMOS_LOTE = 500
+
 class PrestamoBase(BaseModel):
     cliente_id: int
     monto: float
     interes: float
-    plazo: int
+    plazo: int = Field(..., gt=0)
     frecuencia_pago: FrecuenciaPago
 
 class PrestamoCreate(PrestamoBase):
@@ -23,7 +27,7 @@ class PrestamoUpdate(BaseModel):
     estado: Optional[EstadoPrestamo] = None
     monto: Optional[float] = None
     interes: Optional[float] = None
-    plazo: Optional[int] = None
+    plazo: Optional[int] = Field(None, gt=0)
     frecuencia_pago: Optional[FrecuenciaPago] = None
 
 class Prestamo(PrestamoBase):
@@ -33,6 +37,10 @@ class Prestamo(PrestamoBase):
     estado: EstadoPrestamo
     monto_total: float
     valor_cuota: float
+    cuotas_pagadas: int = 0
+    cuotas_pendientes: int = 0
+    saldo_pendiente: float = 0.0
+    fecha_proxima_cuota: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -0,0 +1,73 @@
+"""
+🇪🇸 Schemas de reportes
+🇺🇸 Report schemas
+"""
+from pydantic import BaseModel
+from datetime import date
+from typing import List, Optional
+
+class TotalCartera(BaseModel):
+    """
+    🇪🇸 Préstamos y saldo de un tramo de atraso
+    🇺🇸 Loans and balance of an aging bucket
+    """
+    tramo: str
+    prestamos: int
+    saldo: float
+    capital: float
+    interes: float
+
+class FilaCartera(TotalCartera):
+    """
+    🇪🇸 Tramo de atraso de una zona y un cobrador (nulos si el cliente no tiene ruta)
+    🇺🇸 Aging bucket of a zone and a collector (null when the client has no route)
+    """
+    zona: Optional[str] = None
+    cobrador_id: Optional[int] = None
+
+class ReporteCartera(BaseModel):
+    """
+    🇪🇸 Cartera vencida por zona, cobrador y tramo, con totales por tramo
+    🇺🇸 Portfolio aging by zone, collector and bucket, with totals per bucket
+    """
+    fecha_corte: date
+    filas: List[FilaCartera]
+    totales: List[TotalCartera]
+
+class FilaFlujoCaja(BaseModel):
+    """
+    🇪🇸 Ingreso esperado de un día, zona y cobrador
+    🇺🇸 Expected inflow of a day, zone and collector
+    """
+    fecha: date
+    zona: Optional[str] = None
+    cobrador_id: Optional[int] = None
+    cuotas: int
+    esperado: float
+    ajustado: float
+
+class DiaFlujoCaja(BaseModel):
+    """
+    🇪🇸 Ingreso esperado de un día y acumulado desde el inicio de la proyección
+    🇺🇸 Expected inflow of a day and running total since the projection start
+    """
+    fecha: date
+    esperado: float
+    ajustado: float
+    acumulado: float
+    acumulado_ajustado: float
+
+class ProyeccionFlujoCaja(BaseModel):
+    """
+    🇪🇸 Proyección de ingresos por cuotas programadas; `ajustado` pondera cada cuota
+    por la tasa de pago a tiempo del cliente cuando se pide descontar
+    🇺🇸 Inflow projection from scheduled installments; `ajustado` weights each
+    installment by the client's on-time rate when discounting is requested
+    """
+    desde: date
+    dias: int
+    tasa_general: Optional[float] = None
+    total_esperado: float
+    total_ajustado: float
+    filas: List[FilaFlujoCaja]
+    diario: List[DiaFlujoCaja]
@@ -0,0 +1,56 @@
+"""
+🇪🇸 Schemas de la sincronización de la app móvil
+🇺🇸 Mobile app sync schemas
+"""
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from .cobranza import CobranzaUpdate
+from .pago import PagoUpdate
+
+# 🇪🇸 Operaciones admitidas por lote
+# 🇺🇸 Operations accepted per batch
+MAXIMO_OPERACIONES = 500
+
+class OperacionCobranza(BaseModel):
+    """
+    🇪🇸 Resultado de una cobranza registrado sin conexión
+    🇺🇸 Collection result recorded offline
+    """
+    clave_idempotencia: str = Field(..., min_length=1, max_length=64)
+    cobranza_id: int
+    cambios: CobranzaUpdate
+
+class OperacionPago(BaseModel):
+    """
+    🇪🇸 Cambio de una cuota registrado sin conexión
+    🇺🇸 Installment change recorded offline
+    """
+    clave_idempotencia: str = Field(..., min_length=1, max_length=64)
+    pago_id: int
+    cambios: PagoUpdate
+
+class LoteSincronizacion(BaseModel):
+    """
+    🇪🇸 Lote de operaciones pendientes de la app móvil
+    🇺🇸 Batch of pending operations from the mobile app
+    """
+    cobranzas: List[OperacionCobranza] = Field(default_factory=list, max_length=MAXIMO_OPERACIONES)
+    pagos: List[OperacionPago] = Field(default_factory=list, max_length=MAXIMO_OPERACIONES)
+
+class ResultadoOperacion(BaseModel):
+    """
+    🇪🇸 Resultado de una operación: aplicada, duplicada o no_encontrada
+    🇺🇸 Outcome of an operation: aplicada, duplicada or no_encontrada
+    """
+    clave_idempotencia: str
+    tipo: str
+    id: int
+    resultado: str
+    detalle: Optional[str] = None
+
+class ResultadoSincronizacion(BaseModel):
+    """
+    🇪🇸 Resultados en el mismo orden del lote (primero cobranzas, luego pagos)
+    🇺🇸 Outcomes in batch order (collections first, then payments)
+    """
+    resultados: List[ResultadoOperacion]
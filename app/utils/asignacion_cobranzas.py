@@ -0,0 +1,66 @@
+"""
+🇪🇸 Reasignación masiva de cobranzas con UPDATE por conjuntos
+🇺🇸 Bulk collection reassignment with set-based UPDATEs
+"""
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+from sqlalchemy.orm import Session
+from ..models.cobranza import Cobranza, a_utc
+from .resumen_cobranzas import acumular_grupos, agrupar, dia
+
+def condiciones_asignacion(
+    cobranza_ids: Optional[List[int]] = None,
+    zona: Optional[str] = None,
+    ruta_id: Optional[int] = None,
+    fecha_desde: Optional[date] = None,
+    fecha_hasta: Optional[date] = None
+) -> list:
+    """
+    🇪🇸 Condiciones SQL que seleccionan las cobranzas a reasignar (se combinan con AND)
+    🇺🇸 SQL conditions selecting the collections to reassign (combined with AND)
+    """
+    condiciones = []
+    if cobranza_ids is not None:
+        condiciones.append(Cobranza.id.in_(cobranza_ids))
+    if zona is not None:
+        condiciones.append(Cobranza.zona == zona)
+    if ruta_id is not None:
+        condiciones.append(Cobranza.ruta_id == ruta_id)
+    if fecha_desde is not None:
+        condiciones.append(Cobranza.fecha_programada >= fecha_desde)
+    if fecha_hasta is not None:
+        condiciones.append(Cobranza.fecha_programada < fecha_hasta + timedelta(days=1))
+    return condiciones
+
+def reasignar(
+    db: Session,
+    cobrador_id: int,
+    condiciones: list,
+    fecha_programada: Optional[datetime] = None
+) -> int:
+    """
+    🇪🇸 Asigna a `cobrador_id` (y opcionalmente a `fecha_programada`) todas las
+    cobranzas que cumplen `condiciones` con un solo UPDATE, y mueve sus aportes
+    en el resumen diario sin cargar objetos ORM. No valida el cobrador ni
+    confirma la transacción. Devuelve el número de cobranzas actualizadas.
+    🇺🇸 Assigns every collection matching `condiciones` to `cobrador_id` (and
+    optionally to `fecha_programada`) with a single UPDATE, and moves their
+    contributions in the daily summary without loading ORM objects. Does not
+    validate the collector nor commit. Returns the number of updated collections.
+    """
+    # 🇪🇸 Los aportes nuevos son los mismos grupos con el cobrador (y el día) cambiados
+    # 🇺🇸 The new contributions are the same groups with the collector (and day) changed
+    antes = agrupar(db, *condiciones)
+    fecha_programada = a_utc(fecha_programada)
+    nuevo_dia = dia(fecha_programada) if fecha_programada is not None else None
+    despues = [(nuevo_dia or g[0], g[1], cobrador_id, *g[3:]) for g in antes]
+
+    valores = {Cobranza.cobrador_id: cobrador_id}
+    if fecha_programada is not None:
+        valores[Cobranza.fecha_programada] = fecha_programada
+    actualizadas = db.query(Cobranza).filter(*condiciones).update(
+        valores, synchronize_session=False
+    )
+
+    acumular_grupos(db, antes=antes, despues=despues)
+    return actualizadas
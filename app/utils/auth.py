@@ -2,8 +2,11 @@
 🇪🇸 Utilidades de autenticación y autorización
 🇺🇸 Authentication and authorization utilities
 """
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
@@ -12,28 +15,84 @@ from sqlalchemy.orm import Session
 from ..config import settings
 from ..database import get_db
 from ..models.usuario import Usuario
+from .cache import CacheTTL
 
-# 🇪🇸 Configuración de bcrypt
-# 🇺🇸 Bcrypt configuration
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 🇪🇸 Configuración de bcrypt: los hashes con otro costo se marcan para rehacerse
+# 🇺🇸 Bcrypt configuration: hashes with a different cost are flagged for rehashing
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+# 🇪🇸 Hilos dedicados a bcrypt: acotan cuántos hashes corren a la vez para que una
+# ráfaga de logins no ocupe la CPU ni el pool de hilos del resto de los endpoints
+# 🇺🇸 Threads dedicated to bcrypt: they bound how many hashes run at once so a login
+# burst does not take over the CPU or the thread pool of the other endpoints
+executor_bcrypt = ThreadPoolExecutor(
+    max_workers=settings.BCRYPT_HILOS or os.cpu_count() or 1,
+    thread_name_prefix="bcrypt"
+)
 
 # 🇪🇸 Configuración de OAuth2
 # 🇺🇸 OAuth2 configuration
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# 🇪🇸 Caché de usuarios activos por sujeto del token (email)
+# 🇺🇸 Cache of active users keyed by token subject (email)
+cache_usuarios = CacheTTL(
+    max_entradas=settings.AUTH_CACHE_MAX_USUARIOS,
+    ttl_segundos=settings.AUTH_CACHE_TTL_SEGUNDOS
+)
+
+def _columnas_usuario(user: Usuario) -> dict:
+    """
+    🇪🇸 Copia de las columnas del usuario, independiente de la sesión. El hash de la
+    contraseña no se guarda: el usuario cacheado no lo necesita y la caché no debe
+    retener credenciales.
+    🇺🇸 Copy of the user's columns, independent of the session. The password hash is
+    not kept: the cached user does not need it and the cache must not hold credentials.
+    """
+    return {
+        columna.key: getattr(user, columna.key)
+        for columna in Usuario.__table__.columns
+        if columna.key != "hashed_password"
+    }
+
+def invalidar_usuario(*emails: Optional[str]) -> None:
+    """
+    🇪🇸 Invalida los usuarios cacheados tras cambiarlos o eliminarlos
+    🇺🇸 Invalidates cached users after they are changed or deleted
+    """
+    for email in emails:
+        if email:
+            cache_usuarios.invalidar(email)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    🇪🇸 Verifica si la contraseña coincide con el hash
-    🇺🇸 Verifies if the password matches the hash
+    🇪🇸 Verifica si la contraseña coincide con el hash (en los hilos de bcrypt)
+    🇺🇸 Verifies if the password matches the hash (on the bcrypt threads)
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return executor_bcrypt.submit(pwd_context.verify, plain_password, hashed_password).result()
 
 def get_password_hash(password: str) -> str:
     """
-    🇪🇸 Genera un hash de la contraseña
-    🇺🇸 Generates a password hash
+    🇪🇸 Genera un hash de la contraseña (en los hilos de bcrypt)
+    🇺🇸 Generates a password hash (on the bcrypt threads)
+    """
+    return executor_bcrypt.submit(pwd_context.hash, password).result()
+
+async def verificar_y_actualizar_password(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    🇪🇸 Verifica la contraseña en los hilos de bcrypt sin bloquear el event loop ni
+    ocupar un hilo de los endpoints mientras espera. Devuelve si coincide y, si el hash
+    usa otro costo que BCRYPT_ROUNDS, el hash nuevo a guardar (None si no hace falta).
+    🇺🇸 Verifies the password on the bcrypt threads without blocking the event loop or
+    holding an endpoint thread while waiting. Returns whether it matches and, if the
+    hash uses a cost other than BCRYPT_ROUNDS, the new hash to store (None otherwise).
     """
-    return pwd_context.hash(password)
+    return await asyncio.get_running_loop().run_in_executor(
+        executor_bcrypt, pwd_context.verify_and_update, plain_password, hashed_password
+    )
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -49,7 +108,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> Usuario:
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> Usuario:
     """
     🇪🇸 Obtiene el usuario actual basado en el token JWT
     🇺🇸 Gets the current user based on JWT token
@@ -67,12 +126,20 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
     except JWTError:
         raise credentials_exception
     
+    # 🇪🇸 Ruta rápida: usuario activo ya cacheado, sin consulta a la base de datos
+    # 🇺🇸 Fast path: active user already cached, no database round trip
+    columnas = cache_usuarios.obtener(email)
+    if columnas is not None:
+        return Usuario(**columnas)
+    
     user = db.query(Usuario).filter(Usuario.email == email).first()
     if user is None:
         raise credentials_exception
+    if user.is_active:
+        cache_usuarios.guardar(email, _columnas_usuario(user))
     return user
 
-async def get_current_active_user(current_user: Usuario = Depends(get_current_user)) -> Usuario:
+def get_current_active_user(current_user: Usuario = Depends(get_current_user)) -> Usuario:
     """
     🇪🇸 Verifica que el usuario actual esté activo
     🇺🇸 Verifies that the current user is active
@@ -81,7 +148,7 @@ async def get_current_active_user(current_user: Usuario = Depends(get_current_us
         raise HTTPException(status_code=400, detail="Usuario inactivo")
     return current_user
 
-async def verificar_rol_cobrador(current_user: Usuario = Depends(get_current_active_user)) -> Usuario:
+def verificar_rol_cobrador(current_user: Usuario = Depends(get_current_active_user)) -> Usuario:
     """
     🇪🇸 Verifica que el usuario tenga el rol de cobrador
     🇺🇸 Verifies that the user has the collector role
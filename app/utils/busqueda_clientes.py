@@ -0,0 +1,102 @@
+"""
+🇪🇸 Búsqueda de clientes por prefijo sobre columnas normalizadas e indexadas
+🇺🇸 Client search by prefix over normalized, indexed columns
+"""
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from ..models.cliente import Cliente
+from .texto import compactar, normalizar
+
+# 🇪🇸 Columnas del schema de cliente, leídas sin construir objetos ORM
+# 🇺🇸 Client schema columns, read without building ORM objects
+COLUMNAS_CLIENTE = (
+    Cliente.id,
+    Cliente.cedula,
+    Cliente.nombre,
+    Cliente.apellido,
+    Cliente.telefono,
+    Cliente.direccion,
+    Cliente.email,
+    Cliente.ruta_id,
+    Cliente.fecha_registro,
+    Cliente.activo,
+)
+
+# 🇪🇸 Relevancia de cada tipo de coincidencia (mayor primero)
+# 🇺🇸 Relevance of each match kind (highest first)
+RELEVANCIA = {
+    "cedula": 100,
+    "telefono": 80,
+    "nombre": 60,
+    "apellido": 50,
+    "direccion": 20,
+}
+
+def _prefijo(columna, texto: str):
+    """
+    🇪🇸 `columna` empieza por `texto`. El texto normalizado no contiene comodines y el
+    LIKE con prefijo usa el índice de la columna (ver el modelo Cliente).
+    🇺🇸 `columna` starts with `texto`. Normalized text holds no wildcards and the
+    prefix LIKE uses the column's index (see the Cliente model).
+    """
+    return columna.like(texto + "%")
+
+def _consultas(consulta: str) -> List[Tuple[str, object]]:
+    """
+    🇪🇸 Columnas a consultar según lo que se escribió: dígitos para cédula y teléfono,
+    texto para nombres y dirección
+    🇺🇸 Columns to query depending on the input: digits for ID and phone, text for
+    names and address
+    """
+    texto = normalizar(consulta)
+    compacto = compactar(consulta)
+    if not compacto:
+        return []
+    if compacto.isdigit():
+        return [
+            ("cedula", _prefijo(Cliente.cedula_busqueda, compacto)),
+            ("telefono", _prefijo(Cliente.telefono_busqueda, compacto)),
+        ]
+    return [
+        ("cedula", _prefijo(Cliente.cedula_busqueda, compacto)),
+        ("nombre", _prefijo(Cliente.nombre_busqueda, texto)),
+        ("apellido", _prefijo(Cliente.apellido_busqueda, texto)),
+        ("direccion", _prefijo(Cliente.direccion_busqueda, texto)),
+    ]
+
+def buscar_clientes(db: Session, consulta: str, limite: int = 20) -> List[Dict[str, Any]]:
+    """
+    🇪🇸 Clientes cuya cédula, teléfono, nombre ("nombre apellido" o "apellido nombre")
+    o dirección empiezan por `consulta`, sin distinguir tildes ni mayúsculas. Cada
+    columna se consulta con su índice y a lo sumo `limite` filas; los resultados se
+    ordenan por relevancia y luego por apellido y nombre, con los campos del schema
+    de cliente más `coincidencia` y `relevancia`.
+    🇺🇸 Clients whose ID, phone, name ("first last" or "last first") or address
+    start with `consulta`, ignoring accents and case. Each column is queried through
+    its index with at most `limite` rows; results are ordered by relevance, then by
+    last and first name, with the client schema fields plus `coincidencia` and
+    `relevancia`.
+    """
+    mejores: Dict[int, Tuple[str, int]] = {}
+    for tipo, condicion in _consultas(consulta):
+        ids = db.execute(select(Cliente.id).where(condicion).limit(limite)).scalars()
+        for cliente_id in ids:
+            if cliente_id not in mejores or mejores[cliente_id][1] < RELEVANCIA[tipo]:
+                mejores[cliente_id] = (tipo, RELEVANCIA[tipo])
+    if not mejores:
+        return []
+
+    filas = db.execute(
+        select(*COLUMNAS_CLIENTE, Cliente.apellido_busqueda).where(Cliente.id.in_(mejores))
+    ).all()
+    filas.sort(key=lambda f: (-mejores[f.id][1], f.apellido_busqueda or "", f.id))
+    claves = [columna.key for columna in COLUMNAS_CLIENTE]
+    return [
+        {
+            **dict(zip(claves, fila)),
+            "coincidencia": mejores[fila.id][0],
+            "relevancia": mejores[fila.id][1],
+        }
+        for fila in filas[:limite]
+    ]
@@ -0,0 +1,85 @@
+"""
+🇪🇸 Caché en memoria con expiración (TTL) y desalojo LRU
+🇺🇸 In-memory cache with expiration (TTL) and LRU eviction
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+class CacheTTL:
+    """
+    🇪🇸 Caché LRU con tiempo de vida por entrada, segura entre hilos y con métricas
+    🇺🇸 Thread-safe LRU cache with per-entry time to live and metrics
+    """
+    def __init__(self, max_entradas: int = 1024, ttl_segundos: float = 60.0):
+        self.max_entradas = max_entradas
+        self.ttl_segundos = ttl_segundos
+        self._datos: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.invalidaciones = 0
+
+    def obtener(self, clave: Hashable) -> Optional[Any]:
+        """
+        🇪🇸 Devuelve el valor vigente para la clave o None
+        🇺🇸 Returns the live value for the key or None
+        """
+        ahora = time.monotonic()
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is None or entrada[0] < ahora:
+                if entrada is not None:
+                    del self._datos[clave]
+                self.fallos += 1
+                return None
+            self._datos.move_to_end(clave)
+            self.aciertos += 1
+            return entrada[1]
+
+    def guardar(self, clave: Hashable, valor: Any) -> None:
+        """
+        🇪🇸 Guarda un valor, desalojando el menos usado si se supera el límite
+        🇺🇸 Stores a value, evicting the least recently used one over the limit
+        """
+        if self.max_entradas <= 0 or self.ttl_segundos <= 0:
+            return
+        with self._lock:
+            self._datos[clave] = (time.monotonic() + self.ttl_segundos, valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.max_entradas:
+                self._datos.popitem(last=False)
+
+    def invalidar(self, clave: Hashable) -> None:
+        """
+        🇪🇸 Elimina una clave de la caché
+        🇺🇸 Removes a key from the cache
+        """
+        with self._lock:
+            if self._datos.pop(clave, None) is not None:
+                self.invalidaciones += 1
+
+    def limpiar(self) -> None:
+        """
+        🇪🇸 Vacía la caché y reinicia las métricas
+        🇺🇸 Empties the cache and resets the metrics
+        """
+        with self._lock:
+            self._datos.clear()
+            self.aciertos = self.fallos = self.invalidaciones = 0
+
+    def estadisticas(self) -> Dict[str, Any]:
+        """
+        🇪🇸 Métricas de uso: aciertos, fallos y tasa de aciertos
+        🇺🇸 Usage metrics: hits, misses and hit rate
+        """
+        with self._lock:
+            consultas = self.aciertos + self.fallos
+            return {
+                "entradas": len(self._datos),
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "invalidaciones": self.invalidaciones,
+                "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+            }
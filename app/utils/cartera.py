@@ -0,0 +1,173 @@
+"""
+🇪🇸 Reporte de cartera vencida por tramos de días de atraso, zona y cobrador
+🇺🇸 Portfolio aging report by days-past-due bucket, zone and collector
+"""
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+from sqlalchemy import case, func, literal, select
+from sqlalchemy.orm import Session
+from ..models.cliente import Cliente
+from ..models.prestamo import Prestamo, EstadoPrestamo
+from ..models.ruta import Ruta
+
+# 🇪🇸 Tramos de atraso: (nombre, máximo de días incluido; None = sin tope)
+# 🇺🇸 Aging buckets: (name, maximum days included; None = no cap)
+TRAMOS = (
+    ("al_dia", 0),
+    ("1_7", 7),
+    ("8_30", 30),
+    ("31_60", 60),
+    ("mas_60", None),
+)
+
+def _tramo(fecha_corte: datetime):
+    """
+    🇪🇸 Tramo de cada préstamo según su cuota impaga más antigua
+    (`fecha_proxima_cuota`), comparada con fechas límite calculadas en Python
+    para no depender de funciones de fecha de cada motor
+    🇺🇸 Each loan's bucket from its oldest unpaid installment
+    (`fecha_proxima_cuota`), compared against cutoffs computed in Python so as
+    not to depend on each engine's date functions
+    """
+    vence = Prestamo.fecha_proxima_cuota
+    casos = [((vence.is_(None)) | (vence >= fecha_corte), literal(TRAMOS[0][0]))]
+    for nombre, dias in TRAMOS[1:-1]:
+        casos.append((vence >= fecha_corte - timedelta(days=dias), literal(nombre)))
+    return case(*casos, else_=literal(TRAMOS[-1][0]))
+
+def reporte_cartera(
+    db: Session,
+    fecha_corte: Optional[date] = None,
+    zona: Optional[str] = None,
+    cobrador_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    🇪🇸 Cartera vigente (préstamos ACTIVOS y ATRASADOS) por zona, cobrador y tramo de
+    atraso al inicio de `fecha_corte` (hoy por defecto), en una sola consulta agrupada
+    sobre los contadores de saldo de los préstamos, sin recorrer las cuotas. Como los
+    contadores reflejan el estado actual, `fecha_corte` no puede ser anterior a hoy
+    (ValueError); una fecha futura muestra el atraso que tendría la cartera si no se
+    cobra nada hasta entonces. Capital e interés no salen de la amortización de cada
+    cuota: el saldo se reparte a prorrata en la proporción monto / monto_total del
+    préstamo. Los préstamos de clientes sin ruta aparecen con zona y cobrador nulos.
+    🇺🇸 Outstanding portfolio (ACTIVO and ATRASADO loans) by zone, collector and aging
+    bucket at the start of `fecha_corte` (today by default), in a single grouped query
+    over the loans' balance counters, without walking the installments. Since the
+    counters reflect the current state, `fecha_corte` cannot be before today
+    (ValueError); a future date shows the aging the portfolio would have if nothing is
+    collected until then. Principal and interest do not come from each installment's
+    amortization: the balance is split pro rata in the loan's monto / monto_total
+    ratio. Loans of clients without a route show up with null zone and collector.
+    """
+    hoy = datetime.utcnow().date()
+    fecha_corte = fecha_corte or hoy
+    if fecha_corte < hoy:
+        raise ValueError("La fecha de corte no puede ser anterior a hoy")
+    corte = datetime.combine(fecha_corte, datetime.min.time())
+    tramo = _tramo(corte).label("tramo")
+    proporcion_capital = func.coalesce(Prestamo.monto / func.nullif(Prestamo.monto_total, 0), 1)
+
+    # 🇪🇸 Un tramo por préstamo; se agrupa fuera para que el CASE no se repita en el
+    # GROUP BY (PostgreSQL no iguala sus parámetros)
+    # 🇺🇸 One bucket per loan; grouping happens outside so the CASE is not repeated
+    # in the GROUP BY (PostgreSQL does not match its parameters)
+    por_prestamo = (
+        select(
+            Ruta.zona,
+            Ruta.cobrador_id,
+            tramo,
+            Prestamo.id,
+            Prestamo.saldo_pendiente.label("saldo"),
+            (Prestamo.saldo_pendiente * proporcion_capital).label("capital"),
+        )
+        .select_from(Prestamo)
+        .join(Cliente, Prestamo.cliente_id == Cliente.id)
+        .outerjoin(Ruta, Cliente.ruta_id == Ruta.id)
+        .where(
+            Prestamo.estado.in_([EstadoPrestamo.ACTIVO, EstadoPrestamo.ATRASADO]),
+            Prestamo.saldo_pendiente > 0
+        )
+    )
+    if zona is not None:
+        por_prestamo = por_prestamo.where(Ruta.zona == zona)
+    if cobrador_id is not None:
+        por_prestamo = por_prestamo.where(Ruta.cobrador_id == cobrador_id)
+    por_prestamo = por_prestamo.subquery()
+
+    consulta = select(
+        por_prestamo.c.zona,
+        por_prestamo.c.cobrador_id,
+        por_prestamo.c.tramo,
+        func.count(por_prestamo.c.id),
+        func.coalesce(func.sum(por_prestamo.c.saldo), 0),
+        func.coalesce(func.sum(por_prestamo.c.capital), 0),
+    ).group_by(por_prestamo.c.zona, por_prestamo.c.cobrador_id, por_prestamo.c.tramo)
+
+    orden = {nombre: i for i, (nombre, _) in enumerate(TRAMOS)}
+    filas = []
+    totales: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+    for zona_fila, cobrador, nombre, prestamos, saldo, capital in db.execute(consulta):
+        filas.append({
+            "zona": zona_fila,
+            "cobrador_id": cobrador,
+            "tramo": nombre,
+            "prestamos": prestamos,
+            "saldo": round(saldo, 2),
+            "capital": round(capital, 2),
+            "interes": round(saldo - capital, 2),
+        })
+        total = totales[nombre]
+        total[0] += prestamos
+        total[1] += saldo
+        total[2] += capital
+
+    filas.sort(key=lambda f: (f["zona"] is None, f["zona"] or "", f["cobrador_id"] or 0, orden[f["tramo"]]))
+    return {
+        "fecha_corte": fecha_corte,
+        "filas": filas,
+        "totales": [
+            {
+                "tramo": nombre,
+                "prestamos": totales[nombre][0],
+                "saldo": round(totales[nombre][1], 2),
+                "capital": round(totales[nombre][2], 2),
+                "interes": round(totales[nombre][1] - totales[nombre][2], 2),
+            }
+            for nombre, _ in TRAMOS
+        ],
+    }
+
+if __name__ == "__main__":
+    import argparse
+    import csv
+    import sys
+    from ..database import SessionLocal
+
+    parser = argparse.ArgumentParser(
+        description="Reporte de cartera vencida en CSV / Portfolio aging report as CSV"
+    )
+    parser.add_argument("fecha_corte", type=date.fromisoformat, nargs="?")
+    parser.add_argument("--zona")
+    parser.add_argument("--cobrador-id", type=int)
+    parser.add_argument("--salida", help="Archivo CSV (por defecto, la salida estándar) / CSV file (stdout by default)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        reporte = reporte_cartera(db, args.fecha_corte, args.zona, args.cobrador_id)
+    except ValueError as error:
+        parser.error(str(error))
+    finally:
+        db.close()
+
+    columnas = ["zona", "cobrador_id", "tramo", "prestamos", "saldo", "capital", "interes"]
+    archivo = open(args.salida, "w", newline="") if args.salida else sys.stdout
+    try:
+        escritor = csv.DictWriter(archivo, fieldnames=columnas)
+        escritor.writeheader()
+        escritor.writerows(reporte["filas"])
+        escritor.writerows({"zona": "TOTAL", **total} for total in reporte["totales"])
+    finally:
+        if archivo is not sys.stdout:
+            archivo.close()
@@ -0,0 +1,100 @@
+"""
+🇪🇸 Conexiones salientes reutilizables (HTTP y SMTP) para los proveedores
+🇺🇸 Reusable outbound connections (HTTP and SMTP) for the providers
+"""
+import queue
+import smtplib
+import threading
+import httpx
+from ..config import settings
+
+class PoolSMTP:
+    """
+    🇪🇸 Pool de conexiones SMTP autenticadas y reutilizables.
+    Sus métodos son bloqueantes: se ejecutan en un hilo, nunca en el event loop.
+    🇺🇸 Pool of reusable authenticated SMTP connections.
+    Its methods block: they run in a thread, never on the event loop.
+    """
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        max_conexiones: int = 4,
+        timeout: float = 30.0
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self._libres: "queue.LifoQueue[smtplib.SMTP]" = queue.LifoQueue()
+        self._cupos = threading.BoundedSemaphore(max_conexiones)
+
+    def _conectar(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        server.starttls()
+        if self.username:
+            server.login(self.username, self.password)
+        return server
+
+    @staticmethod
+    def _descartar(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except smtplib.SMTPException:
+            server.close()
+        except OSError:
+            pass
+
+    def enviar(self, remitente: str, destinatario: str, contenido: str) -> None:
+        """
+        🇪🇸 Envía un correo reutilizando una conexión libre (o abriendo una nueva)
+        🇺🇸 Sends an email reusing an idle connection (or opening a new one)
+        """
+        with self._cupos:
+            try:
+                server = self._libres.get_nowait()
+            except queue.Empty:
+                server = self._conectar()
+            try:
+                server.sendmail(remitente, destinatario, contenido)
+            except smtplib.SMTPServerDisconnected:
+                # 🇪🇸 El servidor cerró la conexión inactiva: liberarla y reintentar una vez
+                # 🇺🇸 The server closed the idle connection: release it and retry once
+                self._descartar(server)
+                server = self._conectar()
+                try:
+                    server.sendmail(remitente, destinatario, contenido)
+                except Exception:
+                    self._descartar(server)
+                    raise
+            except Exception:
+                self._descartar(server)
+                raise
+            self._libres.put(server)
+
+    def cerrar(self) -> None:
+        """
+        🇪🇸 Cierra todas las conexiones libres
+        🇺🇸 Closes every idle connection
+        """
+        while True:
+            try:
+                self._descartar(self._libres.get_nowait())
+            except queue.Empty:
+                return
+
+def crear_cliente_http() -> httpx.AsyncClient:
+    """
+    🇪🇸 Crea un cliente HTTP asíncrono con pool de conexiones persistentes
+    🇺🇸 Creates an async HTTP client with a persistent connection pool
+    """
+    return httpx.AsyncClient(
+        timeout=settings.NOTIFICACIONES_HTTP_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=settings.NOTIFICACIONES_HTTP_MAX_CONEXIONES,
+            max_keepalive_connections=settings.NOTIFICACIONES_HTTP_MAX_CONEXIONES
+        )
+    )
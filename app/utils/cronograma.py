@@ -0,0 +1,228 @@
+"""
+🇪🇸 Motor de cronogramas de pago vectorizado
+🇺🇸 Vectorized payment schedule engine
+"""
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from ..models.prestamo import FrecuenciaPago
+from ..models.pago import EstadoPago
+
+# 🇪🇸 Días entre cuotas para las frecuencias de paso fijo
+# 🇺🇸 Days between installments for fixed-step frequencies
+DIAS_POR_FRECUENCIA = {
+    FrecuenciaPago.DIARIO: 1,
+    FrecuenciaPago.SEMANAL: 7,
+    FrecuenciaPago.QUINCENAL: 15,
+}
+
+# 🇪🇸 Máscara de días hábiles: lunes a sábado (sin domingos)
+# 🇺🇸 Business-day mask: Monday to Saturday (no Sundays)
+SEMANA_SIN_DOMINGOS = "1111110"
+
+@dataclass
+class Cronograma:
+    """
+    🇪🇸 Cronogramas de varios préstamos en formato columnar.
+    Las columnas por cuota están ordenadas por préstamo y número de cuota.
+    🇺🇸 Schedules for several loans in columnar form.
+    Per-installment columns are ordered by loan and installment number.
+    """
+    # 🇪🇸 Columnas por préstamo
+    # 🇺🇸 Per-loan columns
+    monto_total: np.ndarray
+    valor_cuota: np.ndarray
+    fecha_fin: np.ndarray
+    # 🇪🇸 Columnas por cuota
+    # 🇺🇸 Per-installment columns
+    prestamo_idx: np.ndarray
+    numero_cuota: np.ndarray
+    fecha_programada: np.ndarray
+    monto_cuota: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.monto_total)
+
+    def fechas(self, indice: int) -> List[datetime]:
+        """
+        🇪🇸 Fechas de pago del préstamo en la posición indicada
+        🇺🇸 Payment dates of the loan at the given position
+        """
+        inicio, fin = np.searchsorted(self.prestamo_idx, [indice, indice + 1])
+        return self.fecha_programada[inicio:fin].tolist()
+
+    def fechas_fin(self) -> List[datetime]:
+        """
+        🇪🇸 Fecha de la última cuota de cada préstamo
+        🇺🇸 Date of each loan's last installment
+        """
+        return self.fecha_fin.tolist()
+
+    def fechas_primera_cuota(self) -> List[datetime]:
+        """
+        🇪🇸 Fecha de la primera cuota de cada préstamo
+        🇺🇸 Date of each loan's first installment
+        """
+        primeras = np.searchsorted(self.prestamo_idx, np.arange(len(self)))
+        return self.fecha_programada[primeras].tolist()
+
+    def saldos(self) -> List[float]:
+        """
+        🇪🇸 Suma de las cuotas de cada préstamo (saldo inicial)
+        🇺🇸 Sum of each loan's installments (initial balance)
+        """
+        return np.bincount(self.prestamo_idx, weights=self.monto_cuota, minlength=len(self)).tolist()
+
+    def filas_pagos(self, prestamo_ids: Sequence[int]) -> List[Dict[str, Any]]:
+        """
+        🇪🇸 Filas de `Pago` listas para un INSERT masivo
+        🇺🇸 `Pago` rows ready for a bulk INSERT
+        """
+        ids = np.asarray(prestamo_ids, dtype=np.int64)[self.prestamo_idx].tolist()
+        return [
+            {
+                "prestamo_id": prestamo_id,
+                "numero_cuota": numero_cuota,
+                "monto": monto,
+                "fecha_programada": fecha,
+                "estado": EstadoPago.PENDIENTE,
+            }
+            for prestamo_id, numero_cuota, monto, fecha in zip(
+                ids,
+                self.numero_cuota.tolist(),
+                self.monto_cuota.tolist(),
+                self.fecha_programada.tolist(),
+            )
+        ]
+
+def _codigos_frecuencia(frecuencias: Iterable[Union[FrecuenciaPago, str]]) -> np.ndarray:
+    """
+    🇪🇸 Convierte las frecuencias a días de paso (0 = mensual)
+    🇺🇸 Converts frequencies to step days (0 = monthly)
+    """
+    return np.array(
+        [DIAS_POR_FRECUENCIA.get(FrecuenciaPago(frecuencia), 0) for frecuencia in frecuencias],
+        dtype=np.int64,
+    )
+
+def calcular_fechas(
+    fechas_inicio: Sequence[datetime],
+    plazos: Sequence[int],
+    frecuencias: Sequence[Union[FrecuenciaPago, str]],
+    omitir_domingos: bool = False,
+    feriados: Optional[Sequence[date]] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    🇪🇸 Calcula las fechas de todas las cuotas de varios préstamos a la vez.
+    Los meses son meses calendario reales (el día se ajusta al último día del mes).
+    Con `omitir_domingos` o `feriados` las cuotas diarias avanzan por días hábiles
+    y las demás se corren al siguiente día hábil.
+    Devuelve (prestamo_idx, numero_cuota, fecha_programada).
+
+    🇺🇸 Computes every installment date for several loans at once.
+    Months are real calendar months (the day is clamped to the month's last day).
+    With `omitir_domingos` or `feriados` daily installments advance by business
+    days and the rest roll forward to the next business day.
+    Returns (prestamo_idx, numero_cuota, fecha_programada).
+    """
+    plazos_arr = np.asarray(plazos, dtype=np.int64)
+    if plazos_arr.size and plazos_arr.min() <= 0:
+        raise ValueError("El plazo debe ser mayor que cero")
+
+    inicio_us = np.asarray(fechas_inicio, dtype="datetime64[us]")
+    inicio_dia = inicio_us.astype("datetime64[D]")
+    hora_del_dia = inicio_us - inicio_dia.astype("datetime64[us]")
+    pasos = _codigos_frecuencia(frecuencias)
+
+    # 🇪🇸 Expandir a una fila por cuota
+    # 🇺🇸 Expand to one row per installment
+    prestamo_idx = np.repeat(np.arange(plazos_arr.size, dtype=np.int64), plazos_arr)
+    desplazamientos = np.cumsum(plazos_arr) - plazos_arr
+    numero_cuota = np.arange(prestamo_idx.size, dtype=np.int64) - desplazamientos[prestamo_idx] + 1
+
+    dia = inicio_dia[prestamo_idx]
+    paso = pasos[prestamo_idx]
+    mensual = paso == 0
+
+    fechas = dia + numero_cuota * paso
+
+    if mensual.any():
+        mes_inicio = dia[mensual].astype("datetime64[M]")
+        dia_del_mes = dia[mensual] - mes_inicio.astype("datetime64[D]")
+        mes = mes_inicio + numero_cuota[mensual]
+        dias_del_mes = (mes + 1).astype("datetime64[D]") - mes.astype("datetime64[D]")
+        fechas[mensual] = mes.astype("datetime64[D]") + np.minimum(
+            dia_del_mes, dias_del_mes - np.timedelta64(1, "D")
+        )
+
+    if omitir_domingos or feriados:
+        semana = SEMANA_SIN_DOMINGOS if omitir_domingos else "1111111"
+        festivos = np.asarray(list(feriados or []), dtype="datetime64[D]")
+        diario = paso == 1
+        if diario.any():
+            fechas[diario] = np.busday_offset(
+                dia[diario], numero_cuota[diario],
+                roll="forward", weekmask=semana, holidays=festivos
+            )
+        if (~diario).any():
+            fechas[~diario] = np.busday_offset(
+                fechas[~diario], 0,
+                roll="forward", weekmask=semana, holidays=festivos
+            )
+
+    fecha_programada = fechas.astype("datetime64[us]") + hora_del_dia[prestamo_idx]
+    return prestamo_idx, numero_cuota, fecha_programada
+
+def calcular_cronogramas(
+    fechas_inicio: Sequence[datetime],
+    montos: Sequence[float],
+    intereses: Sequence[float],
+    plazos: Sequence[int],
+    frecuencias: Sequence[Union[FrecuenciaPago, str]],
+    omitir_domingos: bool = False,
+    feriados: Optional[Sequence[date]] = None,
+) -> Cronograma:
+    """
+    🇪🇸 Calcula montos y fechas de cuotas para muchos préstamos con aritmética de arreglos
+    🇺🇸 Computes installment amounts and dates for many loans with array arithmetic
+    """
+    plazos_arr = np.asarray(plazos, dtype=np.int64)
+    prestamo_idx, numero_cuota, fecha_programada = calcular_fechas(
+        fechas_inicio, plazos_arr, frecuencias, omitir_domingos, feriados
+    )
+
+    monto_total = np.asarray(montos, dtype=np.float64) * (
+        1 + np.asarray(intereses, dtype=np.float64) / 100
+    )
+    valor_cuota = monto_total / plazos_arr
+
+    # 🇪🇸 La última cuota de cada préstamo está al final de su bloque
+    # 🇺🇸 Each loan's last installment sits at the end of its block
+    fecha_fin = fecha_programada[np.cumsum(plazos_arr) - 1]
+
+    return Cronograma(
+        monto_total=monto_total,
+        valor_cuota=valor_cuota,
+        fecha_fin=fecha_fin,
+        prestamo_idx=prestamo_idx,
+        numero_cuota=numero_cuota,
+        fecha_programada=fecha_programada,
+        monto_cuota=valor_cuota[prestamo_idx],
+    )
+
+def calcular_fechas_pagos(
+    fecha_inicio: datetime,
+    plazo: int,
+    frecuencia_pago: Union[FrecuenciaPago, str],
+    omitir_domingos: bool = False,
+    feriados: Optional[Sequence[date]] = None,
+) -> List[datetime]:
+    """
+    🇪🇸 Calcula las fechas de pago de un solo préstamo (p. ej. reprogramaciones)
+    🇺🇸 Computes the payment dates of a single loan (e.g. reschedulings)
+    """
+    _, _, fechas = calcular_fechas(
+        [fecha_inicio], [plazo], [frecuencia_pago], omitir_domingos, feriados
+    )
+    return fechas.tolist()
@@ -0,0 +1,198 @@
+"""
+🇪🇸 Despacho concurrente y con límite de tasa de notificaciones
+🇺🇸 Concurrent, rate-limited notification dispatch
+"""
+import asyncio
+import time
+import anyio
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..models.notificacion import Notificacion, CanalNotificacion, EstadoNotificacion
+from ..models.resumen_notificacion import acumular
+from ..models.usuario import Usuario
+from .notification_providers import NotificationProvider, get_notification_provider
+
+class LimitadorTasa:
+    """
+    🇪🇸 Limitador de tasa que espacia los envíos de un canal de forma uniforme
+    🇺🇸 Rate limiter that evenly spaces a channel's sends
+    """
+    def __init__(self, por_segundo: Optional[float]):
+        self._intervalo = 1.0 / por_segundo if por_segundo else 0.0
+        self._siguiente = 0.0
+        self._lock = asyncio.Lock()
+
+    async def esperar(self) -> None:
+        """
+        🇪🇸 Espera hasta que el siguiente envío esté permitido
+        🇺🇸 Waits until the next send is allowed
+        """
+        if not self._intervalo:
+            return
+        async with self._lock:
+            ahora = time.monotonic()
+            turno = max(ahora, self._siguiente)
+            self._siguiente = turno + self._intervalo
+        if turno > ahora:
+            await asyncio.sleep(turno - ahora)
+
+class DespachadorNotificaciones:
+    """
+    🇪🇸 Recorre las notificaciones por lotes, las envía en paralelo respetando
+    los límites de cada canal y confirma los cambios de estado por lote.
+    🇺🇸 Walks notifications in chunks, sends them concurrently within each
+    channel's limits and commits state changes per chunk.
+    """
+    def __init__(
+        self,
+        db: Session,
+        tamano_lote: Optional[int] = None,
+        concurrencia: Optional[Dict[CanalNotificacion, int]] = None,
+        tasa_por_segundo: Optional[Dict[CanalNotificacion, float]] = None,
+        obtener_proveedor: Callable[[CanalNotificacion], NotificationProvider] = get_notification_provider,
+    ):
+        self.db = db
+        self.tamano_lote = tamano_lote or settings.NOTIFICACIONES_TAMANO_LOTE
+        concurrencia = concurrencia or {}
+        tasa_por_segundo = tasa_por_segundo or {}
+        self._semaforos = {
+            canal: asyncio.Semaphore(
+                concurrencia.get(canal)
+                or settings.NOTIFICACIONES_CONCURRENCIA_POR_CANAL.get(canal.value)
+                or settings.NOTIFICACIONES_CONCURRENCIA
+            )
+            for canal in CanalNotificacion
+        }
+        self._limitadores = {
+            canal: LimitadorTasa(
+                tasa_por_segundo.get(canal)
+                or settings.NOTIFICACIONES_TASA_POR_CANAL.get(canal.value)
+            )
+            for canal in CanalNotificacion
+        }
+        self._obtener_proveedor = obtener_proveedor
+        self._proveedores: Dict[CanalNotificacion, NotificationProvider] = {}
+
+    def _proveedor(self, canal: CanalNotificacion) -> NotificationProvider:
+        if canal not in self._proveedores:
+            self._proveedores[canal] = self._obtener_proveedor(canal)
+        return self._proveedores[canal]
+
+    def _siguiente_lote(self, estados: Sequence[EstadoNotificacion], ultimo_id: int) -> List[Any]:
+        """
+        🇪🇸 Lee solo las columnas necesarias del siguiente lote (paginación por id). Las
+        notificaciones sin usuario también se leen, con email nulo, para marcarlas fallidas.
+        🇺🇸 Reads only the needed columns of the next chunk (id keyset). Notifications
+        without a user are read too, with a null email, so they get marked as failed.
+        """
+        return self.db.query(
+            Notificacion.id,
+            Notificacion.estado,
+            Notificacion.tipo,
+            Notificacion.canal,
+            Notificacion.titulo,
+            Notificacion.mensaje,
+            Notificacion.datos_adicionales,
+            Usuario.email
+        ).outerjoin(
+            Usuario, Usuario.id == Notificacion.usuario_id
+        ).filter(
+            Notificacion.estado.in_(list(estados)),
+            Notificacion.id > ultimo_id
+        ).order_by(
+            Notificacion.id
+        ).limit(self.tamano_lote).all()
+
+    async def _enviar(self, fila) -> Dict[str, Any]:
+        """
+        🇪🇸 Envía una notificación y devuelve la fila de actualización resultante
+        🇺🇸 Sends one notification and returns the resulting update row
+        """
+        if fila.email is None:
+            return {
+                "id": fila.id,
+                "estado": EstadoNotificacion.FALLIDA,
+                "datos_adicionales": {
+                    **(fila.datos_adicionales or {}),
+                    "error": "Notificación sin destinatario",
+                },
+            }
+        async with self._semaforos[fila.canal]:
+            await self._limitadores[fila.canal].esperar()
+            try:
+                exito = await self._proveedor(fila.canal).send_notification(
+                    to=fila.email,
+                    title=fila.titulo,
+                    message=fila.mensaje,
+                    metadata=fila.datos_adicionales
+                )
+            except Exception as e:
+                return {
+                    "id": fila.id,
+                    "estado": EstadoNotificacion.FALLIDA,
+                    "datos_adicionales": {**(fila.datos_adicionales or {}), "error": str(e)},
+                }
+        if exito:
+            return {"id": fila.id, "estado": EstadoNotificacion.ENVIADA, "fecha_envio": datetime.utcnow()}
+        return {"id": fila.id, "estado": EstadoNotificacion.FALLIDA}
+
+    def _confirmar(self, lote: List[Any], resultados: List[Dict[str, Any]]) -> None:
+        """
+        🇪🇸 Aplica los cambios de estado del lote en una sola transacción, junto con
+        el ajuste de los contadores (bulk_update_mappings no dispara eventos del ORM)
+        🇺🇸 Applies the chunk's state changes in a single transaction, together with
+        the counters adjustment (bulk_update_mappings does not fire ORM events)
+        """
+        # 🇪🇸 Agrupar por columnas modificadas para que cada grupo sea un solo executemany
+        # 🇺🇸 Group by modified columns so each group is a single executemany
+        grupos: Dict[tuple, List[Dict[str, Any]]] = {}
+        for resultado in resultados:
+            grupos.setdefault(tuple(sorted(resultado)), []).append(resultado)
+        try:
+            for filas in grupos.values():
+                self.db.bulk_update_mappings(Notificacion, filas)
+            acumular(
+                self.db.connection(),
+                antes=[(fila.estado, fila.tipo, fila.canal) for fila in lote],
+                despues=[(r["estado"], fila.tipo, fila.canal) for fila, r in zip(lote, resultados)]
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    async def procesar(
+        self,
+        estados: Sequence[EstadoNotificacion] = (EstadoNotificacion.PENDIENTE, EstadoNotificacion.FALLIDA)
+    ) -> Dict[str, Any]:
+        """
+        🇪🇸 Despacha todas las notificaciones en los estados dados y devuelve métricas
+        🇺🇸 Dispatches every notification in the given states and returns metrics
+        """
+        inicio = time.monotonic()
+        enviadas = fallidas = 0
+        ultimo_id = 0
+        while True:
+            # 🇪🇸 La sesión es síncrona: lecturas y confirmaciones van al pool de hilos
+            # para no bloquear el event loop mientras otros envíos esperan
+            # 🇺🇸 The session is synchronous: reads and commits go to the thread pool
+            # so the event loop is not blocked while other sends are waiting
+            lote = await anyio.to_thread.run_sync(self._siguiente_lote, estados, ultimo_id)
+            if not lote:
+                break
+            ultimo_id = lote[-1].id
+            resultados = await asyncio.gather(*(self._enviar(fila) for fila in lote))
+            await anyio.to_thread.run_sync(self._confirmar, lote, resultados)
+            exitos = sum(1 for r in resultados if r["estado"] == EstadoNotificacion.ENVIADA)
+            enviadas += exitos
+            fallidas += len(resultados) - exitos
+
+        segundos = time.monotonic() - inicio
+        return {
+            "enviadas": enviadas,
+            "fallidas": fallidas,
+            "segundos": segundos,
+            "envios_por_segundo": (enviadas + fallidas) / segundos if segundos else 0.0,
+        }
@@ -0,0 +1,198 @@
+"""
+🇪🇸 Generación de las cobranzas del día siguiente a partir de las cuotas que vencen
+🇺🇸 Generation of the next day's collections from the installments falling due
+"""
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+import anyio
+from sqlalchemy import exists, func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..database import SessionLocal
+from ..models.cliente import Cliente
+from ..models.cobranza import Cobranza, EstadoCobranza
+from ..models.pago import Pago, EstadoPago
+from ..models.prestamo import Prestamo, EstadoPrestamo
+from ..models.ruta import Ruta
+from .resumen_cobranzas import acumular
+
+logger = logging.getLogger(__name__)
+
+def _cuotas_del_dia(fecha: date):
+    """
+    🇪🇸 Condiciones de las cuotas por cobrar en `fecha` que aún no tienen cobranza ese día
+    🇺🇸 Conditions for the installments due on `fecha` that have no collection that day yet
+    """
+    inicio = datetime.combine(fecha, datetime.min.time())
+    fin = inicio + timedelta(days=1)
+    return (
+        Pago.fecha_programada >= inicio,
+        Pago.fecha_programada < fin,
+        Pago.estado.in_([EstadoPago.PENDIENTE, EstadoPago.ATRASADO]),
+        Prestamo.estado.in_([EstadoPrestamo.ACTIVO, EstadoPrestamo.ATRASADO]),
+        ~exists().where(
+            Cobranza.pago_id == Pago.id,
+            Cobranza.fecha_programada >= inicio,
+            Cobranza.fecha_programada < fin
+        ),
+    )
+
+def _insertar_nuevas(db: Session, filas: List[dict]) -> List[dict]:
+    """
+    🇪🇸 Inserta las cobranzas y devuelve las que se crearon. Otra generación
+    simultánea pudo crear algunas después de leer el lote: si el INSERT choca con
+    uq_cobranzas_pago_fecha, se reintenta fila por fila omitiendo las ya existentes.
+    🇺🇸 Inserts the collections and returns the ones created. A concurrent
+    generation may have created some after the chunk was read: if the INSERT hits
+    uq_cobranzas_pago_fecha, it is retried row by row skipping the existing ones.
+    """
+    try:
+        with db.begin_nested():
+            db.execute(insert(Cobranza), filas)
+        return filas
+    except IntegrityError:
+        pass
+
+    nuevas = []
+    for fila in filas:
+        try:
+            with db.begin_nested():
+                db.execute(insert(Cobranza), fila)
+            nuevas.append(fila)
+        except IntegrityError:
+            existe = db.execute(select(exists().where(
+                Cobranza.pago_id == fila["pago_id"],
+                Cobranza.fecha_programada == fila["fecha_programada"]
+            ))).scalar()
+            if not existe:
+                raise
+    return nuevas
+
+def generar_cobranzas(
+    db: Session,
+    fecha: Optional[date] = None,
+    tamano_lote: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    🇪🇸 Crea las cobranzas de `fecha` (por defecto, mañana) para las cuotas que vencen
+    ese día, asignadas al cobrador de la ruta del cliente. Inserta por lotes con una
+    transacción corta por lote y mantiene el resumen diario. Es idempotente y se puede
+    reanudar: las cuotas que ya tienen cobranza ese día se omiten, también si otra
+    ejecución simultánea las crea (restricción uq_cobranzas_pago_fecha).
+    🇺🇸 Creates the collections for `fecha` (tomorrow by default) for the installments
+    falling due that day, assigned to the collector of the client's route. Inserts in
+    chunks with one short transaction per chunk and maintains the daily summary. It is
+    idempotent and resumable: installments that already have a collection that day are
+    skipped, also when a concurrent run creates them (uq_cobranzas_pago_fecha constraint).
+    """
+    fecha = fecha or datetime.utcnow().date() + timedelta(days=1)
+    tamano_lote = tamano_lote or settings.COBRANZAS_TAMANO_LOTE
+    condiciones = _cuotas_del_dia(fecha)
+    creadas = 0
+    ultimo_id = 0
+
+    while True:
+        lote = db.execute(
+            select(
+                Pago.id,
+                Pago.monto,
+                Pago.fecha_programada,
+                Ruta.id.label("ruta_id"),
+                Ruta.zona,
+                Ruta.cobrador_id,
+                func.coalesce(Cliente.direccion, "").label("direccion")
+            )
+            .join(Prestamo, Pago.prestamo_id == Prestamo.id)
+            .join(Cliente, Prestamo.cliente_id == Cliente.id)
+            .join(Ruta, Cliente.ruta_id == Ruta.id)
+            .where(Pago.id > ultimo_id, *condiciones)
+            .order_by(Pago.id)
+            .limit(tamano_lote)
+        ).all()
+        if not lote:
+            break
+        ultimo_id = lote[-1].id
+
+        try:
+            nuevas = _insertar_nuevas(db, [
+                {
+                    "pago_id": fila.id,
+                    "cobrador_id": fila.cobrador_id,
+                    "ruta_id": fila.ruta_id,
+                    "monto_esperado": fila.monto or 0.0,
+                    "zona": fila.zona,
+                    "direccion_cobro": fila.direccion,
+                    "fecha_programada": fila.fecha_programada,
+                    "estado": EstadoCobranza.PENDIENTE,
+                }
+                for fila in lote
+            ])
+            acumular(db, despues=[
+                (fecha, fila["zona"], fila["cobrador_id"], EstadoCobranza.PENDIENTE, fila["monto_esperado"], 0.0)
+                for fila in nuevas
+            ])
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        creadas += len(nuevas)
+
+    # 🇪🇸 Cuotas que quedan sin cobranza porque el cliente no tiene ruta
+    # 🇺🇸 Installments left without a collection because the client has no route
+    sin_ruta = db.execute(
+        select(func.count(Pago.id))
+        .join(Prestamo, Pago.prestamo_id == Prestamo.id)
+        .join(Cliente, Prestamo.cliente_id == Cliente.id)
+        .where(Cliente.ruta_id.is_(None), *condiciones)
+    ).scalar()
+
+    return {"cobranzas_creadas": creadas, "sin_ruta": sin_ruta}
+
+def ejecutar_generacion(fecha: Optional[date] = None) -> Dict[str, int]:
+    """
+    🇪🇸 Genera las cobranzas con su propia sesión
+    🇺🇸 Generates the collections with its own session
+    """
+    db = SessionLocal()
+    try:
+        return generar_cobranzas(db, fecha)
+    finally:
+        db.close()
+
+def segundos_hasta(hora: int, ahora: Optional[datetime] = None) -> float:
+    """
+    🇪🇸 Segundos que faltan para la próxima `hora` en punto (UTC)
+    🇺🇸 Seconds left until the next `hora` o'clock (UTC)
+    """
+    ahora = ahora or datetime.utcnow()
+    proxima = ahora.replace(hour=hora, minute=0, second=0, microsecond=0)
+    if proxima <= ahora:
+        proxima += timedelta(days=1)
+    return (proxima - ahora).total_seconds()
+
+async def generacion_nocturna(hora: int) -> None:
+    """
+    🇪🇸 Genera cada día a la `hora` indicada (UTC) las cobranzas del día siguiente, en un hilo
+    🇺🇸 Generates the next day's collections every day at `hora` (UTC), in a thread
+    """
+    while True:
+        await asyncio.sleep(segundos_hasta(hora))
+        try:
+            resultado = await anyio.to_thread.run_sync(ejecutar_generacion)
+            logger.info(f"Generación de cobranzas: {resultado}")
+        except Exception as e:
+            logger.error(f"Error en la generación de cobranzas: {str(e)}")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Genera las cobranzas de un día (por defecto, mañana) / "
+                    "Generates one day's collections (tomorrow by default)"
+    )
+    parser.add_argument("fecha", type=date.fromisoformat, nargs="?")
+    args = parser.parse_args()
+    print(f"Cobranzas generadas / Collections generated: {ejecutar_generacion(args.fecha)}")
@@ -0,0 +1,143 @@
+"""
+🇪🇸 Barrido de morosidad: marca como ATRASADO las cuotas vencidas y sus préstamos
+🇺🇸 Overdue sweep: marks overdue installments and their loans as ATRASADO
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+import anyio
+from sqlalchemy import case, exists, literal, select, update
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..database import SessionLocal
+from ..models.pago import Pago, EstadoPago
+from ..models.prestamo import Prestamo, EstadoPrestamo
+
+logger = logging.getLogger(__name__)
+
+def marcar_atrasados(
+    db: Session,
+    ahora: Optional[datetime] = None,
+    tamano_lote: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    🇪🇸 Marca por lotes las cuotas PENDIENTES vencidas y sus préstamos ACTIVOS como
+    ATRASADO, con UPDATEs por conjunto y una transacción corta por lote. Después
+    devuelve a ACTIVO los préstamos atrasados que ya no tienen cuotas atrasadas.
+    🇺🇸 Marks overdue PENDIENTE installments and their ACTIVO loans as ATRASADO in
+    chunks, with set-based UPDATEs and one short transaction per chunk. Then moves
+    back to ACTIVO the overdue loans that no longer have overdue installments.
+    """
+    ahora = ahora or datetime.utcnow()
+    tamano_lote = tamano_lote or settings.MOROSIDAD_TAMANO_LOTE
+    cuotas = prestamos = 0
+
+    while True:
+        # 🇪🇸 Lote de cuotas vencidas (índice estado + fecha programada)
+        # 🇺🇸 Chunk of overdue installments (state + scheduled date index)
+        lote = db.execute(
+            select(Pago.id, Pago.prestamo_id).where(
+                Pago.estado == EstadoPago.PENDIENTE,
+                Pago.fecha_programada < ahora
+            ).limit(tamano_lote)
+        ).all()
+        if not lote:
+            break
+
+        try:
+            cuotas += db.execute(
+                update(Pago)
+                .where(Pago.id.in_([fila.id for fila in lote]), Pago.estado == EstadoPago.PENDIENTE)
+                .values(estado=EstadoPago.ATRASADO)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            prestamos += db.execute(
+                update(Prestamo)
+                .where(
+                    Prestamo.id.in_({fila.prestamo_id for fila in lote}),
+                    Prestamo.estado == EstadoPrestamo.ACTIVO
+                )
+                .values(estado=EstadoPrestamo.ATRASADO)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+    # 🇪🇸 Préstamos que se pusieron al día desde el último barrido
+    # 🇺🇸 Loans that caught up since the last sweep
+    try:
+        al_dia = db.execute(
+            update(Prestamo)
+            .where(
+                Prestamo.estado == EstadoPrestamo.ATRASADO,
+                ~exists().where(
+                    Pago.prestamo_id == Prestamo.id,
+                    Pago.estado == EstadoPago.ATRASADO
+                )
+            )
+            .values(estado=EstadoPrestamo.ACTIVO)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return {"cuotas_atrasadas": cuotas, "prestamos_atrasados": prestamos, "prestamos_al_dia": al_dia}
+
+def sincronizar_atraso(db: Session, prestamo_id: int) -> None:
+    """
+    🇪🇸 Ajusta ACTIVO/ATRASADO de un préstamo según tenga cuotas atrasadas (tras
+    registrar o revertir un pago). No confirma la transacción.
+    🇺🇸 Sets a loan to ACTIVO/ATRASADO depending on whether it has overdue
+    installments (after recording or reverting a payment). Does not commit.
+    """
+    db.flush()
+    tiene_atrasadas = exists().where(
+        Pago.prestamo_id == Prestamo.id,
+        Pago.estado == EstadoPago.ATRASADO
+    )
+    db.execute(
+        update(Prestamo)
+        .where(
+            Prestamo.id == prestamo_id,
+            Prestamo.estado.in_([EstadoPrestamo.ACTIVO, EstadoPrestamo.ATRASADO])
+        )
+        .values(estado=case(
+            (tiene_atrasadas, literal(EstadoPrestamo.ATRASADO, Prestamo.estado.type)),
+            else_=literal(EstadoPrestamo.ACTIVO, Prestamo.estado.type)
+        ))
+        .execution_options(synchronize_session=False)
+    )
+
+def ejecutar_barrido() -> Dict[str, int]:
+    """
+    🇪🇸 Ejecuta un barrido completo con su propia sesión
+    🇺🇸 Runs a full sweep with its own session
+    """
+    db = SessionLocal()
+    try:
+        return marcar_atrasados(db)
+    finally:
+        db.close()
+
+async def barrido_periodico(intervalo_segundos: float) -> None:
+    """
+    🇪🇸 Repite el barrido cada `intervalo_segundos` en un hilo, sin bloquear el event loop.
+    Es idempotente, así que varios workers pueden ejecutarlo a la vez.
+    🇺🇸 Repeats the sweep every `intervalo_segundos` in a thread, without blocking the
+    event loop. It is idempotent, so several workers may run it at the same time.
+    """
+    while True:
+        try:
+            resultado = await anyio.to_thread.run_sync(ejecutar_barrido)
+            logger.info(f"Barrido de morosidad: {resultado}")
+        except Exception as e:
+            logger.error(f"Error en el barrido de morosidad: {str(e)}")
+        await asyncio.sleep(intervalo_segundos)
+
+if __name__ == "__main__":
+    print(f"Barrido de morosidad / Overdue sweep: {ejecutar_barrido()}")
@@ -4,17 +4,19 @@
 """
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+import anyio
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from ..models.notificacion import (
     Notificacion,
     TipoNotificacion,
     CanalNotificacion,
     EstadoNotificacion
 )
+from ..models.resumen_notificacion import ResumenNotificaciones
 from ..models.usuario import Usuario
 from ..schemas.notificacion import NotificacionCreate, NotificacionResumen
 from .notification_providers import get_notification_provider
+from .despacho import DespachadorNotificaciones
 
 class NotificationService:
     """
@@ -28,7 +30,7 @@ class NotificationService:
         """
         self.db = db
 
-    async def crear_notificacion(self, notificacion_data: NotificacionCreate) -> Notificacion:
+    def crear_notificacion(self, notificacion_data: NotificacionCreate) -> Notificacion:
         """
         🇪🇸 Crea una nueva notificación en la base de datos
         🇺🇸 Creates a new notification in the database
@@ -51,18 +53,55 @@ class NotificationService:
         self.db.refresh(notificacion)
         return notificacion
 
+    def _buscar(self, notificacion_id: int) -> Optional[Notificacion]:
+        """
+        🇪🇸 Busca una notificación por id (consulta síncrona)
+        🇺🇸 Finds a notification by id (synchronous query)
+        """
+        return self.db.query(Notificacion).filter(Notificacion.id == notificacion_id).first()
+
+    def _registrar_envio(self, notificacion: Notificacion, success: bool) -> None:
+        """
+        🇪🇸 Guarda el resultado del envío
+        🇺🇸 Stores the send outcome
+        """
+        if success:
+            notificacion.estado = EstadoNotificacion.ENVIADA
+            notificacion.fecha_envio = datetime.utcnow()
+        else:
+            notificacion.estado = EstadoNotificacion.FALLIDA
+        self.db.commit()
+
+    def _registrar_error(self, notificacion: Notificacion, error: Exception) -> None:
+        """
+        🇪🇸 Marca la notificación como fallida y guarda el error
+        🇺🇸 Marks the notification as failed and stores the error
+        """
+        # Loguear el error
+        self.db.rollback()
+        notificacion.estado = EstadoNotificacion.FALLIDA
+        notificacion.datos_adicionales = {
+            **(notificacion.datos_adicionales or {}),
+            "error": str(error)
+        }
+        self.db.commit()
+
     async def enviar_notificacion(self, notificacion_id: int) -> bool:
         """
-        🇪🇸 Envía una notificación específica usando el proveedor adecuado
-        🇺🇸 Sends a specific notification using the appropriate provider
+        🇪🇸 Envía una notificación específica usando el proveedor adecuado. Las
+        consultas van al pool de hilos; solo el envío corre en el event loop.
+        🇺🇸 Sends a specific notification using the appropriate provider. Queries
+        go to the thread pool; only the send runs on the event loop.
         """
-        notificacion = self.db.query(Notificacion).filter(Notificacion.id == notificacion_id).first()
+        notificacion = await anyio.to_thread.run_sync(self._buscar, notificacion_id)
         if not notificacion:
             return False
         
         try:
             # Obtener el destinatario desde la base de datos
-            destinatario = notificacion.usuario.email  # Asumiendo que se usa el correo
+            destinatario = await anyio.to_thread.run_sync(
+                lambda: notificacion.usuario.email  # Asumiendo que se usa el correo
+            )
 
             # Obtener el proveedor adecuado para el canal de notificación
             provider = get_notification_provider(notificacion.canal)
@@ -75,25 +114,13 @@ class NotificationService:
                 metadata=notificacion.datos_adicionales
             )
             
-            if success:
-                notificacion.estado = EstadoNotificacion.ENVIADA
-                notificacion.fecha_envio = datetime.utcnow()
-            else:
-                notificacion.estado = EstadoNotificacion.FALLIDA
-            
-            self.db.commit()
+            await anyio.to_thread.run_sync(self._registrar_envio, notificacion, success)
             return success
         except Exception as e:
-            # Loguear el error
-            notificacion.estado = EstadoNotificacion.FALLIDA
-            notificacion.datos_adicionales = {
-                **(notificacion.datos_adicionales or {}),
-                "error": str(e)
-            }
-            self.db.commit()
+            await anyio.to_thread.run_sync(self._registrar_error, notificacion, e)
             return False
 
-    async def marcar_como_leida(self, notificacion_id: int) -> Optional[Notificacion]:
+    def marcar_como_leida(self, notificacion_id: int) -> Optional[Notificacion]:
         """
         🇪🇸 Marca una notificación como leída
         🇺🇸 Marks a notification as read
@@ -113,30 +140,29 @@ class NotificationService:
         🇪🇸 Obtiene un resumen de las notificaciones
         🇺🇸 Gets a notification summary
         """
-        # Contar notificaciones por estado
-        total_pendientes = self.db.query(func.count(Notificacion.id))\
-            .filter(Notificacion.estado == EstadoNotificacion.PENDIENTE).scalar() or 0
-        
-        total_enviadas = self.db.query(func.count(Notificacion.id))\
-            .filter(Notificacion.estado == EstadoNotificacion.ENVIADA).scalar() or 0
-        
-        total_fallidas = self.db.query(func.count(Notificacion.id))\
-            .filter(Notificacion.estado == EstadoNotificacion.FALLIDA).scalar() or 0
+        # 🇪🇸 Contadores mantenidos al escribir (models/resumen_notificacion.py): a lo
+        # sumo 100 filas, sin importar cuántas notificaciones haya
+        # 🇺🇸 Counters maintained on write (models/resumen_notificacion.py): at most
+        # 100 rows, no matter how many notifications there are
+        grupos = self.db.query(
+            ResumenNotificaciones.estado,
+            ResumenNotificaciones.tipo,
+            ResumenNotificaciones.canal,
+            ResumenNotificaciones.cantidad
+        ).all()
         
-        total_leidas = self.db.query(func.count(Notificacion.id))\
-            .filter(Notificacion.estado == EstadoNotificacion.LEIDA).scalar() or 0
+        por_estado = {estado: 0 for estado in EstadoNotificacion}
+        por_tipo = {tipo.value: 0 for tipo in TipoNotificacion}
+        por_canal = {canal.value: 0 for canal in CanalNotificacion}
+        for estado, tipo, canal, cantidad in grupos:
+            por_estado[estado] = por_estado.get(estado, 0) + cantidad
+            por_tipo[tipo.value] += cantidad
+            por_canal[canal.value] += cantidad
         
-        # Contar por tipo de notificación
-        por_tipo = {}
-        for tipo in TipoNotificacion:
-            por_tipo[tipo.value] = self.db.query(func.count(Notificacion.id))\
-                .filter(Notificacion.tipo == tipo).scalar() or 0
-        
-        # Contar por canal
-        por_canal = {}
-        for canal in CanalNotificacion:
-            por_canal[canal.value] = self.db.query(func.count(Notificacion.id))\
-                .filter(Notificacion.canal == canal).scalar() or 0
+        total_pendientes = por_estado[EstadoNotificacion.PENDIENTE]
+        total_enviadas = por_estado[EstadoNotificacion.ENVIADA]
+        total_fallidas = por_estado[EstadoNotificacion.FALLIDA]
+        total_leidas = por_estado[EstadoNotificacion.LEIDA]
         
         return {
             "total_pendientes": total_pendientes,
@@ -152,13 +178,18 @@ class NotificationService:
         🇪🇸 Reintenta enviar las notificaciones fallidas
         🇺🇸 Retries sending failed notifications
         """
-        notificaciones_fallidas = self.db.query(Notificacion)\
-            .filter(Notificacion.estado == EstadoNotificacion.FALLIDA)\
-            .all()
-        
-        exitos = 0
-        for notificacion in notificaciones_fallidas:
-            if await self.enviar_notificacion(notificacion.id):
-                exitos += 1
-        
-        return exitos 
\ No newline at end of file
+        resultado = await self.despachar([EstadoNotificacion.FALLIDA])
+        return resultado["enviadas"]
+
+    async def despachar(
+        self,
+        estados: Optional[List[EstadoNotificacion]] = None
+    ) -> Dict[str, Any]:
+        """
+        🇪🇸 Despacha por lotes y en paralelo las notificaciones en los estados dados
+        🇺🇸 Dispatches notifications in the given states in concurrent chunks
+        """
+        despachador = DespachadorNotificaciones(self.db)
+        if estados:
+            return await despachador.procesar(estados)
+        return await despachador.procesar() 
\ No newline at end of file
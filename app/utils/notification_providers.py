@@ -2,14 +2,15 @@
 🇪🇸 Proveedores de notificaciones
 🇺🇸 Notification providers
 """
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
-import smtplib
+import httpx
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-import requests
 from ..models.notificacion import CanalNotificacion
 from ..config import settings
+from .conexiones import PoolSMTP, crear_cliente_http
 
 class NotificationProvider(ABC):
     """
@@ -30,11 +31,57 @@ class NotificationProvider(ABC):
         """
         pass
 
+    async def iniciar(self) -> None:
+        """
+        🇪🇸 Prepara los recursos de larga duración (arranque de la aplicación)
+        🇺🇸 Prepares long-lived resources (application startup)
+        """
+
+    async def cerrar(self) -> None:
+        """
+        🇪🇸 Libera los recursos de larga duración (apagado de la aplicación)
+        🇺🇸 Releases long-lived resources (application shutdown)
+        """
+
+class HTTPNotificationProvider(NotificationProvider):
+    """
+    🇪🇸 Base para proveedores HTTP con un cliente asíncrono persistente
+    🇺🇸 Base for HTTP providers with a persistent async client
+    """
+    def __init__(self, cliente: Optional[httpx.AsyncClient] = None):
+        self._cliente = cliente
+
+    @property
+    def cliente(self) -> httpx.AsyncClient:
+        if self._cliente is None or self._cliente.is_closed:
+            self._cliente = crear_cliente_http()
+        return self._cliente
+
+    async def iniciar(self) -> None:
+        self.cliente
+
+    async def cerrar(self) -> None:
+        if self._cliente is not None:
+            await self._cliente.aclose()
+            self._cliente = None
+
 class EmailNotificationProvider(NotificationProvider):
     """
     🇪🇸 Proveedor de notificaciones por correo electrónico
     🇺🇸 Email notification provider
     """
+    def __init__(self, pool: Optional[PoolSMTP] = None):
+        self.pool = pool or PoolSMTP(
+            settings.SMTP_HOST,
+            settings.SMTP_PORT,
+            settings.SMTP_USERNAME,
+            settings.SMTP_PASSWORD,
+            max_conexiones=settings.SMTP_MAX_CONEXIONES
+        )
+
+    async def cerrar(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.pool.cerrar)
+
     async def send_notification(
         self,
         to: str,
@@ -56,15 +103,16 @@ class EmailNotificationProvider(NotificationProvider):
             # Contenido del mensaje
             msg.attach(MIMEText(message, 'plain'))
             
-            # Conexión con el servidor SMTP
-            server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
-            server.starttls()
-            server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-            
-            # Envío del correo
+            # 🇪🇸 Envío por una conexión del pool SMTP, fuera del event loop
+            # 🇺🇸 Send over a pooled SMTP connection, off the event loop
             text = msg.as_string()
-            server.sendmail(settings.SMTP_FROM_EMAIL, to, text)
-            server.quit()
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                self.pool.enviar,
+                settings.SMTP_FROM_EMAIL,
+                to,
+                text
+            )
             
             return True
         except Exception as e:
@@ -77,6 +125,20 @@ class SMSNotificationProvider(NotificationProvider):
     🇪🇸 Proveedor de notificaciones por SMS usando Twilio
     🇺🇸 SMS notification provider using Twilio
     """
+    def __init__(self):
+        self._client = None
+
+    @property
+    def client(self):
+        """
+        🇪🇸 Cliente de Twilio creado una sola vez y reutilizado
+        🇺🇸 Twilio client created once and reused
+        """
+        if self._client is None:
+            from twilio.rest import Client
+            self._client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+        return self._client
+
     async def send_notification(
         self,
         to: str,
@@ -89,16 +151,17 @@ class SMSNotificationProvider(NotificationProvider):
         🇺🇸 Sends an SMS
         """
         try:
-            from twilio.rest import Client
-            
-            # Inicializar cliente de Twilio
-            client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+            client = self.client
             
-            # Enviar SMS
-            message = client.messages.create(
-                body=f"{title}\n{message}",
-                from_=settings.TWILIO_PHONE_NUMBER,
-                to=to
+            # 🇪🇸 El SDK de Twilio es bloqueante: enviar el SMS en un hilo
+            # 🇺🇸 The Twilio SDK blocks: send the SMS in a thread
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                lambda: client.messages.create(
+                    body=f"{title}\n{message}",
+                    from_=settings.TWILIO_PHONE_NUMBER,
+                    to=to
+                )
             )
             
             return True
@@ -107,7 +170,7 @@ class SMSNotificationProvider(NotificationProvider):
             print(f"Error al enviar SMS: {str(e)}")
             return False
 
-class WhatsAppNotificationProvider(NotificationProvider):
+class WhatsAppNotificationProvider(HTTPNotificationProvider):
     """
     🇪🇸 Proveedor de notificaciones por WhatsApp
     🇺🇸 WhatsApp notification provider
@@ -143,8 +206,9 @@ class WhatsAppNotificationProvider(NotificationProvider):
                 }
             }
             
-            # Enviar la solicitud a la API
-            response = requests.post(url, headers=headers, json=payload)
+            # 🇪🇸 Enviar la solicitud con el cliente HTTP asíncrono compartido
+            # 🇺🇸 Send the request with the shared async HTTP client
+            response = await self.cliente.post(url, headers=headers, json=payload)
             
             return response.status_code == 200
         except Exception as e:
@@ -152,7 +216,7 @@ class WhatsAppNotificationProvider(NotificationProvider):
             print(f"Error al enviar mensaje de WhatsApp: {str(e)}")
             return False
 
-class TelegramNotificationProvider(NotificationProvider):
+class TelegramNotificationProvider(HTTPNotificationProvider):
     """
     🇪🇸 Proveedor de notificaciones por Telegram
     🇺🇸 Telegram notification provider
@@ -179,8 +243,9 @@ class TelegramNotificationProvider(NotificationProvider):
                 "parse_mode": "Markdown"
             }
             
-            # Enviar la solicitud a la API
-            response = requests.post(url, json=payload)
+            # 🇪🇸 Enviar la solicitud con el cliente HTTP asíncrono compartido
+            # 🇺🇸 Send the request with the shared async HTTP client
+            response = await self.cliente.post(url, json=payload)
             
             return response.status_code == 200
         except Exception as e:
@@ -208,22 +273,79 @@ class MockNotificationProvider(NotificationProvider):
         print(f"MOCK: Enviando notificación a {to} - Título: {title} - Mensaje: {message}")
         return True
 
-def get_notification_provider(canal: CanalNotificacion) -> NotificationProvider:
+class RegistroProveedores:
     """
-    🇪🇸 Factory para obtener el proveedor adecuado según el canal
-    🇺🇸 Factory to get the appropriate provider based on the channel
+    🇪🇸 Registro de proveedores por canal, construido una vez por proceso.
+    Permite reemplazar el proveedor de cualquier canal con `registrar`.
+    🇺🇸 Per-channel provider registry, built once per process.
+    Any channel's provider can be replaced with `registrar`.
     """
+    def __init__(self, por_defecto: Optional[NotificationProvider] = None):
+        self._proveedores: Dict[CanalNotificacion, NotificationProvider] = {}
+        self._por_defecto = por_defecto or MockNotificationProvider()
+
+    def registrar(self, canal: CanalNotificacion, proveedor: NotificationProvider) -> None:
+        """
+        🇪🇸 Asigna el proveedor de un canal
+        🇺🇸 Assigns a channel's provider
+        """
+        self._proveedores[canal] = proveedor
+
+    def obtener(self, canal: CanalNotificacion) -> NotificationProvider:
+        """
+        🇪🇸 Devuelve el proveedor del canal (o el proveedor por defecto)
+        🇺🇸 Returns the channel's provider (or the default provider)
+        """
+        return self._proveedores.get(canal, self._por_defecto)
+
+    async def iniciar(self) -> None:
+        """
+        🇪🇸 Inicia los recursos de todos los proveedores
+        🇺🇸 Starts every provider's resources
+        """
+        for proveedor in self._unicos():
+            await proveedor.iniciar()
+
+    async def cerrar(self) -> None:
+        """
+        🇪🇸 Cierra los recursos de todos los proveedores
+        🇺🇸 Closes every provider's resources
+        """
+        for proveedor in self._unicos():
+            await proveedor.cerrar()
+
+    def _unicos(self):
+        vistos = {}
+        for proveedor in [*self._proveedores.values(), self._por_defecto]:
+            vistos[id(proveedor)] = proveedor
+        return list(vistos.values())
+
+def crear_registro_proveedores() -> RegistroProveedores:
+    """
+    🇪🇸 Construye el registro según el entorno
+    🇺🇸 Builds the registry for the current environment
+    """
+    registro = RegistroProveedores()
+    
     # En ambiente de test, usamos el proveedor mock
     if settings.ENVIRONMENT == "test":
-        return MockNotificationProvider()
-        
-    # En producción/desarrollo, usamos los proveedores reales
-    providers = {
-        CanalNotificacion.EMAIL: EmailNotificationProvider(),
-        CanalNotificacion.SMS: SMSNotificationProvider(),
-        CanalNotificacion.WHATSAPP: WhatsAppNotificationProvider(),
-        CanalNotificacion.TELEGRAM: TelegramNotificationProvider(),
-        CanalNotificacion.PUSH: MockNotificationProvider(),  # No implementado aún
-    }
+        return registro
     
-    return providers.get(canal, MockNotificationProvider()) 
\ No newline at end of file
+    # En producción/desarrollo, usamos los proveedores reales
+    registro.registrar(CanalNotificacion.EMAIL, EmailNotificationProvider())
+    registro.registrar(CanalNotificacion.SMS, SMSNotificationProvider())
+    registro.registrar(CanalNotificacion.WHATSAPP, WhatsAppNotificationProvider())
+    registro.registrar(CanalNotificacion.TELEGRAM, TelegramNotificationProvider())
+    registro.registrar(CanalNotificacion.PUSH, MockNotificationProvider())  # No implementado aún
+    return registro
+
+# 🇪🇸 Registro único del proceso
+# 🇺🇸 Process-wide registry
+registro_proveedores = crear_registro_proveedores()
+
+def get_notification_provider(canal: CanalNotificacion) -> NotificationProvider:
+    """
+    🇪🇸 Obtiene el proveedor adecuado según el canal desde el registro
+    🇺🇸 Gets the appropriate provider for the channel from the registry
+    """
+    return registro_proveedores.obtener(canal)
@@ -0,0 +1,240 @@
+"""
+🇪🇸 Optimización del orden de visita de las rutas de cobranza
+(vecino más cercano + 2-opt sobre distancias haversine, sin servicios de mapas)
+🇺🇸 Visiting order optimization for collection routes
+(nearest neighbor + 2-opt over haversine distances, no map services)
+"""
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..models.cobranza import Cobranza
+
+RADIO_TIERRA_KM = 6371.0088
+
+# 🇪🇸 Por debajo de este número de cobradores no compensa arrancar procesos
+# 🇺🇸 Below this number of collectors starting processes does not pay off
+MIN_COBRADORES_PROCESOS = 16
+
+# 🇪🇸 Pool compartido, creado al arrancar la aplicación (ver `iniciar_pool`)
+# 🇺🇸 Shared pool, created when the application starts (see `iniciar_pool`)
+_pool: Optional[ProcessPoolExecutor] = None
+_procesos = 1
+
+def matriz_distancias(latitudes: Sequence[float], longitudes: Sequence[float]) -> np.ndarray:
+    """
+    🇪🇸 Distancias haversine en km entre todos los pares de puntos
+    🇺🇸 Haversine distances in km between every pair of points
+    """
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlon / 2) ** 2
+    return 2 * RADIO_TIERRA_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+def longitud_recorrido(distancias: np.ndarray, orden: Sequence[int]) -> float:
+    """
+    🇪🇸 Longitud del recorrido abierto que visita los puntos en `orden`
+    🇺🇸 Length of the open tour visiting the points in `orden`
+    """
+    orden = np.asarray(orden)
+    return float(distancias[orden[:-1], orden[1:]].sum())
+
+def vecino_mas_cercano(distancias: np.ndarray, inicio: int = 0) -> List[int]:
+    """
+    🇪🇸 Recorrido inicial: siempre al punto no visitado más cercano
+    🇺🇸 Initial tour: always to the nearest unvisited point
+    """
+    n = len(distancias)
+    visitado = np.zeros(n, dtype=bool)
+    orden = [inicio]
+    visitado[inicio] = True
+    actual = inicio
+    for _ in range(n - 1):
+        candidatas = np.where(visitado, np.inf, distancias[actual])
+        actual = int(np.argmin(candidatas))
+        visitado[actual] = True
+        orden.append(actual)
+    return orden
+
+def dos_opt(distancias: np.ndarray, orden: Sequence[int], fijar_inicio: bool = False) -> List[int]:
+    """
+    🇪🇸 Mejora un recorrido abierto invirtiendo tramos (2-opt, mejor mejora por paso).
+    Un nodo ficticio a distancia cero en ambos extremos permite mover también
+    el inicio y el final; con `fijar_inicio` el primer punto no se mueve.
+    🇺🇸 Improves an open tour by reversing segments (2-opt, best improvement per step).
+    A dummy node at zero distance on both ends lets the start and end move too;
+    with `fijar_inicio` the first point stays in place.
+    """
+    n = len(orden)
+    if n < 3:
+        return list(orden)
+    ficticio = len(distancias)
+    extendida = np.zeros((ficticio + 1, ficticio + 1))
+    extendida[:ficticio, :ficticio] = distancias
+    recorrido = np.array([ficticio, *orden, ficticio])
+    minimo_i = 2 if fijar_inicio else 1
+    superior = np.triu(np.ones((n, n), dtype=bool), k=1)
+    superior[:minimo_i - 1, :] = False
+
+    while True:
+        posiciones = extendida[recorrido][:, recorrido]
+        tramos = np.diagonal(posiciones, 1)
+        # 🇪🇸 Invertir recorrido[i..j]: quita (i-1, i) y (j, j+1), agrega (i-1, j) y (i, j+1)
+        # 🇺🇸 Reversing recorrido[i..j]: drops (i-1, i) and (j, j+1), adds (i-1, j) and (i, j+1)
+        delta = (
+            posiciones[:n, 1:n + 1]
+            + posiciones[1:n + 1, 2:n + 2]
+            - tramos[:n, None]
+            - tramos[None, 1:n + 1]
+        )
+        delta[~superior] = 0.0
+        mejor = int(np.argmin(delta))
+        if delta.flat[mejor] > -1e-9:
+            break
+        i, j = divmod(mejor, n)
+        recorrido[i + 1:j + 2] = recorrido[i + 1:j + 2][::-1].copy()
+
+    return recorrido[1:-1].tolist()
+
+def optimizar_orden(
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    origen: Optional[Tuple[float, float]] = None
+) -> List[int]:
+    """
+    🇪🇸 Orden de visita casi óptimo de las paradas (índices sobre la entrada).
+    Con `origen` (lat, lon) el recorrido parte de ese punto.
+    🇺🇸 Near-optimal visiting order of the stops (indices into the input).
+    With `origen` (lat, lon) the tour starts from that point.
+    """
+    if len(latitudes) == 0:
+        return []
+    if origen is not None:
+        latitudes = [origen[0], *latitudes]
+        longitudes = [origen[1], *longitudes]
+    distancias = matriz_distancias(latitudes, longitudes)
+    orden = dos_opt(distancias, vecino_mas_cercano(distancias), fijar_inicio=origen is not None)
+    if origen is not None:
+        return [indice - 1 for indice in orden[1:]]
+    return orden
+
+def _optimizar_grupo(argumentos) -> List[int]:
+    latitudes, longitudes, origen = argumentos
+    return optimizar_orden(latitudes, longitudes, origen)
+
+def iniciar_pool(procesos: Optional[int] = None) -> None:
+    """
+    🇪🇸 Crea el pool de procesos compartido por todas las peticiones. Usa `spawn`
+    para no heredar por `fork` los hilos, conexiones y locks del servidor.
+    Con un solo proceso no se crea y las rutas se optimizan en el mismo hilo.
+    🇺🇸 Creates the process pool shared by every request. Uses `spawn` so the
+    server's threads, connections and locks are not inherited through `fork`.
+    With a single process none is created and routes are optimized inline.
+    """
+    global _pool, _procesos
+    cerrar_pool()
+    _procesos = procesos or settings.RUTAS_PROCESOS or os.cpu_count() or 1
+    if _procesos > 1:
+        _pool = ProcessPoolExecutor(
+            max_workers=_procesos,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+def cerrar_pool() -> None:
+    """
+    🇪🇸 Cierra el pool compartido, si existe
+    🇺🇸 Shuts down the shared pool, if any
+    """
+    global _pool, _procesos
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+    _pool, _procesos = None, 1
+
+def optimizar_grupos(
+    grupos: List[Tuple[Sequence[float], Sequence[float]]],
+    origen: Optional[Tuple[float, float]] = None
+) -> List[List[int]]:
+    """
+    🇪🇸 Optimiza muchas rutas independientes, repartidas en el pool compartido
+    cuando está iniciado y hay suficientes; si no, en el hilo actual
+    🇺🇸 Optimizes many independent routes, spread over the shared pool when it
+    is started and there are enough of them; otherwise in the current thread
+    """
+    tareas = [(latitudes, longitudes, origen) for latitudes, longitudes in grupos]
+    if _pool is None or len(tareas) < MIN_COBRADORES_PROCESOS:
+        return [_optimizar_grupo(tarea) for tarea in tareas]
+    return list(_pool.map(_optimizar_grupo, tareas, chunksize=max(1, len(tareas) // (_procesos * 4))))
+
+def optimizar_rutas_del_dia(
+    db: Session,
+    fecha: date,
+    cobrador_id: Optional[int] = None,
+    origen: Optional[Tuple[float, float]] = None
+) -> Dict[str, Any]:
+    """
+    🇪🇸 Recalcula `orden_ruta` de las cobranzas del día de cada ruta (zona, cobrador),
+    igual que `rutas_del_dia`, y lo guarda en bloque. Las paradas sin coordenadas
+    quedan al final en su orden actual.
+    🇺🇸 Recomputes `orden_ruta` for the day's collections of each (zone, collector)
+    route, as in `rutas_del_dia`, and saves it in bulk. Stops without coordinates go
+    last in their current order.
+    """
+    inicio = time.perf_counter()
+    consulta = db.query(
+        Cobranza.id,
+        Cobranza.zona,
+        Cobranza.cobrador_id,
+        Cobranza.latitud,
+        Cobranza.longitud
+    ).filter(
+        Cobranza.fecha_programada >= fecha,
+        Cobranza.fecha_programada < fecha + timedelta(days=1)
+    )
+    if cobrador_id is not None:
+        consulta = consulta.filter(Cobranza.cobrador_id == cobrador_id)
+    filas = consulta.order_by(
+        Cobranza.zona,
+        Cobranza.cobrador_id,
+        Cobranza.orden_ruta,
+        Cobranza.id
+    ).all()
+
+    con_coordenadas, sin_coordenadas = [], []
+    for _, grupo in groupby(filas, key=itemgetter(1, 2)):
+        grupo = list(grupo)
+        con_coordenadas.append([f for f in grupo if f.latitud is not None and f.longitud is not None])
+        sin_coordenadas.append([f for f in grupo if f.latitud is None or f.longitud is None])
+
+    ordenes = optimizar_grupos(
+        [([f.latitud for f in paradas], [f.longitud for f in paradas]) for paradas in con_coordenadas],
+        origen
+    )
+
+    cambios = []
+    for paradas, orden, restantes in zip(con_coordenadas, ordenes, sin_coordenadas):
+        visitas = [paradas[i] for i in orden] + restantes
+        cambios.extend({"id": fila.id, "orden_ruta": posicion} for posicion, fila in enumerate(visitas, 1))
+
+    try:
+        if cambios:
+            db.bulk_update_mappings(Cobranza, cambios)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return {
+        "cobradores": len({fila.cobrador_id for fila in filas}),
+        "rutas": len(ordenes),
+        "paradas": len(cambios),
+        "segundos": time.perf_counter() - inicio,
+    }
@@ -0,0 +1,147 @@
+"""
+🇪🇸 Paginación por cursor (keyset) para los listados
+🇺🇸 Cursor (keyset) pagination for list endpoints
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi import HTTPException, Response, status
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+# 🇪🇸 Cabecera con el cursor de la página siguiente
+# 🇺🇸 Header carrying the next page cursor
+CABECERA_CURSOR = "X-Next-Cursor"
+
+LIMITE_POR_DEFECTO = 100
+LIMITE_MAXIMO = 1000
+
+def _error_cursor(detalle: str = "Cursor inválido") -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detalle)
+
+def _serializar(valor: Any) -> Any:
+    if isinstance(valor, (datetime, date)):
+        return valor.isoformat()
+    return valor
+
+def _deserializar(valor: Any, columna) -> Any:
+    if valor is None:
+        return None
+    tipo = columna.type.python_type
+    if tipo is datetime:
+        return datetime.fromisoformat(valor)
+    if tipo is date:
+        return date.fromisoformat(valor)
+    return tipo(valor)
+
+def codificar_cursor(datos: Dict[str, Any]) -> str:
+    """
+    🇪🇸 Codifica la posición de la última fila como un cursor opaco
+    🇺🇸 Encodes the last row's position as an opaque cursor
+    """
+    crudo = json.dumps(datos, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(crudo).decode().rstrip("=")
+
+def decodificar_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    🇪🇸 Decodifica un cursor opaco
+    🇺🇸 Decodes an opaque cursor
+    """
+    try:
+        relleno = "=" * (-len(cursor) % 4)
+        datos = json.loads(base64.urlsafe_b64decode(cursor + relleno))
+    except (ValueError, TypeError):
+        raise _error_cursor()
+    if not isinstance(datos, dict) or "id" not in datos:
+        raise _error_cursor()
+    return datos
+
+def paginar(
+    query: Query,
+    modelo,
+    cursor: Optional[str] = None,
+    limit: int = LIMITE_POR_DEFECTO,
+    orden: Optional[str] = None,
+    columnas_orden: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    🇪🇸 Aplica paginación por cursor sobre `(columna de orden, id)`.
+    `orden` es el nombre de una columna permitida; con prefijo `-` ordena descendente.
+    Devuelve los elementos de la página y el cursor de la siguiente (o None).
+
+    🇺🇸 Applies cursor pagination over `(sort column, id)`.
+    `orden` is an allowed column name; a `-` prefix sorts descending.
+    Returns the page items and the next page cursor (or None).
+    """
+    columnas_orden = columnas_orden or {}
+    descendente = bool(orden) and orden.startswith("-")
+    nombre = orden.lstrip("-") if orden else "id"
+    if nombre != "id" and nombre not in columnas_orden:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Orden no permitido: {nombre}"
+        )
+
+    columna_id = modelo.id
+    columna = columnas_orden.get(nombre) if nombre != "id" else None
+
+    # 🇪🇸 Las columnas que admiten NULL ordenan los nulos al final (al principio en
+    # descendente) con una clave explícita, igual en todos los motores
+    # 🇺🇸 Nullable columns sort NULLs last (first when descending) with an explicit
+    # key, the same on every engine
+    admite_nulos = columna is not None and getattr(columna, "nullable", True)
+
+    if cursor:
+        datos = decodificar_cursor(cursor)
+        if datos.get("o") != orden:
+            raise _error_cursor("El cursor no corresponde al orden solicitado")
+        try:
+            ultimo_id = int(datos["id"])
+            valor = _deserializar(datos.get("v"), columna) if columna is not None else None
+        except (ValueError, TypeError):
+            raise _error_cursor()
+        siguiente_id = columna_id < ultimo_id if descendente else columna_id > ultimo_id
+        if columna is None:
+            condicion = siguiente_id
+        elif valor is None and admite_nulos:
+            # 🇪🇸 La página terminó en un nulo: quedan más nulos y, en descendente, los no nulos
+            # 🇺🇸 The page ended on a NULL: more NULLs remain and, descending, the non-NULLs
+            condicion = and_(columna.is_(None), siguiente_id)
+            if descendente:
+                condicion = or_(condicion, columna.isnot(None))
+        else:
+            mayor = columna < valor if descendente else columna > valor
+            condicion = or_(mayor, and_(columna == valor, siguiente_id))
+            if admite_nulos and not descendente:
+                condicion = or_(condicion, columna.is_(None))
+        query = query.filter(condicion)
+
+    criterios = []
+    if admite_nulos:
+        criterios.append(columna.is_(None))
+    if columna is not None:
+        criterios.append(columna)
+    criterios.append(columna_id)
+    query = query.order_by(*[c.desc() if descendente else c.asc() for c in criterios])
+
+    # 🇪🇸 Se pide una fila extra para saber si hay página siguiente
+    # 🇺🇸 One extra row is fetched to know whether there is a next page
+    filas = query.limit(limit + 1).all()
+    if len(filas) <= limit:
+        return filas, None
+
+    filas = filas[:limit]
+    ultima = filas[-1]
+    siguiente = {"o": orden, "id": ultima.id}
+    if columna is not None:
+        siguiente["v"] = _serializar(getattr(ultima, columna.key))
+    return filas, codificar_cursor(siguiente)
+
+def publicar_cursor(response: Response, siguiente: Optional[str]) -> None:
+    """
+    🇪🇸 Expone el cursor de la página siguiente en la cabecera de la respuesta
+    🇺🇸 Exposes the next page cursor in the response header
+    """
+    if siguiente:
+        response.headers[CABECERA_CURSOR] = siguiente
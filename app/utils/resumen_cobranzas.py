@@ -0,0 +1,177 @@
+"""
+🇪🇸 Mantenimiento del resumen diario de cobranzas
+🇺🇸 Daily collection summary maintenance
+"""
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+from ..models.cobranza import Cobranza, EstadoCobranza, a_utc
+from ..models.resumen_cobranza import ResumenCobranzaDiario
+from .upsert import upsert_acumulado
+
+# 🇪🇸 Aporte de una cobranza al resumen: (fecha, zona, cobrador_id, estado, esperado, recibido)
+# 🇺🇸 A collection's contribution to the summary: (date, zone, collector_id, state, expected, received)
+Aporte = Tuple[date, str, int, EstadoCobranza, float, float]
+
+# 🇪🇸 Aportes ya agrupados: (fecha, zona, cobrador_id, estado, cantidad, esperado, recibido)
+# 🇺🇸 Already grouped contributions: (date, zone, collector_id, state, count, expected, received)
+Grupo = Tuple[date, str, int, EstadoCobranza, int, float, float]
+
+CLAVE = ("fecha", "zona", "cobrador_id", "estado")
+
+def dia(fecha) -> date:
+    """
+    🇪🇸 Día UTC de una fecha programada; coincide con `_dia_sql` en la base
+    🇺🇸 UTC day of a scheduled date; matches `_dia_sql` in the database
+    """
+    return a_utc(fecha).date() if isinstance(fecha, datetime) else fecha
+
+def _dia_sql(db: Session):
+    """
+    🇪🇸 Día UTC de `Cobranza.fecha_programada` en SQL. PostgreSQL guarda el instante
+    y `date()` usaría la zona de la sesión; los demás motores ya guardan la hora UTC.
+    🇺🇸 UTC day of `Cobranza.fecha_programada` in SQL. PostgreSQL stores the instant
+    and `date()` would use the session time zone; other engines already store UTC time.
+    """
+    columna = Cobranza.fecha_programada
+    if db.get_bind().dialect.name == "postgresql":
+        columna = func.timezone("UTC", columna)
+    return func.date(columna)
+
+def aporte(cobranza: Cobranza) -> Aporte:
+    """
+    🇪🇸 Calcula el aporte de una cobranza a su fila del resumen
+    🇺🇸 Computes a collection's contribution to its summary row
+    """
+    return (
+        dia(cobranza.fecha_programada),
+        cobranza.zona,
+        cobranza.cobrador_id,
+        cobranza.estado or EstadoCobranza.PENDIENTE,
+        cobranza.monto_esperado or 0.0,
+        cobranza.monto_recibido or 0.0,
+    )
+
+def _upsert(db: Session, filas: List[Dict]) -> None:
+    """
+    🇪🇸 Suma los deltas a las filas existentes o las crea (ver utils/upsert.py)
+    🇺🇸 Adds the deltas to existing rows or creates them (see utils/upsert.py)
+    """
+    upsert_acumulado(db.connection(), ResumenCobranzaDiario.__table__, CLAVE, filas)
+
+def acumular(
+    db: Session,
+    antes: Iterable[Optional[Aporte]] = (),
+    despues: Iterable[Optional[Aporte]] = ()
+) -> None:
+    """
+    🇪🇸 Aplica al resumen la diferencia entre los aportes previos y los nuevos.
+    Debe llamarse en la misma transacción que el cambio de las cobranzas.
+    🇺🇸 Applies to the summary the difference between previous and new contributions.
+    Must be called in the same transaction as the collections change.
+    """
+    acumular_grupos(
+        db,
+        antes=((*a[:4], 1, a[4], a[5]) for a in antes if a is not None),
+        despues=((*a[:4], 1, a[4], a[5]) for a in despues if a is not None)
+    )
+
+def acumular_grupos(db: Session, antes: Iterable[Grupo] = (), despues: Iterable[Grupo] = ()) -> None:
+    """
+    🇪🇸 Igual que `acumular`, pero con aportes ya agrupados (ver `agrupar`)
+    🇺🇸 Same as `acumular`, but with already grouped contributions (see `agrupar`)
+    """
+    deltas: Dict[tuple, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+    for signo, grupos in ((-1, antes), (1, despues)):
+        for g in grupos:
+            delta = deltas[g[:4]]
+            delta[0] += signo * g[4]
+            delta[1] += signo * g[5]
+            delta[2] += signo * g[6]
+
+    filas = [
+        {
+            "fecha": clave[0],
+            "zona": clave[1],
+            "cobrador_id": clave[2],
+            "estado": clave[3],
+            "cantidad": cantidad,
+            "monto_esperado": esperado,
+            "monto_recibido": recibido,
+        }
+        for clave, (cantidad, esperado, recibido) in deltas.items()
+        if cantidad or esperado or recibido
+    ]
+    if filas:
+        _upsert(db, filas)
+
+def agrupar(db: Session, *condiciones) -> List[Grupo]:
+    """
+    🇪🇸 Aportes al resumen de las cobranzas que cumplen `condiciones`, agrupados en SQL
+    🇺🇸 Summary contributions of the collections matching `condiciones`, grouped in SQL
+    """
+    dia_sql = _dia_sql(db)
+    grupos = db.query(
+        dia_sql,
+        Cobranza.zona,
+        Cobranza.cobrador_id,
+        Cobranza.estado,
+        func.count(Cobranza.id),
+        func.coalesce(func.sum(Cobranza.monto_esperado), 0),
+        func.coalesce(func.sum(Cobranza.monto_recibido), 0)
+    ).filter(*condiciones).group_by(
+        dia_sql, Cobranza.zona, Cobranza.cobrador_id, Cobranza.estado
+    ).all()
+    return [
+        (
+            date.fromisoformat(fecha) if isinstance(fecha, str) else fecha,
+            zona,
+            cobrador_id,
+            estado or EstadoCobranza.PENDIENTE,
+            cantidad,
+            esperado,
+            recibido,
+        )
+        for fecha, zona, cobrador_id, estado, cantidad, esperado, recibido in grupos
+    ]
+
+def recalcular(db: Session, fecha_inicio: date, fecha_fin: date) -> int:
+    """
+    🇪🇸 Reconstruye el resumen de un rango de días desde `cobranzas` (carga inicial
+    o tras actualizaciones masivas). No confirma la transacción.
+    🇺🇸 Rebuilds the summary for a day range from `cobranzas` (initial load or after
+    bulk updates). Does not commit the transaction.
+    """
+    db.query(ResumenCobranzaDiario).filter(
+        ResumenCobranzaDiario.fecha >= fecha_inicio,
+        ResumenCobranzaDiario.fecha <= fecha_fin
+    ).delete(synchronize_session=False)
+
+    inicio = datetime.combine(fecha_inicio, datetime.min.time(), tzinfo=timezone.utc)
+    fin = datetime.combine(fecha_fin + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc)
+    grupos = agrupar(db, Cobranza.fecha_programada >= inicio, Cobranza.fecha_programada < fin)
+    filas = [dict(zip(CLAVE + ("cantidad", "monto_esperado", "monto_recibido"), g)) for g in grupos]
+    if filas:
+        db.execute(insert(ResumenCobranzaDiario), filas)
+    return len(filas)
+
+if __name__ == "__main__":
+    import argparse
+    from ..database import SessionLocal
+
+    parser = argparse.ArgumentParser(
+        description="Reconstruye el resumen diario de cobranzas / Rebuilds the daily collection summary"
+    )
+    parser.add_argument("desde", type=date.fromisoformat)
+    parser.add_argument("hasta", type=date.fromisoformat)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        filas = recalcular(db, args.desde, args.hasta)
+        db.commit()
+        print(f"Filas del resumen reconstruidas / Summary rows rebuilt: {filas}")
+    finally:
+        db.close()
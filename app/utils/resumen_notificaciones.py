@@ -0,0 +1,56 @@
+"""
+🇪🇸 Reconstrucción de los contadores de notificaciones por estado, tipo y canal
+🇺🇸 Rebuild of the notification counters by state, type and channel
+
+🇪🇸 Los contadores se mantienen al escribir (ver models/resumen_notificacion.py); esto
+es para la carga inicial o tras inserciones masivas fuera del ORM.
+🇺🇸 The counters are maintained on write (see models/resumen_notificacion.py); this is
+for the initial load or after bulk inserts outside the ORM.
+"""
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from ..models.notificacion import Notificacion, EstadoNotificacion
+from ..models.resumen_notificacion import CLAVE, ResumenNotificaciones
+from .upsert import upsert_acumulado
+
+def recalcular(db: Session) -> int:
+    """
+    🇪🇸 Reconstruye los contadores desde `notificaciones`. No confirma la transacción.
+    🇺🇸 Rebuilds the counters from `notificaciones`. Does not commit the transaction.
+    """
+    db.query(ResumenNotificaciones).delete(synchronize_session=False)
+    grupos = db.query(
+        Notificacion.estado,
+        Notificacion.tipo,
+        Notificacion.canal,
+        func.count(Notificacion.id)
+    ).group_by(
+        Notificacion.estado,
+        Notificacion.tipo,
+        Notificacion.canal
+    ).all()
+    # 🇪🇸 Las notificaciones sin estado cuentan como pendientes; el upsert une ambos grupos
+    # 🇺🇸 Notifications without a state count as pending; the upsert merges both groups
+    filas = [
+        {
+            "estado": estado or EstadoNotificacion.PENDIENTE,
+            "tipo": tipo,
+            "canal": canal,
+            "cantidad": cantidad,
+        }
+        for estado, tipo, canal, cantidad in grupos
+    ]
+    if filas:
+        upsert_acumulado(db.connection(), ResumenNotificaciones.__table__, CLAVE, filas)
+    return len(filas)
+
+if __name__ == "__main__":
+    from ..database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        filas = recalcular(db)
+        db.commit()
+        print(f"Contadores de notificaciones reconstruidos / Notification counters rebuilt: {filas}")
+    finally:
+        db.close()
@@ -0,0 +1,101 @@
+"""
+🇪🇸 Contadores de saldo de los préstamos, mantenidos con cada cambio de pago
+🇺🇸 Loan balance counters, maintained on every payment change
+"""
+from typing import Iterable, Optional, Tuple
+from sqlalchemy import case, func, literal, select, update
+from sqlalchemy.orm import Session
+from ..models.pago import Pago, EstadoPago
+from ..models.prestamo import Prestamo, EstadoPrestamo
+
+# 🇪🇸 Estado y monto de una cuota antes o después de un cambio
+# 🇺🇸 An installment's state and amount before or after a change
+EstadoCuota = Tuple[EstadoPago, float]
+
+def estado_cuota(pago: Pago) -> EstadoCuota:
+    """
+    🇪🇸 Captura el estado de una cuota para calcular luego la diferencia
+    🇺🇸 Captures an installment's state to compute the difference later
+    """
+    return (pago.estado or EstadoPago.PENDIENTE, pago.monto or 0.0)
+
+def _contadores(cuota: Optional[EstadoCuota]) -> Tuple[int, int, float]:
+    """
+    🇪🇸 Aporte de una cuota a (pagadas, pendientes, saldo)
+    🇺🇸 An installment's contribution to (paid, pending, balance)
+    """
+    if cuota is None:
+        return 0, 0, 0.0
+    estado, monto = cuota
+    if estado == EstadoPago.PAGADO:
+        return 1, 0, 0.0
+    return 0, 1, monto
+
+def actualizar_saldo(
+    db: Session,
+    prestamo_id: int,
+    antes: Optional[EstadoCuota] = None,
+    despues: Optional[EstadoCuota] = None
+) -> None:
+    """
+    🇪🇸 Aplica al préstamo la diferencia entre el estado previo y el nuevo de una cuota
+    con un único UPDATE atómico; marca el préstamo COMPLETADO cuando no quedan cuotas
+    por pagar. Debe llamarse en la misma transacción que el cambio del pago.
+    🇺🇸 Applies to the loan the difference between an installment's previous and new
+    state with a single atomic UPDATE; marks the loan COMPLETADO when no installments
+    are left to pay. Must be called in the same transaction as the payment change.
+    """
+    actualizar_saldo_cuotas(db, prestamo_id, [(antes, despues)])
+
+def actualizar_saldo_cuotas(
+    db: Session,
+    prestamo_id: int,
+    cambios: Iterable[Tuple[Optional[EstadoCuota], Optional[EstadoCuota]]]
+) -> None:
+    """
+    🇪🇸 Igual que `actualizar_saldo` para varios cambios (antes, después) de cuotas
+    del mismo préstamo, con un solo UPDATE
+    🇺🇸 Same as `actualizar_saldo` for several (before, after) installment changes
+    of the same loan, with a single UPDATE
+    """
+    delta_pagadas = delta_pendientes = 0
+    delta_saldo = 0.0
+    for antes, despues in cambios:
+        pagadas_antes, pendientes_antes, saldo_antes = _contadores(antes)
+        pagadas_despues, pendientes_despues, saldo_despues = _contadores(despues)
+        delta_pagadas += pagadas_despues - pagadas_antes
+        delta_pendientes += pendientes_despues - pendientes_antes
+        delta_saldo += saldo_despues - saldo_antes
+    if not (delta_pagadas or delta_pendientes or delta_saldo):
+        return
+
+    # 🇪🇸 Hace falta el pago ya escrito para recalcular la próxima cuota
+    # 🇺🇸 The payment must be written to recompute the next installment
+    db.flush()
+
+    pendientes = Prestamo.cuotas_pendientes + delta_pendientes
+    proxima_cuota = select(func.min(Pago.fecha_programada)).where(
+        Pago.prestamo_id == Prestamo.id,
+        Pago.estado != EstadoPago.PAGADO
+    ).scalar_subquery()
+    completado = literal(EstadoPrestamo.COMPLETADO, Prestamo.estado.type)
+    activo = literal(EstadoPrestamo.ACTIVO, Prestamo.estado.type)
+
+    # 🇪🇸 `estado` va primero: MySQL evalúa las asignaciones de izquierda a derecha
+    # 🇺🇸 `estado` goes first: MySQL evaluates assignments left to right
+    db.execute(
+        update(Prestamo)
+        .where(Prestamo.id == prestamo_id)
+        .ordered_values(
+            (Prestamo.estado, case(
+                (pendientes <= 0, completado),
+                (Prestamo.estado == EstadoPrestamo.COMPLETADO, activo),
+                else_=Prestamo.estado
+            )),
+            (Prestamo.cuotas_pagadas, Prestamo.cuotas_pagadas + delta_pagadas),
+            (Prestamo.cuotas_pendientes, pendientes),
+            (Prestamo.saldo_pendiente, Prestamo.saldo_pendiente + delta_saldo),
+            (Prestamo.fecha_proxima_cuota, proxima_cuota),
+        )
+        .execution_options(synchronize_session=False)
+    )
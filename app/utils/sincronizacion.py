@@ -0,0 +1,172 @@
+"""
+🇪🇸 Aplicación por lotes de las operaciones registradas sin conexión por los cobradores
+🇺🇸 Batch application of the operations recorded offline by collectors
+"""
+from collections import defaultdict
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Dict, List, Set
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+from ..models.cobranza import Cobranza, EstadoCobranza
+from ..models.pago import Pago, EstadoPago
+from ..models.sincronizacion import OperacionSincronizada
+from ..schemas.sincronizacion import LoteSincronizacion
+from .morosidad import sincronizar_atraso
+from .resumen_cobranzas import acumular, aporte
+from .saldos import actualizar_saldo_cuotas, estado_cuota
+
+APLICADA = "aplicada"
+DUPLICADA = "duplicada"
+NO_ENCONTRADA = "no_encontrada"
+
+DETALLES = {
+    APLICADA: None,
+    DUPLICADA: "Clave de idempotencia ya recibida; la operación no se volvió a aplicar",
+    NO_ENCONTRADA: "No existe {tipo} con id {id}",
+}
+
+def _aplicar_cobranzas(db: Session, operaciones, ahora: datetime) -> Set[int]:
+    """
+    🇪🇸 Aplica los cambios de cobranzas con un UPDATE por lotes y mueve sus aportes
+    en el resumen. Devuelve los ids existentes.
+    🇺🇸 Applies the collection changes with a batched UPDATE and moves their
+    contributions in the summary. Returns the existing ids.
+    """
+    ids = {op.cobranza_id for op in operaciones}
+    if not ids:
+        return set()
+    filas = db.execute(
+        select(
+            Cobranza.id,
+            Cobranza.fecha_programada,
+            Cobranza.zona,
+            Cobranza.cobrador_id,
+            Cobranza.estado,
+            Cobranza.monto_esperado,
+            Cobranza.monto_recibido
+        ).where(Cobranza.id.in_(ids)).with_for_update()
+    ).all()
+    actuales = {fila.id: SimpleNamespace(**fila._asdict()) for fila in filas}
+    antes = [aporte(cobranza) for cobranza in actuales.values()]
+
+    cambios: Dict[int, dict] = defaultdict(dict)
+    for op in operaciones:
+        if op.cobranza_id not in actuales:
+            continue
+        valores = op.cambios.dict(exclude_unset=True)
+        # 🇪🇸 Igual que PUT /cobranzas, pero respeta la hora registrada en el teléfono
+        # 🇺🇸 Same as PUT /cobranzas, but keeps the time recorded on the phone
+        if op.cambios.estado == EstadoCobranza.COMPLETADA:
+            valores.setdefault("fecha_realizada", ahora)
+        vars(actuales[op.cobranza_id]).update(valores)
+        cambios[op.cobranza_id].update(valores)
+
+    if cambios:
+        db.bulk_update_mappings(Cobranza, [{"id": id_, **valores} for id_, valores in cambios.items()])
+        acumular(db, antes=antes, despues=[aporte(cobranza) for cobranza in actuales.values()])
+    return set(actuales)
+
+def _aplicar_pagos(db: Session, operaciones, ahora: datetime) -> Set[int]:
+    """
+    🇪🇸 Aplica los cambios de cuotas con un UPDATE por lotes y un UPDATE de
+    contadores por préstamo. Devuelve los ids existentes.
+    🇺🇸 Applies the installment changes with a batched UPDATE and one counter
+    UPDATE per loan. Returns the existing ids.
+    """
+    ids = {op.pago_id for op in operaciones}
+    if not ids:
+        return set()
+    filas = db.execute(
+        select(Pago.id, Pago.prestamo_id, Pago.monto, Pago.estado)
+        .where(Pago.id.in_(ids)).with_for_update()
+    ).all()
+    actuales = {fila.id: SimpleNamespace(**fila._asdict()) for fila in filas}
+    antes = {id_: estado_cuota(pago) for id_, pago in actuales.items()}
+
+    cambios: Dict[int, dict] = defaultdict(dict)
+    for op in operaciones:
+        pago = actuales.get(op.pago_id)
+        if pago is None:
+            continue
+        valores = op.cambios.dict(exclude_unset=True)
+        if op.cambios.estado == EstadoPago.PAGADO and pago.estado != EstadoPago.PAGADO:
+            valores.setdefault("fecha_pago", ahora)
+        vars(pago).update(valores)
+        cambios[op.pago_id].update(valores)
+    if not cambios:
+        return set(actuales)
+
+    db.bulk_update_mappings(Pago, [{"id": id_, **valores} for id_, valores in cambios.items()])
+
+    # 🇪🇸 Contadores y atraso, una vez por préstamo
+    # 🇺🇸 Counters and overdue state, once per loan
+    por_prestamo = defaultdict(list)
+    for id_ in cambios:
+        por_prestamo[actuales[id_].prestamo_id].append((antes[id_], estado_cuota(actuales[id_])))
+    for prestamo_id, cuotas in por_prestamo.items():
+        actualizar_saldo_cuotas(db, prestamo_id, cuotas)
+        if any(EstadoPago.ATRASADO in (a[0], d[0]) for a, d in cuotas):
+            sincronizar_atraso(db, prestamo_id)
+    return set(actuales)
+
+def aplicar_lote(db: Session, lote: LoteSincronizacion, usuario_id: int) -> List[dict]:
+    """
+    🇪🇸 Aplica un lote de la app móvil en una sola transacción. Las claves de
+    idempotencia ya vistas para el usuario (en la base o antes en el mismo lote) no
+    se vuelven a aplicar. No confirma la transacción. Devuelve un resultado por operación.
+    🇺🇸 Applies a mobile app batch in a single transaction. Idempotency keys
+    already seen for the user (in the database or earlier in the same batch) are not applied
+    again. Does not commit. Returns one outcome per operation.
+    """
+    operaciones = (
+        [("cobranza", op.cobranza_id, op) for op in lote.cobranzas]
+        + [("pago", op.pago_id, op) for op in lote.pagos]
+    )
+    claves = {op.clave_idempotencia for _, _, op in operaciones}
+    vistas = set(db.execute(
+        select(OperacionSincronizada.clave).where(
+            OperacionSincronizada.usuario_id == usuario_id,
+            OperacionSincronizada.clave.in_(claves)
+        )
+    ).scalars()) if claves else set()
+
+    nuevas = []
+    for tipo, id_, op in operaciones:
+        if op.clave_idempotencia not in vistas:
+            vistas.add(op.clave_idempotencia)
+            nuevas.append((tipo, id_, op))
+
+    ahora = datetime.utcnow()
+    existentes = {
+        "cobranza": _aplicar_cobranzas(db, [op for tipo, _, op in nuevas if tipo == "cobranza"], ahora),
+        "pago": _aplicar_pagos(db, [op for tipo, _, op in nuevas if tipo == "pago"], ahora),
+    }
+    resultados_nuevos = {
+        id(op): APLICADA if id_ in existentes[tipo] else NO_ENCONTRADA
+        for tipo, id_, op in nuevas
+    }
+    if nuevas:
+        db.execute(insert(OperacionSincronizada), [
+            {
+                "clave": op.clave_idempotencia,
+                "usuario_id": usuario_id,
+                "tipo": tipo,
+                "objeto_id": id_,
+                "resultado": resultados_nuevos[id(op)],
+            }
+            for tipo, id_, op in nuevas
+        ])
+
+    resultados = []
+    for tipo, id_, op in operaciones:
+        resultado = resultados_nuevos.get(id(op), DUPLICADA)
+        detalle = DETALLES[resultado]
+        resultados.append({
+            "clave_idempotencia": op.clave_idempotencia,
+            "tipo": tipo,
+            "id": id_,
+            "resultado": resultado,
+            "detalle": detalle.format(tipo=tipo, id=id_) if detalle else None,
+        })
+    return resultados
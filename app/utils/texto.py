@@ -0,0 +1,29 @@
+"""
+🇪🇸 Normalización de texto para búsquedas (sin tildes, minúsculas)
+🇺🇸 Text normalization for searches (accent-free, lowercase)
+"""
+import re
+import unicodedata
+from typing import Optional
+
+_NO_ALFANUMERICO = re.compile(r"[^0-9a-z]+")
+
+def normalizar(texto: Optional[str]) -> str:
+    """
+    🇪🇸 Quita tildes, pasa a minúsculas y deja solo letras y dígitos separados por
+    un espacio: "  Peña-Gómez " -> "pena gomez"
+    🇺🇸 Strips accents, lowercases and keeps only letters and digits separated by a
+    single space: "  Peña-Gómez " -> "pena gomez"
+    """
+    if not texto:
+        return ""
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    sin_tildes = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return _NO_ALFANUMERICO.sub(" ", sin_tildes.lower()).strip()
+
+def compactar(texto: Optional[str]) -> str:
+    """
+    🇪🇸 Como `normalizar`, pero sin separadores: "1.234.567-8" -> "12345678"
+    🇺🇸 Like `normalizar`, but without separators: "1.234.567-8" -> "12345678"
+    """
+    return normalizar(texto).replace(" ", "")
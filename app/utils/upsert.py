@@ -0,0 +1,70 @@
+"""
+🇪🇸 Upsert acumulativo para las tablas de resumen, según el motor
+🇺🇸 Accumulating upsert for the summary tables, per engine
+"""
+from typing import Dict, List, Sequence
+from sqlalchemy import Table, and_, bindparam, insert, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+
+def upsert_acumulado(conexion: Connection, tabla: Table, clave: Sequence[str], filas: List[Dict]) -> None:
+    """
+    🇪🇸 Suma a las filas existentes de `tabla` (identificadas por las columnas `clave`,
+    con restricción única) los valores del resto de columnas de `filas`, o las crea.
+    Un solo executemany con el upsert nativo de SQLite, PostgreSQL y MySQL.
+    🇺🇸 Adds to the existing rows of `tabla` (identified by the `clave` columns, under
+    a unique constraint) the values of the remaining columns of `filas`, or creates
+    them. A single executemany with the native upsert of SQLite, PostgreSQL and MySQL.
+    """
+    acumuladas = [c for c in filas[0] if c not in clave]
+    dialecto = conexion.dialect.name
+    if dialecto in ("sqlite", "postgresql"):
+        if dialecto == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as insert_dialecto
+        else:
+            from sqlalchemy.dialects.postgresql import insert as insert_dialecto
+        stmt = insert_dialecto(tabla)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[tabla.c[c] for c in clave],
+            set_={c: tabla.c[c] + stmt.excluded[c] for c in acumuladas}
+        )
+    elif dialecto == "mysql":
+        from sqlalchemy.dialects.mysql import insert as insert_dialecto
+        stmt = insert_dialecto(tabla)
+        stmt = stmt.on_duplicate_key_update({c: tabla.c[c] + stmt.inserted[c] for c in acumuladas})
+    else:
+        upsert_acumulado_generico(conexion, tabla, clave, filas)
+        return
+    conexion.execute(stmt, filas)
+
+def upsert_acumulado_generico(
+    conexion: Connection,
+    tabla: Table,
+    clave: Sequence[str],
+    filas: List[Dict]
+) -> None:
+    """
+    🇪🇸 Alternativa para motores sin upsert nativo: UPDATE por fila y, si no había
+    fila, INSERT. Si otra transacción la insertó a la vez, se repite el UPDATE.
+    🇺🇸 Fallback for engines without a native upsert: one UPDATE per row and, when
+    there was no row, an INSERT. If another transaction inserted it meanwhile, the
+    UPDATE is retried.
+    """
+    acumuladas = [c for c in filas[0] if c not in clave]
+    # 🇪🇸 Un bindparam con el nombre de una columna del UPDATE está reservado
+    # 🇺🇸 A bindparam named like an UPDATE column is reserved
+    actualizar = update(tabla).where(
+        and_(*(tabla.c[c] == bindparam(f"_{c}") for c in clave))
+    ).values({c: tabla.c[c] + bindparam(f"delta_{c}") for c in acumuladas})
+    for fila in filas:
+        parametros = {
+            **{f"_{c}": fila[c] for c in clave},
+            **{f"delta_{c}": fila[c] for c in acumuladas},
+        }
+        if conexion.execute(actualizar, parametros).rowcount:
+            continue
+        try:
+            with conexion.begin_nested():
+                conexion.execute(insert(tabla), fila)
+        except IntegrityError:
+            conexion.execute(actualizar, parametros)
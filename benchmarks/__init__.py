@@ -0,0 +1,4 @@
+"""
+🇪🇸 Benchmarks de rendimiento (se ejecutan con `python -m benchmarks.<nombre>`)
+🇺🇸 Performance benchmarks (run with `python -m benchmarks.<name>`)
+"""
@@ -0,0 +1,85 @@
+"""
+🇪🇸 Benchmark de la búsqueda de clientes
+🇺🇸 Client search benchmark
+
+Uso / Usage:
+    python -m benchmarks.bench_busqueda_clientes [numero_clientes]
+"""
+import sys
+import time
+import numpy as np
+from sqlalchemy import func, insert, or_
+from app.models.cliente import Cliente, campos_busqueda
+from app.utils.busqueda_clientes import buscar_clientes
+from benchmarks.comun import crear_sesion, cronometro
+
+NOMBRES = ["José", "María", "Ana", "Luis", "Carlos", "Lucía", "Andrés", "Sofía", "Jesús", "Ramón"]
+APELLIDOS = ["Peña", "Gómez", "Pérez", "Rodríguez", "Martínez", "Núñez", "Díaz", "Ibáñez", "Castaño", "Muñoz"]
+CALLES = ["Calle", "Carrera", "Avenida", "Diagonal", "Transversal"]
+
+CONSULTAS = ["pena", "Núñez Díaz lu", "MARIA JOSE go", "1000123", "3105", "carrera 12"]
+
+def poblar(db, cantidad: int) -> None:
+    """
+    🇪🇸 Inserta clientes con nombres, teléfonos y direcciones aleatorios
+    🇺🇸 Inserts clients with random names, phones and addresses
+    """
+    rng = np.random.default_rng(3)
+    for inicio in range(0, cantidad, 50_000):
+        filas = []
+        for i in range(inicio, min(inicio + 50_000, cantidad)):
+            nombre = f"{NOMBRES[rng.integers(10)]} {NOMBRES[rng.integers(10)]}"
+            apellido = f"{APELLIDOS[rng.integers(10)]} {APELLIDOS[rng.integers(10)]}"
+            datos = {
+                "cedula": str(1_000_000 + i),
+                "nombre": nombre,
+                "apellido": apellido,
+                "telefono": f"3{rng.integers(0, 10**9):09d}",
+                "direccion": f"{CALLES[rng.integers(5)]} {rng.integers(1, 200)} # {rng.integers(1, 100)}-{rng.integers(1, 100)}",
+                "email": f"cliente{i}@example.com",
+                "activo": True,
+            }
+            filas.append({**datos, **campos_busqueda(
+                datos["cedula"], nombre, apellido, datos["telefono"], datos["direccion"]
+            )})
+        db.execute(insert(Cliente), filas)
+    db.commit()
+
+def buscar_sin_indices(db, consulta: str, limite: int = 20):
+    """
+    🇪🇸 Búsqueda ingenua: LIKE '%texto%' sobre las columnas originales (recorre la tabla)
+    🇺🇸 Naive search: LIKE '%text%' over the original columns (scans the table)
+    """
+    patron = f"%{consulta.lower()}%"
+    return db.query(Cliente.id).filter(or_(
+        Cliente.cedula.like(patron),
+        Cliente.telefono.like(patron),
+        func.lower(Cliente.nombre + " " + Cliente.apellido).like(patron),
+        func.lower(Cliente.direccion).like(patron),
+    )).limit(limite).all()
+
+def medir(etiqueta: str, funcion, repeticiones: int = 5) -> None:
+    tiempos = []
+    for _ in range(repeticiones):
+        for consulta in CONSULTAS:
+            inicio = time.perf_counter()
+            funcion(consulta)
+            tiempos.append(time.perf_counter() - inicio)
+    tiempos = np.array(tiempos) * 1000
+    print(f"{etiqueta}: p50 {np.percentile(tiempos, 50):.2f} ms, p95 {np.percentile(tiempos, 95):.2f} ms")
+
+def main(cantidad: int = 500_000) -> None:
+    db = crear_sesion()
+    with cronometro(f"Carga de {cantidad:,} clientes / Loading"):
+        poblar(db, cantidad)
+
+    medir("Antes / Before: LIKE '%texto%' sin índice", lambda q: buscar_sin_indices(db, q), repeticiones=1)
+    medir("Después / After: prefijos normalizados indexados", lambda q: buscar_clientes(db, q))
+
+    for consulta in CONSULTAS:
+        resultados = buscar_clientes(db, consulta, 3)
+        print(f"  {consulta!r}: {[(r['nombre'], r['apellido'], r['coincidencia']) for r in resultados]}")
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*argumentos)
@@ -0,0 +1,122 @@
+"""
+🇪🇸 Benchmark del reporte de cartera vencida
+🇺🇸 Portfolio aging report benchmark
+
+Uso / Usage:
+    python -m benchmarks.bench_cartera [numero_prestamos]
+"""
+import sys
+from datetime import datetime, timedelta
+import numpy as np
+from sqlalchemy import case, func, insert, literal, select
+from app.models.cliente import Cliente
+from app.models.pago import Pago, EstadoPago
+from app.models.prestamo import Prestamo, EstadoPrestamo, FrecuenciaPago
+from app.models.ruta import Ruta
+from app.utils.cartera import TRAMOS, reporte_cartera
+from benchmarks.comun import crear_sesion, cronometro
+
+CUOTAS = 10
+CORTE = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+
+def poblar(db, cantidad: int) -> None:
+    """
+    🇪🇸 Inserta préstamos semanales de 10 cuotas con un número aleatorio de cuotas
+    pagadas y los contadores de saldo coherentes con sus cuotas
+    🇺🇸 Inserts 10-installment weekly loans with a random number of paid
+    installments and balance counters consistent with them
+    """
+    rng = np.random.default_rng(11)
+    zonas = ["Norte", "Sur", "Centro", "Oriente", "Occidente"]
+    db.execute(insert(Ruta), [
+        {"id": i + 1, "nombre": f"Ruta {i + 1}", "zona": zonas[i % 5], "cobrador_id": i % 20 + 1}
+        for i in range(50)
+    ])
+    clientes = cantidad // 2
+    db.execute(insert(Cliente), [
+        {"id": i + 1, "cedula": str(i), "nombre": "Cliente", "apellido": str(i),
+         "telefono": "300", "direccion": "Calle 1", "email": f"c{i}@example.com",
+         "ruta_id": int(rng.integers(1, 51)) if i % 10 else None, "activo": True}
+        for i in range(clientes)
+    ])
+
+    for inicio in range(0, cantidad, 10_000):
+        prestamos, pagos = [], []
+        for prestamo_id in range(inicio + 1, min(inicio + 10_000, cantidad) + 1):
+            fecha_inicio = CORTE - timedelta(days=int(rng.integers(0, 150)))
+            pagadas = int(rng.integers(0, CUOTAS + 1))
+            monto = float(rng.integers(1, 20)) * 100
+            valor_cuota = monto * 1.2 / CUOTAS
+            fechas = [fecha_inicio + timedelta(weeks=n) for n in range(1, CUOTAS + 1)]
+            prestamos.append({
+                "id": prestamo_id, "cliente_id": int(rng.integers(1, clientes + 1)),
+                "monto": monto, "interes": 20.0, "plazo": CUOTAS,
+                "frecuencia_pago": FrecuenciaPago.SEMANAL, "fecha_inicio": fecha_inicio,
+                "fecha_fin": fechas[-1],
+                "estado": EstadoPrestamo.COMPLETADO if pagadas == CUOTAS else EstadoPrestamo.ACTIVO,
+                "monto_total": monto * 1.2, "valor_cuota": valor_cuota,
+                "cuotas_pagadas": pagadas, "cuotas_pendientes": CUOTAS - pagadas,
+                "saldo_pendiente": valor_cuota * (CUOTAS - pagadas),
+                "fecha_proxima_cuota": fechas[pagadas] if pagadas < CUOTAS else None,
+            })
+            pagos.extend(
+                {"prestamo_id": prestamo_id, "numero_cuota": n + 1, "monto": valor_cuota,
+                 "fecha_programada": fecha,
+                 "fecha_pago": fecha + timedelta(days=int(atraso)) if n < pagadas else None,
+                 "estado": EstadoPago.PAGADO if n < pagadas else EstadoPago.PENDIENTE}
+                for n, (fecha, atraso) in enumerate(zip(fechas, rng.choice([0, 0, 0, 1, 3], CUOTAS)))
+            )
+        db.execute(insert(Prestamo), prestamos)
+        db.execute(insert(Pago), pagos)
+    db.commit()
+
+def totales_desde_cuotas(db):
+    """
+    🇪🇸 Enfoque anterior: agrupar las cuotas impagas de cada préstamo antes de clasificarlo
+    🇺🇸 Previous approach: group each loan's unpaid installments before bucketing it
+    """
+    impagas = (
+        select(
+            Pago.prestamo_id,
+            func.min(Pago.fecha_programada).label("vence"),
+            func.sum(Pago.monto).label("saldo"),
+        )
+        .where(Pago.estado != EstadoPago.PAGADO)
+        .group_by(Pago.prestamo_id)
+        .subquery()
+    )
+    casos = [(impagas.c.vence >= CORTE, literal(TRAMOS[0][0]))]
+    for nombre, dias in TRAMOS[1:-1]:
+        casos.append((impagas.c.vence >= CORTE - timedelta(days=dias), literal(nombre)))
+    por_prestamo = (
+        select(case(*casos, else_=literal(TRAMOS[-1][0])).label("tramo"), impagas.c.saldo)
+        .join_from(impagas, Prestamo, Prestamo.id == impagas.c.prestamo_id)
+        .where(Prestamo.estado.in_([EstadoPrestamo.ACTIVO, EstadoPrestamo.ATRASADO]))
+        .subquery()
+    )
+    filas = db.execute(
+        select(por_prestamo.c.tramo, func.count(), func.sum(por_prestamo.c.saldo))
+        .group_by(por_prestamo.c.tramo)
+    )
+    return {tramo: (prestamos, round(saldo, 2)) for tramo, prestamos, saldo in filas}
+
+def main(cantidad: int = 100_000) -> None:
+    db = crear_sesion()
+    with cronometro(f"Carga de {cantidad:,} préstamos y {cantidad * CUOTAS:,} cuotas / Loading"):
+        poblar(db, cantidad)
+
+    with cronometro("Antes / Before: agrupando las cuotas"):
+        esperado = totales_desde_cuotas(db)
+    with cronometro("Después / After: contadores de saldo, una consulta"):
+        reporte = reporte_cartera(db, CORTE.date())
+
+    obtenido = {t["tramo"]: (t["prestamos"], t["saldo"]) for t in reporte["totales"] if t["prestamos"]}
+    assert obtenido == esperado, (obtenido, esperado)
+    for total in reporte["totales"]:
+        print(f"  {total['tramo']:>7}: {total['prestamos']:>6} préstamos, saldo {total['saldo']:>14,.2f}, "
+              f"capital {total['capital']:>14,.2f}, interés {total['interes']:>12,.2f}")
+    print(f"  {len(reporte['filas'])} filas por zona, cobrador y tramo / rows by zone, collector and bucket")
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*argumentos)
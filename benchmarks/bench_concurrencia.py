@@ -0,0 +1,99 @@
+"""
+🇪🇸 Benchmark de peticiones/segundo con clientes concurrentes: endpoint `async def`
+con sesión síncrona (bloquea el event loop) frente a `def` (pool de hilos)
+🇺🇸 Requests/second benchmark with concurrent clients: `async def` endpoint with
+a synchronous session (blocks the event loop) versus `def` (thread pool)
+
+Uso / Usage:
+    python -m benchmarks.bench_concurrencia [clientes] [peticiones] [latencia_ms]
+"""
+import asyncio
+import logging
+import sys
+import time
+import anyio
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from app.config import settings
+from app.models.cliente import Cliente
+from benchmarks.comun import crear_sesion
+
+def crear_app(engine, latencia_ms: float) -> FastAPI:
+    """
+    🇪🇸 App con la misma consulta servida de las dos formas; cada sentencia SQL
+    espera `latencia_ms` para simular la ida y vuelta a un servidor de base de datos
+    🇺🇸 App serving the same query both ways; every SQL statement waits
+    `latencia_ms` to simulate the round trip to a database server
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def _latencia(*args):
+        time.sleep(latencia_ms / 1000)
+
+    SesionBench = sessionmaker(bind=engine)
+
+    def get_db():
+        db = SesionBench()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+
+    @app.get("/async")
+    async def clientes_async(db: Session = Depends(get_db)):
+        return [c.id for c in db.query(Cliente).limit(50).all()]
+
+    @app.get("/hilos")
+    def clientes_hilos(db: Session = Depends(get_db)):
+        return [c.id for c in db.query(Cliente).limit(50).all()]
+
+    return app
+
+async def medir(app: FastAPI, ruta: str, clientes: int, peticiones: int) -> float:
+    """
+    🇪🇸 Lanza `peticiones` repartidas entre `clientes` concurrentes y devuelve peticiones/s
+    🇺🇸 Fires `peticiones` spread across `clientes` concurrent clients and returns requests/s
+    """
+    transporte = httpx.ASGITransport(app=app)
+    pendientes = iter(range(peticiones))
+
+    async with httpx.AsyncClient(transport=transporte, base_url="http://bench") as cliente:
+        async def trabajador():
+            for _ in pendientes:
+                respuesta = await cliente.get(ruta)
+                respuesta.raise_for_status()
+
+        inicio = time.perf_counter()
+        await asyncio.gather(*(trabajador() for _ in range(clientes)))
+        return peticiones / (time.perf_counter() - inicio)
+
+async def principal(clientes: int, peticiones: int, latencia_ms: float) -> None:
+    db = crear_sesion()
+    db.add_all(Cliente(nombre=f"c{i}", apellido="x", cedula=str(i), telefono="0") for i in range(50))
+    db.commit()
+    db.close()
+
+    # 🇪🇸 Un pool más chico que los clientes bloquea por completo la variante `async def`:
+    # el event loop espera una conexión que solo se libera al volver al event loop
+    # 🇺🇸 A pool smaller than the clients fully stalls the `async def` variant:
+    # the event loop waits for a connection that is only released back on the event loop
+    engine = create_engine(db.get_bind().url, pool_size=clientes, max_overflow=0)
+    app = crear_app(engine, latencia_ms)
+    # 🇪🇸 Igual que en el arranque de la aplicación / 🇺🇸 Same as on application startup
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_TAMANO
+
+    print(f"{clientes} clientes, {peticiones} peticiones, {latencia_ms} ms por consulta")
+    for ruta, etiqueta in (("/async", "async def + Session síncrona"), ("/hilos", "def (pool de hilos)")):
+        rps = await medir(app, ruta, clientes, peticiones)
+        print(f"{etiqueta}: {rps:,.0f} peticiones/s")
+
+if __name__ == "__main__":
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    argumentos = [float(a) for a in sys.argv[1:]]
+    clientes = int(argumentos[0]) if len(argumentos) > 0 else 200
+    peticiones = int(argumentos[1]) if len(argumentos) > 1 else 2000
+    latencia_ms = argumentos[2] if len(argumentos) > 2 else 5.0
+    asyncio.run(principal(clientes, peticiones, latencia_ms))
@@ -0,0 +1,69 @@
+"""
+🇪🇸 Benchmark del motor de cronogramas: 100k préstamos
+🇺🇸 Schedule engine benchmark: 100k loans
+
+Uso / Usage:
+    python -m benchmarks.bench_cronograma [numero_prestamos]
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+import numpy as np
+from app.utils.cronograma import calcular_cronogramas
+
+FRECUENCIAS = ["diario", "semanal", "quincenal", "mensual"]
+
+def _cronograma_iterativo(fecha_inicio, plazo, frecuencia):
+    """
+    🇪🇸 Referencia: el cálculo cuota a cuota que reemplaza el motor
+    🇺🇸 Reference: the one-installment-at-a-time loop the engine replaces
+    """
+    fechas = []
+    fecha_actual = fecha_inicio
+    for _ in range(plazo):
+        if frecuencia == "diario":
+            fecha_actual += timedelta(days=1)
+        elif frecuencia == "semanal":
+            fecha_actual += timedelta(weeks=1)
+        elif frecuencia == "quincenal":
+            fecha_actual += timedelta(days=15)
+        elif frecuencia == "mensual":
+            fecha_actual += timedelta(days=30)
+        fechas.append(fecha_actual)
+    return fechas
+
+def main(numero_prestamos: int = 100_000) -> None:
+    rng = np.random.default_rng(42)
+    inicio = datetime(2024, 1, 1, 8)
+    fechas_inicio = [inicio + timedelta(days=int(d)) for d in rng.integers(0, 365, numero_prestamos)]
+    plazos = rng.integers(1, 121, numero_prestamos).tolist()
+    frecuencias = [FRECUENCIAS[i] for i in rng.integers(0, 4, numero_prestamos)]
+    montos = rng.uniform(100, 5000, numero_prestamos).tolist()
+    intereses = rng.uniform(5, 30, numero_prestamos).tolist()
+
+    t0 = time.perf_counter()
+    cronograma = calcular_cronogramas(fechas_inicio, montos, intereses, plazos, frecuencias)
+    t_motor = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    calcular_cronogramas(
+        fechas_inicio, montos, intereses, plazos, frecuencias, omitir_domingos=True
+    )
+    t_habiles = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for fecha, plazo, frecuencia in zip(fechas_inicio, plazos, frecuencias):
+        _cronograma_iterativo(fecha, plazo, frecuencia)
+    t_iterativo = time.perf_counter() - t0
+
+    cuotas = len(cronograma.fecha_programada)
+    print(f"Préstamos / Loans: {numero_prestamos:,}  Cuotas / Installments: {cuotas:,}")
+    print(f"Motor vectorizado / Vectorized engine: {t_motor:.3f}s "
+          f"({numero_prestamos / t_motor:,.0f} préstamos/s)")
+    print(f"Motor sin domingos / Engine skipping Sundays: {t_habiles:.3f}s "
+          f"({numero_prestamos / t_habiles:,.0f} préstamos/s)")
+    print(f"Bucle iterativo / Iterative loop: {t_iterativo:.3f}s "
+          f"({numero_prestamos / t_iterativo:,.0f} préstamos/s)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
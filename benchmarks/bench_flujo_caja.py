@@ -0,0 +1,32 @@
+"""
+🇪🇸 Benchmark de la proyección de flujo de caja
+🇺🇸 Cash-flow projection benchmark
+
+Uso / Usage:
+    python -m benchmarks.bench_flujo_caja [numero_prestamos]
+"""
+import sys
+from benchmarks.bench_cartera import CORTE, CUOTAS, poblar
+from benchmarks.comun import crear_sesion, cronometro
+from app.utils.flujo_caja import proyectar_flujo_caja
+
+def main(cantidad: int = 100_000) -> None:
+    db = crear_sesion()
+    with cronometro(f"Carga de {cantidad:,} préstamos y {cantidad * CUOTAS:,} cuotas / Loading"):
+        poblar(db, cantidad)
+
+    desde = CORTE.date()
+    with cronometro("30 días sin descontar / 30 days, not discounted"):
+        simple = proyectar_flujo_caja(db, 30, desde)
+    with cronometro("30 días descontados por historial / 30 days, discounted by history"):
+        descontada = proyectar_flujo_caja(db, 30, desde, descontar=True)
+    with cronometro("90 días descontados / 90 days, discounted"):
+        proyectar_flujo_caja(db, 90, desde, descontar=True)
+
+    assert simple["total_esperado"] == descontada["total_esperado"]
+    print(f"  {len(simple['filas'])} filas; esperado {simple['total_esperado']:,.2f}, "
+          f"ajustado {descontada['total_ajustado']:,.2f} (tasa general {descontada['tasa_general']})")
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*argumentos)
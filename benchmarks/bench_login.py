@@ -0,0 +1,125 @@
+"""
+🇪🇸 Prueba de carga: latencia de otros endpoints durante una ráfaga de logins, con
+bcrypt dentro de un `async def` (bloquea el event loop) frente al login actual
+(consultas en el pool de hilos y bcrypt en sus propios hilos acotados)
+🇺🇸 Load test: latency of other endpoints during a login storm, with bcrypt inside
+an `async def` (blocks the event loop) versus the current login (queries on the
+thread pool and bcrypt on its own bounded threads)
+
+Uso / Usage:
+    python -m benchmarks.bench_login [logins_concurrentes] [logins_por_cliente]
+"""
+import asyncio
+import logging
+import sys
+import time
+import anyio
+import httpx
+import numpy as np
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from app.config import settings
+from app.database import get_db
+from app.models.usuario import Usuario
+from app.routers import auth
+from app.utils.auth import get_password_hash, pwd_context
+from benchmarks.comun import crear_sesion
+
+def crear_app(engine) -> FastAPI:
+    """
+    🇪🇸 App con el login actual, el login con bcrypt en el event loop y un endpoint liviano
+    🇺🇸 App with the current login, the login with bcrypt on the event loop and a light endpoint
+    """
+    SesionBench = sessionmaker(bind=engine)
+
+    def get_db_bench():
+        db = SesionBench()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(auth.router, prefix="/auth")
+    app.dependency_overrides[get_db] = get_db_bench
+
+    @app.post("/auth-bloqueante/login")
+    async def login_bloqueante(
+        db: Session = Depends(get_db_bench),
+        form_data: OAuth2PasswordRequestForm = Depends()
+    ):
+        user = db.query(Usuario).filter(Usuario.email == form_data.username).first()
+        if not user or not pwd_context.verify(form_data.password, user.hashed_password):
+            raise HTTPException(status_code=401)
+        return {"id": user.id}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+async def medir(app: FastAPI, prefijo: str, concurrentes: int, por_cliente: int) -> np.ndarray:
+    """
+    🇪🇸 Latencias (ms) de /ping mientras `concurrentes` clientes hacen login
+    🇺🇸 Latencies (ms) of /ping while `concurrentes` clients log in
+    """
+    transporte = httpx.ASGITransport(app=app)
+    latencias = []
+    async with httpx.AsyncClient(transport=transporte, base_url="http://bench") as cliente:
+        async def logins():
+            for _ in range(por_cliente):
+                respuesta = await cliente.post(
+                    f"{prefijo}/login", data={"username": "cobrador@example.com", "password": "secreto"}
+                )
+                respuesta.raise_for_status()
+
+        async def sonda(tormenta):
+            # 🇪🇸 Una sonda cada 10 ms según un calendario fijo; la latencia se mide desde
+            # el momento previsto, así cuenta también la espera mientras el loop está bloqueado
+            # 🇺🇸 One probe every 10 ms on a fixed schedule; latency is measured from the
+            # planned time, so it also counts the wait while the loop is blocked
+            prevista = time.perf_counter()
+            while not tormenta.done():
+                (await cliente.get("/ping")).raise_for_status()
+                latencias.append((time.perf_counter() - prevista) * 1000)
+                prevista += 0.01
+                await asyncio.sleep(max(0.0, prevista - time.perf_counter()))
+
+        tormenta = asyncio.ensure_future(asyncio.gather(*(logins() for _ in range(concurrentes))))
+        await sonda(tormenta)
+        await tormenta
+    return np.array(latencias)
+
+async def principal(concurrentes: int, por_cliente: int) -> None:
+    db = crear_sesion()
+    db.add(Usuario(email="cobrador@example.com", nombre="Cobrador",
+                   hashed_password=get_password_hash("secreto"), rol_id=1, is_active=True))
+    db.commit()
+    db.close()
+    # 🇪🇸 Una conexión por login: con menos, la variante bloqueante se traba esperando
+    # una conexión que solo se libera al volver al event loop
+    # 🇺🇸 One connection per login: with fewer, the blocking variant stalls waiting for
+    # a connection that is only released back on the event loop
+    engine = create_engine(db.get_bind().url, pool_size=concurrentes, max_overflow=0)
+    app = crear_app(engine)
+    # 🇪🇸 Igual que en el arranque de la aplicación / 🇺🇸 Same as on application startup
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_TAMANO
+
+    print(f"{concurrentes} logins concurrentes x {por_cliente}, bcrypt rounds={settings.BCRYPT_ROUNDS}")
+    for prefijo, etiqueta in (("/auth-bloqueante", "Antes / Before: bcrypt en el event loop"),
+                              ("/auth", "Después / After: bcrypt en hilos acotados")):
+        inicio = time.perf_counter()
+        latencias = await medir(app, prefijo, concurrentes, por_cliente)
+        print(f"{etiqueta}: /ping p50 {np.percentile(latencias, 50):.1f} ms, "
+              f"p99 {np.percentile(latencias, 99):.1f} ms, máx {latencias.max():.1f} ms "
+              f"({len(latencias)} sondas, {time.perf_counter() - inicio:.1f} s)")
+
+if __name__ == "__main__":
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    argumentos = [int(a) for a in sys.argv[1:]]
+    concurrentes = argumentos[0] if len(argumentos) > 0 else 20
+    por_cliente = argumentos[1] if len(argumentos) > 1 else 2
+    asyncio.run(principal(concurrentes, por_cliente))
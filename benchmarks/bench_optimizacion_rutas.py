@@ -0,0 +1,109 @@
+"""
+🇪🇸 Benchmark de la optimización del orden de las rutas de cobranza
+🇺🇸 Collection route order optimization benchmark
+
+Uso / Usage:
+    python -m benchmarks.bench_optimizacion_rutas [numero_cobradores] [paradas_por_cobrador] [procesos]
+"""
+import os
+import sys
+from datetime import date, datetime, timedelta
+import numpy as np
+from sqlalchemy import insert
+from app.models.cobranza import Cobranza, EstadoCobranza
+from app.utils.optimizacion_rutas import (
+    matriz_distancias,
+    longitud_recorrido,
+    vecino_mas_cercano,
+    optimizar_grupos,
+    optimizar_rutas_del_dia,
+    iniciar_pool,
+    cerrar_pool
+)
+from benchmarks.comun import crear_sesion, cronometro
+
+DIA = date(2024, 5, 3)
+
+# 🇪🇸 Recuadro aproximado de una ciudad (Bogotá)
+# 🇺🇸 Approximate bounding box of a city (Bogotá)
+LATITUD = (4.50, 4.80)
+LONGITUD = (-74.20, -74.00)
+
+def generar_grupos(cobradores: int, paradas: int):
+    """
+    🇪🇸 Paradas aleatorias por cobrador dentro del recuadro de la ciudad
+    🇺🇸 Random stops per collector inside the city's bounding box
+    """
+    rng = np.random.default_rng(11)
+    return [
+        (rng.uniform(*LATITUD, paradas).tolist(), rng.uniform(*LONGITUD, paradas).tolist())
+        for _ in range(cobradores)
+    ]
+
+def poblar(db, grupos) -> None:
+    """
+    🇪🇸 Inserta las cobranzas del día con sus coordenadas
+    🇺🇸 Inserts the day's collections with their coordinates
+    """
+    inicio = datetime.combine(DIA, datetime.min.time()) + timedelta(hours=7)
+    paradas = len(grupos[0][0]) if grupos else 0
+    db.execute(insert(Cobranza), [
+        {
+            "pago_id": (cobrador_id - 1) * paradas + i,
+            "cobrador_id": cobrador_id,
+            "monto_esperado": 50.0,
+            "zona": "Centro",
+            "direccion_cobro": f"Calle {i}",
+            "fecha_programada": inicio,
+            "orden_ruta": i,
+            "latitud": latitud,
+            "longitud": longitud,
+            "estado": EstadoCobranza.PENDIENTE,
+            "intentos": 0,
+            "requiere_supervisor": False,
+            "fecha_creacion": inicio,
+        }
+        for cobrador_id, (latitudes, longitudes) in enumerate(grupos, 1)
+        for i, (latitud, longitud) in enumerate(zip(latitudes, longitudes), 1)
+    ])
+    db.commit()
+
+def longitud_total(grupos, ordenes) -> float:
+    return sum(
+        longitud_recorrido(matriz_distancias(latitudes, longitudes), orden)
+        for (latitudes, longitudes), orden in zip(grupos, ordenes)
+    )
+
+def main(cobradores: int = 300, paradas: int = 80, procesos: int = 0) -> None:
+    procesos = procesos or os.cpu_count() or 1
+    grupos = generar_grupos(cobradores, paradas)
+    print(f"{cobradores} cobradores x {paradas} paradas, {os.cpu_count()} núcleos / cores")
+
+    sin_optimizar = longitud_total(grupos, [list(range(paradas))] * cobradores)
+    with cronometro("Vecino más cercano / Nearest neighbor"):
+        cercanos = [
+            vecino_mas_cercano(matriz_distancias(latitudes, longitudes))
+            for latitudes, longitudes in grupos
+        ]
+    with cronometro("Vecino más cercano + 2-opt, 1 proceso / 1 process"):
+        serie = optimizar_grupos(grupos)
+    iniciar_pool(procesos)
+    if procesos > 1:
+        with cronometro(f"Vecino más cercano + 2-opt, {procesos} procesos / processes"):
+            paralelo = optimizar_grupos(grupos)
+        assert paralelo == serie
+
+    print(f"Km sin optimizar / unoptimized: {sin_optimizar:,.0f}")
+    print(f"Km vecino más cercano / nearest neighbor: {longitud_total(grupos, cercanos):,.0f}")
+    print(f"Km 2-opt: {longitud_total(grupos, serie):,.0f}")
+
+    db = crear_sesion()
+    poblar(db, grupos)
+    with cronometro("Endpoint completo (lectura + cálculo + escritura) / Full endpoint"):
+        resultado = optimizar_rutas_del_dia(db, DIA)
+    cerrar_pool()
+    assert resultado["paradas"] == cobradores * paradas
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*argumentos)
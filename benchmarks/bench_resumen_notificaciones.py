@@ -0,0 +1,71 @@
+"""
+🇪🇸 Benchmark de NotificationService.obtener_resumen
+🇺🇸 NotificationService.obtener_resumen benchmark
+
+Uso / Usage:
+    python -m benchmarks.bench_resumen_notificaciones [numero_notificaciones] [limite_ms]
+"""
+import sys
+import numpy as np
+from sqlalchemy import insert
+from app.models.notificacion import (
+    Notificacion,
+    TipoNotificacion,
+    CanalNotificacion,
+    EstadoNotificacion
+)
+from app.utils.notificaciones import NotificationService
+from app.utils.resumen_notificaciones import recalcular
+from benchmarks.comun import crear_sesion, cronometro
+
+LOTE = 200_000
+
+def poblar(db, cantidad: int) -> None:
+    """
+    🇪🇸 Inserta notificaciones aleatorias por lotes
+    🇺🇸 Inserts random notifications in batches
+    """
+    rng = np.random.default_rng(7)
+    estados, tipos, canales = list(EstadoNotificacion), list(TipoNotificacion), list(CanalNotificacion)
+    for desde in range(0, cantidad, LOTE):
+        n = min(LOTE, cantidad - desde)
+        e, t, c = rng.integers(0, 4, n), rng.integers(0, 5, n), rng.integers(0, 5, n)
+        db.execute(insert(Notificacion), [
+            {
+                "tipo": tipos[t[i]],
+                "canal": canales[c[i]],
+                "estado": estados[e[i]],
+                "titulo": "t",
+                "mensaje": "m",
+                "usuario_id": 1,
+            }
+            for i in range(n)
+        ])
+        db.commit()
+
+def main(cantidad: int = 10_000_000, limite_ms: float = None) -> None:
+    db = crear_sesion()
+    with cronometro(f"Carga de {cantidad:,} notificaciones / Loading"):
+        poblar(db, cantidad)
+
+    # 🇪🇸 La carga es masiva (fuera del ORM): los contadores se reconstruyen una vez
+    # 🇺🇸 The load is bulk (outside the ORM): the counters are rebuilt once
+    with cronometro("recalcular (GROUP BY completo / full GROUP BY)"):
+        recalcular(db)
+        db.commit()
+
+    servicio = NotificationService(db)
+    servicio.obtener_resumen()  # 🇪🇸 calentamiento / 🇺🇸 warm-up
+    with cronometro("obtener_resumen (contadores / counters)") as medida:
+        resumen = servicio.obtener_resumen()
+    assert sum(resumen["por_tipo"].values()) == cantidad
+
+    if limite_ms is not None and medida["segundos"] * 1000 > limite_ms:
+        print(f"FALLO / FAIL: supera {limite_ms} ms")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else None
+    )
@@ -0,0 +1,83 @@
+"""
+🇪🇸 Benchmark del endpoint de rutas de cobranza del día
+🇺🇸 Daily collection route endpoint benchmark
+
+Uso / Usage:
+    python -m benchmarks.bench_rutas_cobranza [numero_cobranzas] [numero_cobradores]
+"""
+import json
+import sys
+from datetime import date, datetime, timedelta
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert
+from app.models.cobranza import Cobranza, EstadoCobranza
+from app.routers.cobranza import rutas_del_dia, json_por_defecto
+from app.schemas.cobranza import RutaCobranza
+from benchmarks.comun import crear_sesion, cronometro
+
+DIA = date(2024, 5, 3)
+
+def poblar(db, cantidad: int, cobradores: int) -> None:
+    """
+    🇪🇸 Inserta las cobranzas de un día repartidas entre zonas y cobradores
+    🇺🇸 Inserts one day's collections spread across zones and collectors
+    """
+    rng = np.random.default_rng(7)
+    cobrador = rng.integers(1, cobradores + 1, cantidad)
+    minutos = rng.integers(0, 12 * 60, cantidad)
+    inicio = datetime.combine(DIA, datetime.min.time()) + timedelta(hours=7)
+    db.execute(insert(Cobranza), [
+        {
+            "pago_id": i + 1,
+            "cobrador_id": int(cobrador[i]),
+            "monto_esperado": 50.0,
+            "zona": f"Zona {int(cobrador[i]) % 20}",
+            "direccion_cobro": f"Calle {i}",
+            "fecha_programada": inicio + timedelta(minutes=int(minutos[i])),
+            "orden_ruta": i,
+            "estado": EstadoCobranza.PENDIENTE,
+            "intentos": 0,
+            "requiere_supervisor": False,
+            "fecha_creacion": inicio,
+        }
+        for i in range(cantidad)
+    ])
+    db.commit()
+
+def rutas_orm(db, fecha: date) -> str:
+    """
+    🇪🇸 Implementación anterior: objetos ORM, dict en Python y modelos pydantic anidados
+    🇺🇸 Previous implementation: ORM objects, Python dict and nested pydantic models
+    """
+    rutas = db.query(Cobranza).filter(
+        Cobranza.fecha_programada >= fecha,
+        Cobranza.fecha_programada < fecha + timedelta(days=1)
+    ).order_by(Cobranza.zona, Cobranza.cobrador_id, Cobranza.orden_ruta).all()
+    agrupadas = {}
+    for cobranza in rutas:
+        agrupadas.setdefault((cobranza.zona, cobranza.cobrador_id), []).append(cobranza)
+    modelos = [
+        RutaCobranza(id=i, fecha=fecha, cobrador_id=cobrador_id, zona=zona, cobranzas=cobranzas)
+        for i, ((zona, cobrador_id), cobranzas) in enumerate(agrupadas.items(), 1)
+    ]
+    return json.dumps(jsonable_encoder(modelos))
+
+def main(cantidad: int = 50_000, cobradores: int = 300) -> None:
+    db = crear_sesion()
+    with cronometro(f"Carga de {cantidad:,} cobranzas / Loading"):
+        poblar(db, cantidad, cobradores)
+
+    with cronometro("Antes / Before: ORM + pydantic"):
+        antes = rutas_orm(db, DIA)
+    db.expunge_all()
+    with cronometro("Después / After: tuplas + json.dumps"):
+        despues = json.dumps(rutas_del_dia(db, DIA), separators=(",", ":"), default=json_por_defecto)
+
+    rutas = json.loads(despues)
+    assert len(rutas) == len(json.loads(antes))
+    assert sum(len(r["cobranzas"]) for r in rutas) == cantidad
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*argumentos)
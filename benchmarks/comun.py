@@ -0,0 +1,36 @@
+"""
+🇪🇸 Utilidades compartidas por los benchmarks
+🇺🇸 Utilities shared by the benchmarks
+"""
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+import app.models  # noqa: F401  (registra los modelos / registers the models)
+
+def crear_sesion(url: str = None):
+    """
+    🇪🇸 Crea una base SQLite temporal en disco con el esquema completo
+    🇺🇸 Creates a temporary on-disk SQLite database with the full schema
+    """
+    if url is None:
+        ruta = os.path.join(tempfile.mkdtemp(prefix="bench_"), "bench.db")
+        url = f"sqlite:///{ruta}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+@contextmanager
+def cronometro(etiqueta: str):
+    """
+    🇪🇸 Mide e imprime el tiempo de un bloque
+    🇺🇸 Measures and prints a block's elapsed time
+    """
+    inicio = time.perf_counter()
+    resultado = {}
+    yield resultado
+    resultado["segundos"] = time.perf_counter() - inicio
+    print(f"{etiqueta}: {resultado['segundos'] * 1000:.1f} ms")
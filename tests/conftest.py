@@ -19,6 +19,7 @@ os.environ["DATABASE_URL"] = "sqlite://"
 os.environ["JWT_SECRET_KEY"] = "test-secret-key"
 os.environ["JWT_ALGORITHM"] = "HS256"
 os.environ["ACCESS_TOKEN_EXPIRE_MINUTES"] = "30"
+os.environ["BCRYPT_ROUNDS"] = "4"
 os.environ["SMTP_HOST"] = "smtp.gmail.com"
 os.environ["SMTP_PORT"] = "587"
 os.environ["SMTP_USERNAME"] = "test@example.com"
@@ -34,7 +35,8 @@ os.environ["TWILIO_PHONE_NUMBER"] = "+1234567890"
 from app.database import Base, get_db
 from app.main import app
 from app.models import Rol, Usuario
-from app.utils.auth import get_password_hash, create_access_token, oauth2_scheme
+from app.utils.auth import get_password_hash, create_access_token, oauth2_scheme, cache_usuarios
+from app.utils.flujo_caja import cache_proyecciones
 
 # Crear base de datos en memoria para tests
 SQLALCHEMY_DATABASE_URL = "sqlite://"
@@ -59,6 +61,8 @@ def db():
     finally:
         db.close()
         Base.metadata.drop_all(bind=engine)
+        cache_usuarios.limpiar()
+        cache_proyecciones.limpiar()
 
 @pytest.fixture(scope="function")
 def client(db):
@@ -149,4 +153,27 @@ def authenticated_user(test_user, db):
     app.dependency_overrides[get_db] = lambda: db
     yield test_user
     del app.dependency_overrides[oauth2_scheme]
-    del app.dependency_overrides[get_db] 
\ No newline at end of file
+    del app.dependency_overrides[get_db]
+
+
+@pytest.fixture
+def test_cliente(db):
+    """
+    🇪🇸 Fixture que crea un cliente de prueba
+    🇺🇸 Fixture that creates a test client
+    """
+    from app.models import Cliente
+
+    cliente = Cliente(
+        cedula="1234567890",
+        nombre="Ana",
+        apellido="Pérez",
+        telefono="3001234567",
+        direccion="Calle 1 # 2-3",
+        email="ana@example.com",
+        activo=True
+    )
+    db.add(cliente)
+    db.commit()
+    db.refresh(cliente)
+    return cliente
@@ -0,0 +1,65 @@
+"""
+🇪🇸 Tests para la autenticación
+🇺🇸 Tests for authentication
+"""
+from passlib.context import CryptContext
+from app.models.usuario import Usuario
+from app.utils.auth import cache_usuarios
+
+def test_usuario_autenticado_se_cachea(authorized_client, test_user):
+    """
+    🇪🇸 La segunda petición autenticada se resuelve desde la caché
+    🇺🇸 The second authenticated request is served from the cache
+    """
+    assert authorized_client.get("/api/v1/usuarios/").status_code == 200
+    assert authorized_client.get("/api/v1/usuarios/").status_code == 200
+
+    # 🇪🇸 La propia consulta de métricas se autentica desde la caché
+    # 🇺🇸 The metrics request itself is authenticated from the cache
+    metricas = authorized_client.get("/api/v1/metricas").json()["cache_usuarios"]
+    assert metricas["fallos"] == 1
+    assert metricas["aciertos"] == 2
+    assert metricas["tasa_aciertos"] == 2 / 3
+    assert "hashed_password" not in cache_usuarios.obtener(test_user.email)
+
+def test_metricas_requieren_autenticacion(client):
+    """
+    🇪🇸 Las métricas internas no son públicas
+    🇺🇸 Internal metrics are not public
+    """
+    assert client.get("/api/v1/metricas").status_code == 401
+
+def test_desactivar_usuario_invalida_cache(authorized_client, test_user):
+    """
+    🇪🇸 Desactivar un usuario lo saca de la caché y bloquea su acceso
+    🇺🇸 Deactivating a user evicts it from the cache and blocks its access
+    """
+    response = authorized_client.put(
+        f"/api/v1/usuarios/{test_user.id}", json={"is_active": False}
+    )
+    assert response.status_code == 200
+    assert cache_usuarios.obtener(test_user.email) is None
+
+    response = authorized_client.get("/api/v1/usuarios/")
+    assert response.status_code == 400
+
+def test_login_rehace_hash_con_otro_costo(client, test_user, db):
+    """
+    🇪🇸 Un login correcto con un hash de otro costo lo rehace con BCRYPT_ROUNDS
+    🇺🇸 A successful login with a hash of another cost redoes it with BCRYPT_ROUNDS
+    """
+    usuario_id = test_user.id
+    test_user.hashed_password = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5).hash("testpassword")
+    db.commit()
+
+    response = client.post("/api/v1/auth/login", data={"username": "test@example.com", "password": "otra"})
+    assert response.status_code == 401
+
+    for _ in range(2):
+        response = client.post(
+            "/api/v1/auth/login", data={"username": "test@example.com", "password": "testpassword"}
+        )
+        assert response.status_code == 200
+        assert response.json()["user"]["id"] == usuario_id
+        db.expire_all()
+        assert db.get(Usuario, usuario_id).hashed_password.startswith("$2b$04$")
@@ -0,0 +1,87 @@
+"""
+🇪🇸 Tests de la búsqueda de clientes
+🇺🇸 Tests for client search
+"""
+from sqlalchemy import select
+from app.models import Cliente
+from app.utils.busqueda_clientes import _consultas
+from app.utils.texto import compactar, normalizar
+
+def _crear_clientes(db):
+    db.add_all([
+        Cliente(cedula="1.020.304", nombre="José", apellido="Peña", telefono="300-555-0101",
+                direccion="Calle 10 # 5-20", email="jose@example.com"),
+        Cliente(cedula="7788", nombre="Ana María", apellido="Pérez", telefono="310 555 0202",
+                direccion="Carrera 7", email="ana@example.com"),
+        Cliente(cedula="1020999", nombre="Pedro", apellido="Gómez", telefono="320 000 1020",
+                direccion="Peñalosa 3 Sur", email="pedro@example.com"),
+    ])
+    db.commit()
+
+def test_normalizar_texto():
+    """
+    🇪🇸 La normalización quita tildes, mayúsculas y separadores
+    🇺🇸 Normalization removes accents, case and separators
+    """
+    assert normalizar("  Peña-GÓMEZ, Ñandú ") == "pena gomez nandu"
+    assert compactar("1.020.304-5") == "10203045"
+    assert normalizar(None) == ""
+
+def test_buscar_clientes_por_nombre_cedula_y_telefono(authorized_client, db):
+    """
+    🇪🇸 La búsqueda ignora tildes y mayúsculas y ordena por relevancia
+    🇺🇸 Search ignores accents and case and orders by relevance
+    """
+    _crear_clientes(db)
+
+    response = authorized_client.get("/api/v1/clientes/buscar", params={"q": "PENA"})
+    assert response.status_code == 200
+    resultados = response.json()
+    assert [(r["apellido"], r["coincidencia"]) for r in resultados] == [
+        ("Peña", "apellido"), ("Gómez", "direccion")
+    ]
+
+    response = authorized_client.get("/api/v1/clientes/buscar", params={"q": "ana maria p"})
+    assert [r["apellido"] for r in response.json()] == ["Pérez"]
+    assert response.json()[0]["relevancia"] == 60
+
+    # 🇪🇸 Dígitos: la cédula pesa más que el teléfono
+    # 🇺🇸 Digits: ID outranks phone
+    response = authorized_client.get("/api/v1/clientes/buscar", params={"q": "1020"})
+    assert [(r["nombre"], r["coincidencia"]) for r in response.json()] == [
+        ("Pedro", "cedula"), ("José", "cedula")
+    ]
+    response = authorized_client.get("/api/v1/clientes/buscar", params={"q": "310-555"})
+    assert [r["nombre"] for r in response.json()] == ["Ana María"]
+
+    response = authorized_client.get("/api/v1/clientes/buscar", params={"q": "zz"})
+    assert response.json() == []
+    response = authorized_client.get("/api/v1/clientes/buscar", params={"q": "a"})
+    assert response.status_code == 422
+
+def test_columnas_de_busqueda_se_actualizan(authorized_client, db):
+    """
+    🇪🇸 Editar un cliente actualiza sus columnas de búsqueda
+    🇺🇸 Editing a client updates its search columns
+    """
+    _crear_clientes(db)
+    cliente_id = db.query(Cliente.id).filter(Cliente.cedula == "7788").scalar()
+    authorized_client.put(f"/api/v1/clientes/{cliente_id}", json={"apellido": "Álvarez"})
+
+    response = authorized_client.get("/api/v1/clientes/buscar", params={"q": "alvarez"})
+    assert [r["id"] for r in response.json()] == [cliente_id]
+
+def test_busqueda_usa_los_indices(db):
+    """
+    🇪🇸 Cada consulta de la búsqueda recorre un índice, no la tabla
+    🇺🇸 Each search query walks an index, not the table
+    """
+    conexion = db.connection()
+    for consulta in ("pena", "1020"):
+        for tipo, condicion in _consultas(consulta):
+            sentencia = select(Cliente.id).where(condicion).compile(conexion)
+            parametros = tuple(sentencia.params[p] for p in sentencia.positiontup)
+            plan = " ".join(
+                fila[-1] for fila in conexion.exec_driver_sql(f"EXPLAIN QUERY PLAN {sentencia}", parametros)
+            )
+            assert f"INDEX ix_clientes_{tipo}_busqueda" in plan
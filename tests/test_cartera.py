@@ -0,0 +1,92 @@
+"""
+🇪🇸 Tests del reporte de cartera vencida
+🇺🇸 Tests for the portfolio aging report
+"""
+from datetime import datetime, timedelta
+from app.models import Cliente
+from app.models.prestamo import Prestamo
+from app.models.ruta import Ruta
+from app.utils.cartera import reporte_cartera
+
+def _crear_prestamo(authorized_client, cliente_id: int, monto: float = 300.0) -> int:
+    response = authorized_client.post("/api/v1/prestamos/", json={
+        "cliente_id": cliente_id,
+        "monto": monto,
+        "interes": 20.0,
+        "plazo": 3,
+        "frecuencia_pago": "semanal"
+    })
+    return response.json()["id"]
+
+def test_reporte_cartera_por_tramos(authorized_client, test_user, test_cliente, db):
+    """
+    🇪🇸 Cada préstamo cae en el tramo de su cuota impaga más antigua, agrupado por
+    zona y cobrador, con el saldo separado en capital e interés
+    🇺🇸 Each loan falls in the bucket of its oldest unpaid installment, grouped by
+    zone and collector, with the balance split into principal and interest
+    """
+    cobrador_id = test_user.id
+    ruta = Ruta(nombre="Ruta 1", zona="Norte", cobrador_id=cobrador_id)
+    sin_ruta = Cliente(
+        cedula="999", nombre="Luis", apellido="Gómez", telefono="300",
+        direccion="Calle 9", email="luis@example.com"
+    )
+    db.add_all([ruta, sin_ruta])
+    db.flush()
+    test_cliente.ruta_id = ruta.id
+    db.commit()
+    cliente_id, sin_ruta_id = test_cliente.id, sin_ruta.id
+
+    corte = datetime.utcnow().date()
+    atrasos = {
+        _crear_prestamo(authorized_client, cliente_id): 0,
+        _crear_prestamo(authorized_client, cliente_id): 3,
+        _crear_prestamo(authorized_client, cliente_id): 7,
+        _crear_prestamo(authorized_client, cliente_id): 45,
+        _crear_prestamo(authorized_client, sin_ruta_id): 90,
+    }
+    pagado = _crear_prestamo(authorized_client, cliente_id)
+    for prestamo_id, dias in atrasos.items():
+        db.get(Prestamo, prestamo_id).fecha_proxima_cuota = datetime.combine(corte, datetime.min.time()) + timedelta(hours=9) - timedelta(days=dias)
+    db.get(Prestamo, pagado).saldo_pendiente = 0
+    db.commit()
+
+    reporte = reporte_cartera(db, corte)
+    assert [
+        (f["zona"], f["cobrador_id"], f["tramo"], f["prestamos"], f["saldo"], f["capital"], f["interes"])
+        for f in reporte["filas"]
+    ] == [
+        ("Norte", cobrador_id, "al_dia", 1, 360.0, 300.0, 60.0),
+        ("Norte", cobrador_id, "1_7", 2, 720.0, 600.0, 120.0),
+        ("Norte", cobrador_id, "31_60", 1, 360.0, 300.0, 60.0),
+        (None, None, "mas_60", 1, 360.0, 300.0, 60.0),
+    ]
+    assert [(t["tramo"], t["prestamos"]) for t in reporte["totales"]] == [
+        ("al_dia", 1), ("1_7", 2), ("8_30", 0), ("31_60", 1), ("mas_60", 1)
+    ]
+
+    response = authorized_client.get(
+        "/api/v1/reportes/cartera",
+        params={"fecha_corte": corte.isoformat(), "zona": "Norte", "cobrador_id": cobrador_id}
+    )
+    assert response.status_code == 200
+    datos = response.json()
+    assert datos["fecha_corte"] == corte.isoformat()
+    assert [f["tramo"] for f in datos["filas"]] == ["al_dia", "1_7", "31_60"]
+    assert sum(t["saldo"] for t in datos["totales"]) == 1440.0
+
+    # 🇪🇸 Una semana después, los préstamos del tramo 1-7 pasan al 8-30
+    # 🇺🇸 A week later, the 1-7 bucket loans move to 8-30
+    reporte = reporte_cartera(db, corte + timedelta(days=7))
+    assert [(t["tramo"], t["prestamos"]) for t in reporte["totales"]] == [
+        ("al_dia", 0), ("1_7", 1), ("8_30", 2), ("31_60", 1), ("mas_60", 1)
+    ]
+
+def test_reporte_cartera_rechaza_fechas_pasadas(authorized_client):
+    """
+    🇪🇸 Los contadores de saldo son los actuales, así que no sirven para un corte pasado
+    🇺🇸 Balance counters are the current ones, so they cannot serve a past cutoff
+    """
+    ayer = datetime.utcnow().date() - timedelta(days=1)
+    response = authorized_client.get("/api/v1/reportes/cartera", params={"fecha_corte": ayer.isoformat()})
+    assert response.status_code == 400
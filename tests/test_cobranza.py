@@ -0,0 +1,199 @@
+"""
+🇪🇸 Tests para la gestión de cobranzas
+🇺🇸 Tests for collection management
+"""
+from datetime import date, datetime
+from itertools import count
+from app.models.cobranza import Cobranza, EstadoCobranza
+from app.models.resumen_cobranza import ResumenCobranzaDiario
+from app.models.usuario import Usuario
+from app.schemas.cobranza import RutaCobranza
+from app.utils.resumen_cobranzas import CLAVE, recalcular
+from app.utils.upsert import upsert_acumulado_generico
+
+# 🇪🇸 Cada cobranza de prueba es de una cuota distinta (una por cuota y fecha)
+# 🇺🇸 Each test collection belongs to a different installment (one per installment and date)
+_pagos = count(1)
+
+def _cobranza_data(cobrador_id, zona="Norte", dia=1, monto=100.0):
+    return {
+        "pago_id": next(_pagos),
+        "cobrador_id": cobrador_id,
+        "monto_esperado": monto,
+        "zona": zona,
+        "direccion_cobro": "Calle 1",
+        "fecha_programada": datetime(2024, 5, dia, 9).isoformat(),
+    }
+
+def test_resumen_cobranzas_incremental(authorized_client, test_user, db):
+    """
+    🇪🇸 El resumen refleja las altas y los cambios de estado de las cobranzas
+    🇺🇸 The summary reflects collection inserts and state changes
+    """
+    cobrador_id, nombre = test_user.id, test_user.nombre
+    ids = []
+    for zona, dia, monto in [("Norte", 1, 100.0), ("Norte", 2, 50.0), ("Sur", 2, 80.0)]:
+        response = authorized_client.post(
+            "/api/v1/cobranzas/", json=_cobranza_data(cobrador_id, zona, dia, monto)
+        )
+        assert response.status_code == 200
+        ids.append(response.json()["id"])
+
+    response = authorized_client.put(
+        f"/api/v1/cobranzas/{ids[0]}",
+        json={"estado": "completada", "monto_recibido": 90.0, "metodo_pago": "efectivo"}
+    )
+    assert response.status_code == 200
+
+    response = authorized_client.get(
+        "/api/v1/cobranzas/resumen",
+        params={"fecha_inicio": "2024-05-01", "fecha_fin": "2024-05-02"}
+    )
+    assert response.status_code == 200
+    resumen = response.json()
+    assert resumen["total_pendientes"] == 2
+    assert resumen["total_completadas"] == 1
+    assert resumen["monto_total_esperado"] == 230.0
+    assert resumen["monto_total_recibido"] == 90.0
+    assert resumen["por_zona"] == {"Norte": 2, "Sur": 1}
+    assert resumen["por_cobrador"] == {nombre: 3}
+
+    response = authorized_client.get(
+        "/api/v1/cobranzas/resumen",
+        params={"fecha_inicio": "2024-05-02", "fecha_fin": "2024-05-02"}
+    )
+    assert response.json()["por_zona"] == {"Norte": 1, "Sur": 1}
+
+def test_recalcular_resumen_coincide_con_incremental(authorized_client, test_user, db):
+    """
+    🇪🇸 Reconstruir el resumen desde cero da el mismo resultado que el incremental
+    🇺🇸 Rebuilding the summary from scratch matches the incremental result
+    """
+    cobrador_id = test_user.id
+    for dia in (1, 1, 3):
+        authorized_client.post("/api/v1/cobranzas/", json=_cobranza_data(cobrador_id, dia=dia))
+    # 🇪🇸 22:00 en UTC-5 ya es el día 7 en UTC, tanto en el incremental como al recalcular
+    # 🇺🇸 22:00 at UTC-5 is already day 7 in UTC, both incrementally and when rebuilding
+    authorized_client.post("/api/v1/cobranzas/", json={
+        **_cobranza_data(cobrador_id), "fecha_programada": "2024-05-06T22:00:00-05:00"
+    })
+    cobranza = db.query(Cobranza).first()
+    authorized_client.put(f"/api/v1/cobranzas/{cobranza.id}", json={"estado": "fallida"})
+
+    def filas():
+        db.expire_all()
+        return sorted(
+            (r.fecha, r.zona, r.cobrador_id, r.estado, r.cantidad, r.monto_esperado)
+            for r in db.query(ResumenCobranzaDiario).all() if r.cantidad
+        )
+
+    incremental = filas()
+    recalcular(db, date(2024, 5, 1), date(2024, 5, 31))
+    db.commit()
+    assert filas() == incremental
+    assert (date(2024, 5, 1), "Norte", cobrador_id, EstadoCobranza.FALLIDA, 1, 100.0) in incremental
+    assert (date(2024, 5, 7), "Norte", cobrador_id, EstadoCobranza.PENDIENTE, 1, 100.0) in incremental
+
+def test_rutas_del_dia_agrupadas_y_ordenadas(authorized_client, test_user, db):
+    """
+    🇪🇸 Las rutas agrupan por zona y cobrador, ordenan por orden de ruta y
+    cumplen el schema RutaCobranza
+    🇺🇸 Routes group by zone and collector, sort by route order and match the
+    RutaCobranza schema
+    """
+    cobrador_id = test_user.id
+    for zona, orden in [("Sur", 2), ("Norte", 2), ("Sur", 1), ("Norte", 1)]:
+        datos = _cobranza_data(cobrador_id, zona, dia=3)
+        datos["orden_ruta"] = orden
+        authorized_client.post("/api/v1/cobranzas/", json=datos)
+    authorized_client.post("/api/v1/cobranzas/", json=_cobranza_data(cobrador_id, "Norte", dia=4))
+
+    response = authorized_client.get("/api/v1/cobranzas/ruta/2024-05-03")
+    assert response.status_code == 200
+    rutas = [RutaCobranza.model_validate(ruta) for ruta in response.json()]
+    assert [(r.id, r.zona, r.cobrador_id) for r in rutas] == [(1, "Norte", cobrador_id), (2, "Sur", cobrador_id)]
+    assert all([c.orden_ruta for c in r.cobranzas] == [1, 2] for r in rutas)
+    assert rutas[0].fecha == datetime(2024, 5, 3)
+    assert rutas[0].cobranzas[0].estado == EstadoCobranza.PENDIENTE
+
+def test_asignar_cobranzas_masivo_mantiene_el_resumen(authorized_client, test_user, db):
+    """
+    🇪🇸 La asignación por zona y fechas devuelve el conteo y deja el resumen igual
+    que una reconstrucción completa
+    🇺🇸 Assigning by zone and dates returns the count and leaves the summary equal
+    to a full rebuild
+    """
+    cobrador_id = test_user.id
+    nuevo = Usuario(email="cobrador@example.com", nombre="Cobrador", hashed_password="x", rol_id=2)
+    inactivo = Usuario(email="inactivo@example.com", nombre="Inactivo", hashed_password="x", rol_id=2, is_active=False)
+    db.add_all([nuevo, inactivo])
+    db.commit()
+    nuevo_id, inactivo_id = nuevo.id, inactivo.id
+
+    for zona, dia in [("Norte", 1), ("Norte", 2), ("Norte", 9), ("Sur", 1)]:
+        authorized_client.post("/api/v1/cobranzas/", json=_cobranza_data(cobrador_id, zona, dia=dia))
+
+    response = authorized_client.post("/api/v1/cobranzas/asignar", json={
+        "cobrador_id": nuevo_id,
+        "zona": "Norte",
+        "fecha_desde": "2024-05-01",
+        "fecha_hasta": "2024-05-02",
+    })
+    assert response.status_code == 200
+    assert response.json() == {"cobrador_id": nuevo_id, "actualizadas": 2}
+
+    db.expire_all()
+    asignadas = db.query(Cobranza.zona, Cobranza.fecha_programada).filter(Cobranza.cobrador_id == nuevo_id)
+    assert sorted(c.fecha_programada.day for c in asignadas) == [1, 2]
+
+    response = authorized_client.post("/api/v1/cobranzas/asignar", json={
+        "cobrador_id": nuevo_id,
+        "cobranza_ids": [c.id for c in db.query(Cobranza.id).filter(Cobranza.zona == "Sur")],
+        "fecha_programada": datetime(2024, 5, 6, 8).isoformat(),
+    })
+    assert response.json()["actualizadas"] == 1
+
+    def filas():
+        db.expire_all()
+        return sorted(
+            (r.fecha, r.zona, r.cobrador_id, r.estado, r.cantidad, r.monto_esperado)
+            for r in db.query(ResumenCobranzaDiario).all() if r.cantidad
+        )
+
+    incremental = filas()
+    recalcular(db, date(2024, 5, 1), date(2024, 5, 31))
+    db.commit()
+    assert filas() == incremental
+    assert (date(2024, 5, 6), "Sur", nuevo_id, EstadoCobranza.PENDIENTE, 1, 100.0) in incremental
+
+    response = authorized_client.post("/api/v1/cobranzas/asignar", json={"cobrador_id": nuevo_id})
+    assert response.status_code == 400
+    response = authorized_client.post("/api/v1/cobranzas/asignar", json={"cobrador_id": inactivo_id, "zona": "Sur"})
+    assert response.status_code == 400
+    response = authorized_client.post("/api/v1/cobranzas/asignar", json={"cobrador_id": 999, "zona": "Sur"})
+    assert response.status_code == 404
+
+def test_upsert_generico_del_resumen(test_user, db):
+    """
+    🇪🇸 La alternativa sin upsert nativo crea la fila y luego suma los deltas
+    🇺🇸 The fallback without native upsert creates the row and then adds the deltas
+    """
+    fila = {
+        "fecha": date(2024, 5, 1), "zona": "Norte", "cobrador_id": test_user.id,
+        "estado": EstadoCobranza.PENDIENTE, "cantidad": 2, "monto_esperado": 150.0, "monto_recibido": 0.0,
+    }
+    tabla = ResumenCobranzaDiario.__table__
+    upsert_acumulado_generico(db.connection(), tabla, CLAVE, [fila])
+    upsert_acumulado_generico(db.connection(), tabla, CLAVE, [{**fila, "cantidad": -1, "monto_esperado": -50.0}])
+    db.commit()
+    resumen = db.query(ResumenCobranzaDiario).one()
+    assert (resumen.cantidad, resumen.monto_esperado, resumen.monto_recibido) == (1, 100.0, 0.0)
+
+def test_cobranza_duplicada_por_cuota_y_fecha(authorized_client, test_user):
+    """
+    🇪🇸 No se admiten dos cobranzas de la misma cuota con la misma fecha programada
+    🇺🇸 Two collections for the same installment and scheduled date are rejected
+    """
+    datos = _cobranza_data(test_user.id)
+    assert authorized_client.post("/api/v1/cobranzas/", json=datos).status_code == 200
+    assert authorized_client.post("/api/v1/cobranzas/", json=datos).status_code == 409
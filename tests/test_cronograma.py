@@ -0,0 +1,70 @@
+"""
+🇪🇸 Tests para el motor de cronogramas de pago
+🇺🇸 Tests for the payment schedule engine
+"""
+from datetime import date, datetime
+import pytest
+from app.utils.cronograma import calcular_cronogramas, calcular_fechas_pagos
+
+def test_cronograma_mensual_usa_meses_calendario():
+    """
+    🇪🇸 Los meses son meses reales y el día se ajusta al fin de mes
+    🇺🇸 Months are real months and the day is clamped to month end
+    """
+    fechas = calcular_fechas_pagos(datetime(2024, 1, 31, 9, 30), 3, "mensual")
+    assert fechas == [
+        datetime(2024, 2, 29, 9, 30),
+        datetime(2024, 3, 31, 9, 30),
+        datetime(2024, 4, 30, 9, 30),
+    ]
+
+def test_cronograma_diario_omite_domingos_y_feriados():
+    """
+    🇪🇸 Las cuotas diarias avanzan solo por días hábiles
+    🇺🇸 Daily installments advance over business days only
+    """
+    # 🇪🇸 2024-03-01 es viernes; 2024-03-05 es feriado
+    # 🇺🇸 2024-03-01 is a Friday; 2024-03-05 is a holiday
+    fechas = calcular_fechas_pagos(
+        datetime(2024, 3, 1), 4, "diario",
+        omitir_domingos=True, feriados=[date(2024, 3, 5)]
+    )
+    assert [f.date() for f in fechas] == [
+        date(2024, 3, 2), date(2024, 3, 4), date(2024, 3, 6), date(2024, 3, 7)
+    ]
+
+def test_cronogramas_varios_prestamos():
+    """
+    🇪🇸 Varios préstamos con frecuencias distintas en una sola llamada
+    🇺🇸 Several loans with different frequencies in a single call
+    """
+    cronograma = calcular_cronogramas(
+        fechas_inicio=[datetime(2024, 1, 1)] * 3,
+        montos=[1000, 500, 300],
+        intereses=[20, 10, 0],
+        plazos=[2, 3, 1],
+        frecuencias=["semanal", "quincenal", "diario"],
+    )
+    assert len(cronograma) == 3
+    assert cronograma.monto_total.tolist() == pytest.approx([1200, 550, 300])
+    assert cronograma.fechas(0) == [datetime(2024, 1, 8), datetime(2024, 1, 15)]
+    assert cronograma.fechas(1) == [
+        datetime(2024, 1, 16), datetime(2024, 1, 31), datetime(2024, 2, 15)
+    ]
+    assert cronograma.fechas_fin() == [
+        datetime(2024, 1, 15), datetime(2024, 2, 15), datetime(2024, 1, 2)
+    ]
+
+    filas = cronograma.filas_pagos([10, 20, 30])
+    assert [(f["prestamo_id"], f["numero_cuota"]) for f in filas] == [
+        (10, 1), (10, 2), (20, 1), (20, 2), (20, 3), (30, 1)
+    ]
+    assert filas[0]["monto"] == pytest.approx(600)
+
+def test_cronograma_rechaza_plazo_invalido():
+    """
+    🇪🇸 Un plazo de cero cuotas no es válido
+    🇺🇸 A zero-installment term is not valid
+    """
+    with pytest.raises(ValueError):
+        calcular_fechas_pagos(datetime(2024, 1, 1), 0, "diario")
@@ -0,0 +1,135 @@
+"""
+🇪🇸 Tests para el despacho de notificaciones
+🇺🇸 Tests for notification dispatch
+"""
+import asyncio
+import threading
+from sqlalchemy import event
+from app.models.notificacion import (
+    Notificacion,
+    TipoNotificacion,
+    CanalNotificacion,
+    EstadoNotificacion
+)
+from app.utils.despacho import DespachadorNotificaciones
+from app.utils.notification_providers import MockNotificationProvider
+
+def _crear_notificaciones(db, usuario, cantidad, estado=EstadoNotificacion.PENDIENTE):
+    db.add_all([
+        Notificacion(
+            tipo=TipoNotificacion.PAGO,
+            canal=CanalNotificacion.SMS if i % 2 else CanalNotificacion.EMAIL,
+            titulo=f"Test {i}",
+            mensaje="Test message",
+            usuario_id=usuario.id,
+            estado=estado
+        )
+        for i in range(cantidad)
+    ])
+    db.commit()
+
+class ProveedorQueFalla(MockNotificationProvider):
+    """
+    🇪🇸 Proveedor simulado que falla con los títulos múltiplos de 3
+    🇺🇸 Mock provider that fails on titles that are multiples of 3
+    """
+    async def send_notification(self, to, title, message, metadata=None):
+        if int(title.split()[-1]) % 3 == 0:
+            raise RuntimeError("proveedor caído")
+        return True
+
+def test_despacho_por_lotes(test_user, db):
+    """
+    🇪🇸 Todas las notificaciones se envían aunque superen el tamaño de lote
+    🇺🇸 Every notification is sent even beyond the chunk size
+    """
+    _crear_notificaciones(db, test_user, 25)
+    _crear_notificaciones(db, test_user, 5, EstadoNotificacion.LEIDA)
+
+    resultado = asyncio.run(DespachadorNotificaciones(db, tamano_lote=10).procesar())
+
+    assert resultado["enviadas"] == 25
+    assert resultado["fallidas"] == 0
+    assert resultado["envios_por_segundo"] > 0
+    db.expire_all()
+    enviadas = db.query(Notificacion).filter(Notificacion.estado == EstadoNotificacion.ENVIADA).all()
+    assert len(enviadas) == 25
+    assert all(n.fecha_envio is not None for n in enviadas)
+
+def test_despacho_registra_errores(test_user, db):
+    """
+    🇪🇸 Los errores del proveedor marcan la notificación como fallida
+    🇺🇸 Provider errors mark the notification as failed
+    """
+    _crear_notificaciones(db, test_user, 9, EstadoNotificacion.FALLIDA)
+
+    despachador = DespachadorNotificaciones(
+        db, tamano_lote=4, obtener_proveedor=lambda canal: ProveedorQueFalla()
+    )
+    resultado = asyncio.run(despachador.procesar([EstadoNotificacion.FALLIDA]))
+
+    assert resultado == {**resultado, "enviadas": 6, "fallidas": 3}
+    db.expire_all()
+    fallidas = db.query(Notificacion).filter(Notificacion.estado == EstadoNotificacion.FALLIDA).all()
+    assert len(fallidas) == 3
+    assert all(n.datos_adicionales["error"] == "proveedor caído" for n in fallidas)
+
+def test_despacho_marca_fallidas_las_notificaciones_sin_destinatario(test_user, db):
+    """
+    🇪🇸 Una notificación cuyo usuario ya no existe se marca fallida en vez de quedar pendiente
+    🇺🇸 A notification whose user no longer exists is marked failed instead of staying pending
+    """
+    _crear_notificaciones(db, test_user, 2)
+    huerfana = db.query(Notificacion).order_by(Notificacion.id).first()
+    huerfana.usuario_id = 999
+    db.commit()
+    huerfana_id = huerfana.id
+
+    resultado = asyncio.run(DespachadorNotificaciones(db).procesar())
+
+    assert resultado == {**resultado, "enviadas": 1, "fallidas": 1}
+    db.expire_all()
+    huerfana = db.get(Notificacion, huerfana_id)
+    assert huerfana.estado == EstadoNotificacion.FALLIDA
+    assert huerfana.datos_adicionales["error"] == "Notificación sin destinatario"
+
+def test_despacho_respeta_tasa_por_canal(test_user, db):
+    """
+    🇪🇸 El límite de tasa por canal espacia los envíos
+    🇺🇸 The per-channel rate limit spaces out sends
+    """
+    _crear_notificaciones(db, test_user, 6)
+
+    despachador = DespachadorNotificaciones(
+        db,
+        tasa_por_segundo={CanalNotificacion.EMAIL: 20, CanalNotificacion.SMS: 20}
+    )
+    resultado = asyncio.run(despachador.procesar())
+
+    # 🇪🇸 3 envíos por canal a 20/s: al menos 2 intervalos de 50 ms
+    # 🇺🇸 3 sends per channel at 20/s: at least 2 intervals of 50 ms
+    assert resultado["enviadas"] == 6
+    assert resultado["segundos"] >= 0.09
+
+def test_despacho_no_consulta_en_el_event_loop(test_user, db):
+    """
+    🇪🇸 Las lecturas y confirmaciones de la sesión corren fuera del hilo del event loop
+    🇺🇸 Session reads and commits run off the event loop thread
+    """
+    _crear_notificaciones(db, test_user, 6)
+    hilos = set()
+    conexion = db.get_bind()
+
+    def registrar(*args):
+        hilos.add(threading.get_ident())
+
+    async def despachar():
+        return threading.get_ident(), await DespachadorNotificaciones(db, tamano_lote=4).procesar()
+
+    event.listen(conexion, "before_cursor_execute", registrar)
+    try:
+        hilo_loop, resultado = asyncio.run(despachar())
+    finally:
+        event.remove(conexion, "before_cursor_execute", registrar)
+    assert resultado["enviadas"] == 6
+    assert hilos and hilo_loop not in hilos
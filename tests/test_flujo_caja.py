@@ -0,0 +1,98 @@
+"""
+🇪🇸 Tests de la proyección de flujo de caja
+🇺🇸 Tests for the cash-flow projection
+"""
+from datetime import date, datetime
+from app.models import Cliente
+from app.models.pago import Pago, EstadoPago
+from app.models.ruta import Ruta
+from app.utils.flujo_caja import cache_proyecciones, proyectar_flujo_caja
+
+def _crear_prestamo(authorized_client, db, cliente_id: int, cuotas):
+    """
+    🇪🇸 Crea un préstamo y reprograma sus cuotas: (vence, pagada el día o None)
+    🇺🇸 Creates a loan and reschedules its installments: (due, paid on or None)
+    """
+    prestamo = authorized_client.post("/api/v1/prestamos/", json={
+        "cliente_id": cliente_id,
+        "monto": 100.0 * len(cuotas),
+        "interes": 0.0,
+        "plazo": len(cuotas),
+        "frecuencia_pago": "semanal"
+    }).json()
+    for pago, (vence, pagada) in zip(prestamo["pagos"], cuotas):
+        cuota = db.get(Pago, pago["id"])
+        cuota.fecha_programada = vence
+        if pagada is not None:
+            cuota.estado = EstadoPago.PAGADO
+            cuota.fecha_pago = pagada
+    db.commit()
+
+def test_proyeccion_flujo_caja(authorized_client, test_user, test_cliente, db):
+    """
+    🇪🇸 Suma por día, zona y cobrador las cuotas impagas del horizonte y las descuenta
+    por la tasa de pago a tiempo de cada cliente (o la general, sin historial)
+    🇺🇸 Sums the horizon's unpaid installments per day, zone and collector and
+    discounts them by each client's on-time rate (or the overall one, without history)
+    """
+    cobrador_id = test_user.id
+    ruta = Ruta(nombre="Ruta 1", zona="Norte", cobrador_id=cobrador_id)
+    sin_ruta = Cliente(cedula="999", nombre="Luis", apellido="Gómez", telefono="300",
+                       direccion="Calle 9", email="luis@example.com")
+    moroso = Cliente(cedula="888", nombre="Ana", apellido="Díaz", telefono="301",
+                     direccion="Calle 8", email="ana.diaz@example.com")
+    db.add_all([ruta, sin_ruta, moroso])
+    db.flush()
+    test_cliente.ruta_id = moroso.ruta_id = ruta.id
+    db.commit()
+    cliente_id, sin_ruta_id, moroso_id = test_cliente.id, sin_ruta.id, moroso.id
+
+    # 🇪🇸 Cliente con 2 de 3 cuotas a tiempo; moroso con 0 de 1; sin ruta, sin historial
+    # 🇺🇸 Client with 2 of 3 installments on time; late payer 0 of 1; no route, no history
+    _crear_prestamo(authorized_client, db, cliente_id, [
+        (datetime(2024, 6, 20, 9), datetime(2024, 6, 20, 17)),
+        (datetime(2024, 6, 24, 9), datetime(2024, 6, 24, 10)),
+        (datetime(2024, 6, 28, 9), datetime(2024, 6, 30, 10)),
+        (datetime(2024, 7, 2, 9), None),
+    ])
+    _crear_prestamo(authorized_client, db, moroso_id, [
+        (datetime(2024, 6, 25, 9), None),
+        (datetime(2024, 7, 5, 9), None),
+    ])
+    _crear_prestamo(authorized_client, db, sin_ruta_id, [
+        (datetime(2024, 7, 1, 9), None),
+        (datetime(2024, 7, 3, 9), None),
+        (datetime(2024, 7, 9, 9), None),
+    ])
+
+    proyeccion = proyectar_flujo_caja(db, dias=7, desde=date(2024, 7, 1), descontar=True)
+    assert proyeccion["tasa_general"] == 0.5
+    assert [
+        (f["fecha"].day, f["zona"], f["cobrador_id"], f["cuotas"], f["esperado"], f["ajustado"])
+        for f in proyeccion["filas"]
+    ] == [
+        (1, None, None, 1, 100.0, 50.0),
+        (2, "Norte", cobrador_id, 1, 100.0, 66.67),
+        (3, None, None, 1, 100.0, 50.0),
+        (5, "Norte", cobrador_id, 1, 100.0, 0.0),
+    ]
+    assert [d["acumulado"] for d in proyeccion["diario"]] == [100.0, 200.0, 300.0, 300.0, 400.0, 400.0, 400.0]
+    assert (proyeccion["total_esperado"], proyeccion["total_ajustado"]) == (400.0, 166.67)
+
+    sin_descontar = proyectar_flujo_caja(db, dias=7, desde=date(2024, 7, 1), zona="Norte")
+    assert sin_descontar["tasa_general"] is None
+    assert [(f["fecha"].day, f["ajustado"]) for f in sin_descontar["filas"]] == [(2, 100.0), (5, 100.0)]
+
+def test_flujo_caja_se_cachea_por_dia(authorized_client, test_cliente, db):
+    """
+    🇪🇸 La segunda consulta del día se sirve desde caché
+    🇺🇸 The day's second request is served from the cache
+    """
+    for _ in range(2):
+        response = authorized_client.get("/api/v1/reportes/flujo-caja", params={"dias": 14, "descontar": True})
+        assert response.status_code == 200
+        assert len(response.json()["diario"]) == 14
+    assert (cache_proyecciones.fallos, cache_proyecciones.aciertos) == (1, 1)
+
+    response = authorized_client.get("/api/v1/reportes/flujo-caja", params={"dias": 0})
+    assert response.status_code == 422
@@ -0,0 +1,105 @@
+"""
+🇪🇸 Tests de la generación automática de cobranzas
+🇺🇸 Tests for automatic collection generation
+"""
+from datetime import datetime
+from app.models import Cliente
+from app.models.cobranza import Cobranza, EstadoCobranza
+from app.models.pago import Pago
+from app.models.resumen_cobranza import ResumenCobranzaDiario
+from app.models.ruta import Ruta
+from app.utils import generador_cobranzas
+from app.utils.generador_cobranzas import generar_cobranzas, segundos_hasta
+from app.utils.resumen_cobranzas import acumular, aporte
+
+def _crear_prestamo(authorized_client, cliente_id: int) -> int:
+    response = authorized_client.post("/api/v1/prestamos/", json={
+        "cliente_id": cliente_id,
+        "monto": 300.0,
+        "interes": 0.0,
+        "plazo": 3,
+        "frecuencia_pago": "diario"
+    })
+    return response.json()["id"]
+
+def test_generar_cobranzas_idempotente(authorized_client, test_user, test_cliente, db):
+    """
+    🇪🇸 Crea una cobranza por cuota del día asignada al cobrador de la ruta del
+    cliente, por lotes y sin duplicar al repetirse
+    🇺🇸 Creates one collection per installment of the day assigned to the collector
+    of the client's route, in chunks and without duplicating when repeated
+    """
+    cobrador_id = test_user.id
+    ruta = Ruta(nombre="Ruta 1", zona="Norte", cobrador_id=cobrador_id)
+    sin_ruta = Cliente(
+        cedula="999", nombre="Luis", apellido="Gómez", telefono="300",
+        direccion="Calle 9", email="luis@example.com"
+    )
+    db.add_all([ruta, sin_ruta])
+    db.flush()
+    test_cliente.ruta_id = ruta.id
+    db.commit()
+    cliente_id, sin_ruta_id, ruta_id = test_cliente.id, sin_ruta.id, ruta.id
+
+    for _ in range(2):
+        _crear_prestamo(authorized_client, cliente_id)
+    _crear_prestamo(authorized_client, sin_ruta_id)
+    dia = db.query(Pago.fecha_programada).filter(Pago.numero_cuota == 1).first()[0].date()
+
+    assert generar_cobranzas(db, dia, tamano_lote=1) == {"cobranzas_creadas": 2, "sin_ruta": 1}
+    cobranzas = db.query(Cobranza).all()
+    assert len(cobranzas) == 2
+    assert all(c.cobrador_id == cobrador_id and c.ruta_id == ruta_id for c in cobranzas)
+    assert all(c.zona == "Norte" and c.direccion_cobro == "Calle 1 # 2-3" for c in cobranzas)
+    assert all(c.estado == EstadoCobranza.PENDIENTE and c.monto_esperado == 100.0 for c in cobranzas)
+
+    resumen = db.query(ResumenCobranzaDiario).filter(ResumenCobranzaDiario.fecha == dia).one()
+    assert (resumen.cobrador_id, resumen.cantidad, resumen.monto_esperado) == (cobrador_id, 2, 200.0)
+
+    response = authorized_client.post("/api/v1/cobranzas/generar", params={"fecha": dia.isoformat()})
+    assert response.status_code == 200
+    assert response.json() == {"cobranzas_creadas": 0, "sin_ruta": 1}
+    assert db.query(Cobranza).count() == 2
+
+def test_generacion_simultanea_no_duplica(authorized_client, test_user, test_cliente, db, monkeypatch):
+    """
+    🇪🇸 Si otra ejecución crea cobranzas después de leer el lote, el INSERT las omite
+    y el resumen no las cuenta dos veces
+    🇺🇸 If another run creates collections after the chunk was read, the INSERT skips
+    them and the summary does not count them twice
+    """
+    ruta = Ruta(nombre="Ruta 1", zona="Norte", cobrador_id=test_user.id)
+    db.add(ruta)
+    db.flush()
+    test_cliente.ruta_id = ruta.id
+    db.commit()
+    for _ in range(2):
+        _crear_prestamo(authorized_client, test_cliente.id)
+    dia = db.query(Pago.fecha_programada).filter(Pago.numero_cuota == 1).first()[0].date()
+    assert generar_cobranzas(db, dia)["cobranzas_creadas"] == 2
+
+    # 🇪🇸 Queda una de las dos, como si la otra ejecución no hubiera terminado
+    # 🇺🇸 One of the two is left, as if the other run had not finished
+    borrada = db.query(Cobranza).first()
+    acumular(db, antes=[aporte(borrada)])
+    db.delete(borrada)
+    db.commit()
+
+    # 🇪🇸 Sin el NOT EXISTS, el lote incluye la cuota que ya tiene cobranza
+    # 🇺🇸 Without the NOT EXISTS, the chunk includes the installment that already has one
+    original = generador_cobranzas._cuotas_del_dia
+    monkeypatch.setattr(generador_cobranzas, "_cuotas_del_dia", lambda fecha: original(fecha)[:-1])
+    assert generar_cobranzas(db, dia)["cobranzas_creadas"] == 1
+
+    assert db.query(Cobranza).count() == 2
+    db.expire_all()
+    resumen = db.query(ResumenCobranzaDiario).filter(ResumenCobranzaDiario.fecha == dia).one()
+    assert (resumen.cantidad, resumen.monto_esperado) == (2, 200.0)
+
+def test_segundos_hasta_la_proxima_hora():
+    """
+    🇪🇸 La próxima ejecución es hoy si la hora no ha pasado, si no mañana
+    🇺🇸 The next run is today if the hour has not passed yet, tomorrow otherwise
+    """
+    assert segundos_hasta(20, datetime(2024, 5, 3, 19, 30)) == 30 * 60
+    assert segundos_hasta(20, datetime(2024, 5, 3, 20, 0)) == 24 * 3600
@@ -0,0 +1,76 @@
+"""
+🇪🇸 Tests de índices compuestos y migraciones
+🇺🇸 Tests for composite indexes and migrations
+"""
+import os
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, text
+
+from app.database import Base
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CONSULTAS = {
+    "ix_pagos_prestamo_estado":
+        "SELECT * FROM pagos WHERE prestamo_id = 1 AND estado = 'PENDIENTE'",
+    "ix_pagos_estado_fecha_programada":
+        "SELECT * FROM pagos WHERE estado = 'PENDIENTE' AND fecha_programada < '2024-01-01'",
+    "ix_cobranzas_cobrador_fecha":
+        "SELECT * FROM cobranzas WHERE cobrador_id = 1 "
+        "AND fecha_programada >= '2024-01-01' AND fecha_programada < '2024-01-02'",
+    "ix_cobranzas_fecha_zona_cobrador_orden":
+        "SELECT * FROM cobranzas WHERE fecha_programada >= '2024-01-01' "
+        "AND fecha_programada < '2024-01-02' ORDER BY fecha_programada, zona, cobrador_id, orden_ruta",
+}
+
+@pytest.fixture
+def engine_migrado(tmp_path):
+    """
+    🇪🇸 Base de datos SQLite temporal migrada hasta la última revisión
+    🇺🇸 Temporary SQLite database migrated to the latest revision
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'migracion.db'}")
+    config = Config()
+    config.set_main_option("script_location", os.path.join(RAIZ, "alembic"))
+    with engine.begin() as conexion:
+        config.attributes["connection"] = conexion
+        command.upgrade(config, "head")
+    yield engine
+    engine.dispose()
+
+def _plan(conexion, consulta: str) -> str:
+    filas = conexion.execute(text(f"EXPLAIN QUERY PLAN {consulta}")).fetchall()
+    return " | ".join(fila[-1] for fila in filas)
+
+def test_migraciones_coinciden_con_modelos(engine_migrado):
+    """
+    🇪🇸 Las migraciones producen exactamente el esquema declarado en los modelos
+    🇺🇸 Migrations produce exactly the schema declared in the models
+    """
+    with engine_migrado.connect() as conexion:
+        contexto = MigrationContext.configure(conexion)
+        assert compare_metadata(contexto, Base.metadata) == []
+
+@pytest.mark.parametrize("indice", sorted(CONSULTAS))
+def test_plan_usa_indice_compuesto(engine_migrado, indice):
+    """
+    🇪🇸 Con el índice la consulta lo usa; sin los índices compuestos, recorre la tabla
+    🇺🇸 With the index the query uses it; without the composite indexes, it scans the table
+    """
+    consulta = CONSULTAS[indice]
+    with engine_migrado.begin() as conexion:
+        assert indice in _plan(conexion, consulta)
+        for nombre in CONSULTAS:
+            conexion.execute(text(f"DROP INDEX {nombre}"))
+
+    # 🇪🇸 Conexión nueva: SQLite guarda en caché los planes ya preparados
+    # 🇺🇸 New connection: SQLite caches already prepared plans
+    engine_migrado.dispose()
+    with engine_migrado.connect() as conexion:
+        plan = _plan(conexion, consulta)
+    assert indice not in plan
+    assert "SCAN" in plan
@@ -0,0 +1,137 @@
+"""
+🇪🇸 Tests del barrido de morosidad
+🇺🇸 Tests for the overdue sweep
+"""
+import json
+from datetime import datetime, timedelta
+from app.models.cobranza import Cobranza
+from app.models.pago import Pago, EstadoPago
+from app.models.prestamo import Prestamo, EstadoPrestamo
+from app.routers import pagos as pagos_router
+from app.utils.morosidad import marcar_atrasados
+
+def _prestamo_con_cuotas_vencidas(authorized_client, db, cliente_id: int, vencidas: int) -> int:
+    """
+    🇪🇸 Crea un préstamo de 4 cuotas y mueve las primeras `vencidas` al pasado
+    🇺🇸 Creates a 4-installment loan and moves the first `vencidas` into the past
+    """
+    response = authorized_client.post("/api/v1/prestamos/", json={
+        "cliente_id": cliente_id,
+        "monto": 400.0,
+        "interes": 0.0,
+        "plazo": 4,
+        "frecuencia_pago": "diario"
+    })
+    prestamo_id = response.json()["id"]
+    for pago in db.query(Pago).filter(Pago.prestamo_id == prestamo_id, Pago.numero_cuota <= vencidas):
+        pago.fecha_programada = datetime.utcnow() - timedelta(days=10 - pago.numero_cuota)
+    db.commit()
+    return prestamo_id
+
+def test_barrido_marca_cuotas_y_prestamos(authorized_client, test_cliente, db):
+    """
+    🇪🇸 El barrido marca por lotes las cuotas vencidas y sus préstamos
+    🇺🇸 The sweep marks overdue installments and their loans in chunks
+    """
+    atrasado = _prestamo_con_cuotas_vencidas(authorized_client, db, test_cliente.id, 3)
+    al_dia = _prestamo_con_cuotas_vencidas(authorized_client, db, test_cliente.id, 0)
+
+    resultado = marcar_atrasados(db, tamano_lote=2)
+    assert resultado == {"cuotas_atrasadas": 3, "prestamos_atrasados": 1, "prestamos_al_dia": 0}
+    assert db.get(Prestamo, atrasado).estado == EstadoPrestamo.ATRASADO
+    assert db.get(Prestamo, al_dia).estado == EstadoPrestamo.ACTIVO
+
+    # 🇪🇸 Un segundo barrido no encuentra nada nuevo
+    # 🇺🇸 A second sweep finds nothing new
+    assert marcar_atrasados(db)["cuotas_atrasadas"] == 0
+
+    response = authorized_client.get("/api/v1/pagos/atrasados")
+    assert response.status_code == 200
+    datos = response.json()
+    assert [p["numero_cuota"] for p in datos] == [1, 2, 3]
+    assert all(p["estado"] == EstadoPago.ATRASADO.value for p in datos)
+
+def test_pagar_cuotas_atrasadas_reactiva_el_prestamo(authorized_client, test_cliente, db):
+    """
+    🇪🇸 Al pagar la última cuota atrasada el préstamo vuelve a ACTIVO
+    🇺🇸 Paying the last overdue installment moves the loan back to ACTIVO
+    """
+    prestamo_id = _prestamo_con_cuotas_vencidas(authorized_client, db, test_cliente.id, 2)
+    marcar_atrasados(db)
+    ids = [
+        pago.id for pago in
+        db.query(Pago).filter(Pago.prestamo_id == prestamo_id, Pago.estado == EstadoPago.ATRASADO)
+    ]
+
+    authorized_client.put(f"/api/v1/pagos/{ids[0]}", json={"estado": EstadoPago.PAGADO.value})
+    assert authorized_client.get(f"/api/v1/prestamos/{prestamo_id}").json()["estado"] == EstadoPrestamo.ATRASADO.value
+
+    authorized_client.put(f"/api/v1/pagos/{ids[1]}", json={"estado": EstadoPago.PAGADO.value})
+    prestamo = authorized_client.get(f"/api/v1/prestamos/{prestamo_id}").json()
+    assert prestamo["estado"] == EstadoPrestamo.ACTIVO.value
+    assert prestamo["cuotas_pagadas"] == 2
+
+def _asignar_cobranza(db, prestamo_id: int, cobrador_id: int, zona: str) -> None:
+    """
+    🇪🇸 Crea una cobranza para cada cuota atrasada del préstamo
+    🇺🇸 Creates a collection for each of the loan's overdue installments
+    """
+    for pago in db.query(Pago).filter(Pago.prestamo_id == prestamo_id, Pago.estado == EstadoPago.ATRASADO):
+        db.add(Cobranza(
+            pago_id=pago.id,
+            cobrador_id=cobrador_id,
+            monto_esperado=pago.monto,
+            zona=zona,
+            direccion_cobro="Calle 1",
+            fecha_programada=pago.fecha_programada
+        ))
+    db.commit()
+
+def test_pagos_atrasados_filtros_y_stream(authorized_client, test_user, test_cliente, db):
+    """
+    🇪🇸 Los filtros por zona, cobrador y días de atraso aplican al listado y al stream NDJSON
+    🇺🇸 Zone, collector and days-overdue filters apply to the list and the NDJSON stream
+    """
+    cobrador_id = test_user.id
+    norte = _prestamo_con_cuotas_vencidas(authorized_client, db, test_cliente.id, 3)
+    sur = _prestamo_con_cuotas_vencidas(authorized_client, db, test_cliente.id, 2)
+    marcar_atrasados(db)
+    _asignar_cobranza(db, norte, cobrador_id, "Norte")
+    _asignar_cobranza(db, sur, cobrador_id, "Sur")
+
+    response = authorized_client.get("/api/v1/pagos/atrasados", params={"zona": "Norte"})
+    assert {p["prestamo_id"] for p in response.json()} == {norte}
+    assert len(response.json()) == 3
+
+    response = authorized_client.get("/api/v1/pagos/atrasados", params={"cobrador_id": cobrador_id + 1})
+    assert response.json() == []
+
+    # 🇪🇸 Cuotas 1 y 2 vencieron hace 9 y 8 días; la 3, hace 7
+    # 🇺🇸 Installments 1 and 2 fell due 9 and 8 days ago; number 3, 7 days ago
+    response = authorized_client.get("/api/v1/pagos/atrasados", params={"dias_atraso_min": 8})
+    assert len(response.json()) == 4
+
+    response = authorized_client.get(
+        "/api/v1/pagos/atrasados/stream", params={"cobrador_id": cobrador_id}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lineas = [json.loads(linea) for linea in response.text.splitlines()]
+    assert len(lineas) == 5
+    assert [l["fecha_programada"] for l in lineas] == sorted(l["fecha_programada"] for l in lineas)
+    assert all(l["estado"] == EstadoPago.ATRASADO.value for l in lineas)
+
+def test_stream_pagos_atrasados_varias_paginas(authorized_client, test_cliente, db, monkeypatch):
+    """
+    🇪🇸 El stream recorre todas las páginas sin repetir ni omitir cuotas
+    🇺🇸 The stream walks every page without repeating or skipping installments
+    """
+    monkeypatch.setattr(pagos_router, "LIMITE_MAXIMO", 2)
+    for _ in range(3):
+        _prestamo_con_cuotas_vencidas(authorized_client, db, test_cliente.id, 3)
+    marcar_atrasados(db)
+
+    response = authorized_client.get("/api/v1/pagos/atrasados/stream")
+    ids = [json.loads(linea)["id"] for linea in response.text.splitlines()]
+    assert len(ids) == 9
+    assert len(set(ids)) == 9
@@ -79,4 +79,86 @@ def test_obtener_resumen_notificaciones(authorized_client, test_user, db):
     data = response.json()
     assert data["total_pendientes"] >= 3
     assert "por_tipo" in data
-    assert "por_canal" in data 
\ No newline at end of file
+    assert "por_canal" in data 
+
+def test_resumen_notificaciones_totales_por_grupo(test_user, db):
+    """
+    🇪🇸 El resumen agrupado cuadra los totales por estado, tipo y canal
+    🇺🇸 The grouped summary matches totals by state, type and channel
+    """
+    from app.models.notificacion import Notificacion
+    from app.utils.notificaciones import NotificationService
+
+    combinaciones = [
+        (EstadoNotificacion.PENDIENTE, TipoNotificacion.PAGO, CanalNotificacion.EMAIL),
+        (EstadoNotificacion.PENDIENTE, TipoNotificacion.ALERTA, CanalNotificacion.SMS),
+        (EstadoNotificacion.ENVIADA, TipoNotificacion.PAGO, CanalNotificacion.SMS),
+        (EstadoNotificacion.FALLIDA, TipoNotificacion.COBRANZA, CanalNotificacion.WHATSAPP),
+        (EstadoNotificacion.LEIDA, TipoNotificacion.PAGO, CanalNotificacion.EMAIL),
+    ]
+    db.add_all([
+        Notificacion(
+            tipo=tipo,
+            canal=canal,
+            titulo="Test",
+            mensaje="Test message",
+            usuario_id=test_user.id,
+            estado=estado
+        )
+        for estado, tipo, canal in combinaciones
+    ])
+    db.commit()
+
+    resumen = NotificationService(db).obtener_resumen()
+    assert resumen["total_pendientes"] == 2
+    assert resumen["total_enviadas"] == 1
+    assert resumen["total_fallidas"] == 1
+    assert resumen["total_leidas"] == 1
+    assert resumen["por_tipo"] == {"sistema": 0, "pago": 3, "prestamo": 0, "cobranza": 1, "alerta": 1}
+    assert resumen["por_canal"] == {"email": 2, "sms": 2, "whatsapp": 1, "telegram": 0, "push": 0}
+
+def test_contadores_del_resumen_siguen_cada_escritura(test_user, db):
+    """
+    🇪🇸 Los contadores acompañan altas, cambios (aun sobre objetos expirados), el
+    despacho masivo y bajas, y coinciden con una reconstrucción completa
+    🇺🇸 Counters follow inserts, changes (even on expired objects), bulk dispatch
+    and deletes, and match a full rebuild
+    """
+    import asyncio
+    from app.models.notificacion import Notificacion
+    from app.utils.notificaciones import NotificationService
+    from app.utils.resumen_notificaciones import recalcular
+
+    notificaciones = [
+        Notificacion(
+            tipo=TipoNotificacion.PAGO if i < 4 else TipoNotificacion.ALERTA,
+            canal=CanalNotificacion.SMS,
+            titulo=f"Test {i}",
+            mensaje="Test message",
+            usuario_id=test_user.id,
+            estado=EstadoNotificacion.PENDIENTE if i < 4 else EstadoNotificacion.FALLIDA
+        )
+        for i in range(6)
+    ]
+    db.add_all(notificaciones)
+    db.commit()
+    ids = [n.id for n in notificaciones]
+
+    servicio = NotificationService(db)
+    servicio.marcar_como_leida(ids[0])
+    notificaciones[1].tipo = TipoNotificacion.SISTEMA
+    db.commit()
+    db.delete(db.get(Notificacion, ids[2]))
+    db.commit()
+    asyncio.run(servicio.despachar([EstadoNotificacion.FALLIDA]))
+
+    resumen = servicio.obtener_resumen()
+    assert resumen["total_pendientes"] == 2
+    assert resumen["total_enviadas"] == 2
+    assert resumen["total_fallidas"] == 0
+    assert resumen["total_leidas"] == 1
+    assert resumen["por_tipo"] == {"sistema": 1, "pago": 2, "prestamo": 0, "cobranza": 0, "alerta": 2}
+
+    recalcular(db)
+    db.commit()
+    assert servicio.obtener_resumen() == resumen
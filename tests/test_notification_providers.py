@@ -0,0 +1,152 @@
+"""
+🇪🇸 Tests para los proveedores de notificaciones y sus conexiones
+🇺🇸 Tests for notification providers and their connections
+"""
+import asyncio
+import smtplib
+import httpx
+from app.models.notificacion import CanalNotificacion
+from app.utils import conexiones
+from app.utils.conexiones import PoolSMTP
+from app.utils.notification_providers import (
+    EmailNotificationProvider,
+    MockNotificationProvider,
+    RegistroProveedores,
+    TelegramNotificationProvider
+)
+
+class SMTPFalso:
+    """
+    🇪🇸 Servidor SMTP simulado que cuenta conexiones y envíos
+    🇺🇸 Fake SMTP server counting connections and sends
+    """
+    conexiones = 0
+    enviados = []
+
+    def __init__(self, host, port, timeout=None):
+        SMTPFalso.conexiones += 1
+
+    def starttls(self):
+        pass
+
+    def login(self, username, password):
+        pass
+
+    def sendmail(self, remitente, destinatario, contenido):
+        SMTPFalso.enviados.append(destinatario)
+
+    def quit(self):
+        pass
+
+def test_pool_smtp_reutiliza_conexiones(monkeypatch):
+    """
+    🇪🇸 Varios correos seguidos usan una sola conexión SMTP
+    🇺🇸 Several consecutive emails use a single SMTP connection
+    """
+    SMTPFalso.conexiones, SMTPFalso.enviados = 0, []
+    monkeypatch.setattr(conexiones.smtplib, "SMTP", SMTPFalso)
+    pool = PoolSMTP("smtp.test", 587, "user", "pass")
+    provider = EmailNotificationProvider(pool=pool)
+
+    async def enviar_varios():
+        return await asyncio.gather(*(
+            provider.send_notification(f"cliente{i}@example.com", "Titulo", "Mensaje")
+            for i in range(3)
+        ))
+
+    assert asyncio.run(enviar_varios()) == [True, True, True]
+    assert len(SMTPFalso.enviados) == 3
+    assert SMTPFalso.conexiones <= 3
+    asyncio.run(enviar_varios())
+    assert len(SMTPFalso.enviados) == 6
+    assert SMTPFalso.conexiones <= 3
+    pool.cerrar()
+
+class SMTPDesconectado(SMTPFalso):
+    """
+    🇪🇸 Conexión que el servidor ya cerró por inactividad
+    🇺🇸 Connection the server already closed for being idle
+    """
+    cerradas = 0
+
+    def sendmail(self, remitente, destinatario, contenido):
+        raise smtplib.SMTPServerDisconnected("conexión cerrada")
+
+    def quit(self):
+        raise smtplib.SMTPServerDisconnected("conexión cerrada")
+
+    def close(self):
+        SMTPDesconectado.cerradas += 1
+
+def test_pool_smtp_cierra_conexion_caida(monkeypatch):
+    """
+    🇪🇸 Al reconectar tras una desconexión, la conexión vieja se cierra
+    🇺🇸 When reconnecting after a disconnect, the old connection is closed
+    """
+    SMTPFalso.conexiones, SMTPFalso.enviados, SMTPDesconectado.cerradas = 0, [], 0
+    monkeypatch.setattr(conexiones.smtplib, "SMTP", SMTPFalso)
+    pool = PoolSMTP("smtp.test", 587, "user", "pass")
+    caida = SMTPDesconectado("smtp.test", 587)
+    pool._libres.put(caida)
+
+    pool.enviar("app@example.com", "cliente@example.com", "Mensaje")
+
+    assert SMTPDesconectado.cerradas == 1
+    assert SMTPFalso.enviados == ["cliente@example.com"]
+    assert caida not in list(pool._libres.queue)
+    pool.cerrar()
+
+def test_proveedor_http_usa_cliente_asincrono():
+    """
+    🇪🇸 Telegram envía por el cliente HTTP asíncrono compartido
+    🇺🇸 Telegram sends through the shared async HTTP client
+    """
+    solicitudes = []
+
+    def responder(request):
+        solicitudes.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    async def enviar():
+        provider = TelegramNotificationProvider(
+            cliente=httpx.AsyncClient(transport=httpx.MockTransport(responder))
+        )
+        try:
+            return await provider.send_notification("123", "Hola", "Mundo")
+        finally:
+            await provider.cerrar()
+
+    assert asyncio.run(enviar()) is True
+    assert len(solicitudes) == 1
+    assert solicitudes[0].url.path.endswith("/sendMessage")
+
+class ProveedorConCiclo(MockNotificationProvider):
+    """
+    🇪🇸 Proveedor simulado que registra su ciclo de vida
+    🇺🇸 Mock provider recording its lifecycle
+    """
+    def __init__(self):
+        self.eventos = []
+
+    async def iniciar(self):
+        self.eventos.append("iniciar")
+
+    async def cerrar(self):
+        self.eventos.append("cerrar")
+
+def test_registro_reutiliza_proveedores():
+    """
+    🇪🇸 El registro devuelve siempre la misma instancia y gestiona su ciclo de vida
+    🇺🇸 The registry always returns the same instance and manages its lifecycle
+    """
+    proveedor = ProveedorConCiclo()
+    registro = RegistroProveedores()
+    registro.registrar(CanalNotificacion.SMS, proveedor)
+    registro.registrar(CanalNotificacion.WHATSAPP, proveedor)
+
+    assert registro.obtener(CanalNotificacion.SMS) is registro.obtener(CanalNotificacion.SMS)
+    assert isinstance(registro.obtener(CanalNotificacion.PUSH), MockNotificationProvider)
+
+    asyncio.run(registro.iniciar())
+    asyncio.run(registro.cerrar())
+    assert proveedor.eventos == ["iniciar", "cerrar"]
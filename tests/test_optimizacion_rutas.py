@@ -0,0 +1,170 @@
+"""
+🇪🇸 Tests de la optimización del orden de las rutas
+🇺🇸 Tests for route order optimization
+"""
+from datetime import datetime
+import numpy as np
+from app.models.cobranza import Cobranza
+from app.utils.optimizacion_rutas import (
+    matriz_distancias,
+    longitud_recorrido,
+    vecino_mas_cercano,
+    dos_opt,
+    optimizar_orden,
+    optimizar_grupos,
+    iniciar_pool,
+    cerrar_pool
+)
+
+def test_matriz_distancias_haversine():
+    """
+    🇪🇸 Un grado de latitud mide unos 111 km y la matriz es simétrica
+    🇺🇸 One degree of latitude is about 111 km and the matrix is symmetric
+    """
+    distancias = matriz_distancias([0.0, 1.0, 4.6], [0.0, 0.0, -74.1])
+    assert abs(distancias[0, 1] - 111.19) < 0.05
+    assert np.allclose(distancias, distancias.T)
+    assert np.allclose(np.diagonal(distancias), 0.0)
+
+def test_paradas_en_linea_se_visitan_en_orden():
+    """
+    🇪🇸 Puntos sobre una misma calle se recorren de un extremo al otro
+    🇺🇸 Points along the same street are visited from one end to the other
+    """
+    longitudes = [-74.05, -74.01, -74.09, -74.03, -74.07]
+    orden = optimizar_orden([4.6] * 5, longitudes)
+    visitas = [longitudes[i] for i in orden]
+    assert visitas in (sorted(longitudes), sorted(longitudes, reverse=True))
+
+    # 🇪🇸 Con origen al oeste el recorrido empieza por la parada más occidental
+    # 🇺🇸 With an origin to the west the tour starts at the westernmost stop
+    orden = optimizar_orden([4.6] * 5, longitudes, origen=(4.6, -74.2))
+    assert [longitudes[i] for i in orden] == sorted(longitudes)
+
+def test_dos_opt_no_empeora_el_vecino_mas_cercano():
+    """
+    🇪🇸 2-opt devuelve una permutación nunca más larga que la inicial
+    🇺🇸 2-opt returns a permutation never longer than the initial one
+    """
+    rng = np.random.default_rng(3)
+    for _ in range(5):
+        distancias = matriz_distancias(rng.uniform(4.5, 4.8, 40), rng.uniform(-74.2, -74.0, 40))
+        inicial = vecino_mas_cercano(distancias)
+        mejorado = dos_opt(distancias, inicial)
+        assert sorted(mejorado) == list(range(40))
+        assert longitud_recorrido(distancias, mejorado) <= longitud_recorrido(distancias, inicial) + 1e-9
+
+def test_optimizar_grupos_con_procesos_igual_que_en_serie():
+    """
+    🇪🇸 El pool compartido da el mismo resultado que el cálculo en serie
+    🇺🇸 The shared pool gives the same result as the serial computation
+    """
+    rng = np.random.default_rng(5)
+    grupos = [
+        (rng.uniform(4.5, 4.8, 12).tolist(), rng.uniform(-74.2, -74.0, 12).tolist())
+        for _ in range(20)
+    ]
+    en_serie = optimizar_grupos(grupos)
+    iniciar_pool(2)
+    try:
+        assert optimizar_grupos(grupos) == en_serie
+    finally:
+        cerrar_pool()
+
+def test_endpoint_optimizar_ruta(authorized_client, test_user, db):
+    """
+    🇪🇸 El endpoint reescribe `orden_ruta` y deja al final las paradas sin coordenadas
+    🇺🇸 The endpoint rewrites `orden_ruta` and leaves stops without coordinates last
+    """
+    cobrador_id = test_user.id
+    paradas = [(-74.03, 1), (None, 2), (-74.09, 3), (-74.01, 4), (-74.06, 5)]
+    for longitud, orden in paradas:
+        authorized_client.post("/api/v1/cobranzas/", json={
+            "pago_id": orden,
+            "cobrador_id": cobrador_id,
+            "monto_esperado": 100.0,
+            "zona": "Norte",
+            "direccion_cobro": "Calle 1",
+            "fecha_programada": datetime(2024, 5, 3, 9).isoformat(),
+            "orden_ruta": orden,
+            "latitud": 4.6 if longitud is not None else None,
+            "longitud": longitud,
+        })
+
+    response = authorized_client.post(
+        "/api/v1/cobranzas/ruta/2024-05-03/optimizar",
+        params={"latitud_origen": 4.6, "longitud_origen": -74.0}
+    )
+    assert response.status_code == 200
+    assert response.json()["cobradores"] == 1
+    assert response.json()["rutas"] == 1
+    assert response.json()["paradas"] == 5
+
+    db.expire_all()
+    visitas = db.query(Cobranza.longitud).order_by(Cobranza.orden_ruta).all()
+    assert [v.longitud for v in visitas] == [-74.01, -74.03, -74.06, -74.09, None]
+
+    response = authorized_client.post(
+        "/api/v1/cobranzas/ruta/2024-05-03/optimizar", params={"latitud_origen": 4.6}
+    )
+    assert response.status_code == 400
+
+def test_rutas_por_zona_y_cobrador(authorized_client, test_user, db):
+    """
+    🇪🇸 Las paradas de un cobrador en dos zonas forman dos rutas, como en `rutas_del_dia`
+    🇺🇸 A collector's stops in two zones make two routes, as in `rutas_del_dia`
+    """
+    cobrador_id = test_user.id
+    paradas = [("Norte", -74.01, 1), ("Sur", -74.02, 2), ("Norte", -74.03, 3), ("Sur", -74.04, 4)]
+    for zona, longitud, orden in paradas:
+        authorized_client.post("/api/v1/cobranzas/", json={
+            "pago_id": orden,
+            "cobrador_id": cobrador_id,
+            "monto_esperado": 100.0,
+            "zona": zona,
+            "direccion_cobro": f"Calle {orden}",
+            "fecha_programada": datetime(2024, 5, 3, 9).isoformat(),
+            "orden_ruta": orden,
+            "latitud": 4.6,
+            "longitud": longitud,
+        })
+
+    response = authorized_client.post(
+        "/api/v1/cobranzas/ruta/2024-05-03/optimizar",
+        params={"latitud_origen": 4.6, "longitud_origen": -74.0}
+    )
+    assert response.status_code == 200
+    assert response.json()["cobradores"] == 1
+    assert response.json()["rutas"] == 2
+
+    db.expire_all()
+    visitas = db.query(Cobranza.zona, Cobranza.orden_ruta, Cobranza.longitud).order_by(
+        Cobranza.zona, Cobranza.orden_ruta
+    ).all()
+    assert visitas == [("Norte", 1, -74.01), ("Norte", 2, -74.03), ("Sur", 1, -74.02), ("Sur", 2, -74.04)]
+
+def test_cobrador_sin_coordenadas_conserva_su_orden(authorized_client, test_user, db):
+    """
+    🇪🇸 Un cobrador cuyas paradas no tienen coordenadas conserva su orden actual
+    🇺🇸 A collector whose stops have no coordinates keeps their current order
+    """
+    assert optimizar_orden([], []) == []
+    cobrador_id = test_user.id
+    for orden in (3, 1, 2):
+        authorized_client.post("/api/v1/cobranzas/", json={
+            "pago_id": orden,
+            "cobrador_id": cobrador_id,
+            "monto_esperado": 100.0,
+            "zona": "Norte",
+            "direccion_cobro": f"Calle {orden}",
+            "fecha_programada": datetime(2024, 5, 3, 9).isoformat(),
+            "orden_ruta": orden,
+        })
+
+    response = authorized_client.post("/api/v1/cobranzas/ruta/2024-05-03/optimizar")
+    assert response.status_code == 200
+    assert response.json()["paradas"] == 3
+
+    db.expire_all()
+    visitas = db.query(Cobranza.direccion_cobro, Cobranza.orden_ruta).order_by(Cobranza.orden_ruta).all()
+    assert visitas == [("Calle 1", 1), ("Calle 2", 2), ("Calle 3", 3)]
@@ -0,0 +1,108 @@
+"""
+🇪🇸 Tests para la paginación por cursor
+🇺🇸 Tests for cursor pagination
+"""
+from app.models import Cliente
+from app.utils.paginacion import CABECERA_CURSOR, codificar_cursor, paginar
+
+def _crear_clientes(db, cantidad):
+    db.add_all([
+        Cliente(
+            cedula=f"C{i:04d}",
+            nombre=f"Nombre {i}",
+            apellido=f"Apellido {i % 3}",
+            telefono="3000000000",
+            direccion="Calle 1",
+            email=f"cliente{i}@example.com",
+        )
+        for i in range(cantidad)
+    ])
+    db.commit()
+
+def _recorrer(client, url):
+    ids, cursor, paginas = [], None, 0
+    while True:
+        params = {"limit": 4}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(url, params=params)
+        assert response.status_code == 200
+        ids.extend(item["id"] for item in response.json())
+        paginas += 1
+        cursor = response.headers.get(CABECERA_CURSOR)
+        if not cursor:
+            return ids, paginas
+
+def test_paginacion_por_cursor_recorre_todo(authorized_client, db):
+    """
+    🇪🇸 Recorrer todas las páginas devuelve cada cliente una sola vez
+    🇺🇸 Walking every page returns each client exactly once
+    """
+    _crear_clientes(db, 10)
+    ids, paginas = _recorrer(authorized_client, "/api/v1/clientes/")
+    assert paginas == 3
+    assert ids == sorted(ids)
+    assert len(set(ids)) == 10
+
+def test_paginacion_con_orden_descendente(authorized_client, db):
+    """
+    🇪🇸 El cursor respeta una columna de orden descendente con empates
+    🇺🇸 The cursor honours a descending sort column with ties
+    """
+    _crear_clientes(db, 9)
+    vistos, cursor = [], None
+    while True:
+        params = {"limit": 2, "orden": "-apellido"}
+        if cursor:
+            params["cursor"] = cursor
+        response = authorized_client.get("/api/v1/clientes/", params=params)
+        assert response.status_code == 200
+        vistos.extend((c["apellido"], c["id"]) for c in response.json())
+        cursor = response.headers.get(CABECERA_CURSOR)
+        if not cursor:
+            break
+    assert vistos == sorted(vistos, key=lambda v: (v[0], v[1]), reverse=True)
+    assert len(vistos) == 9
+
+def test_paginacion_con_nulos_en_la_columna_de_orden(db):
+    """
+    🇪🇸 Los nulos van al final (al principio en descendente) sin saltar filas
+    🇺🇸 NULLs go last (first when descending) without skipping rows
+    """
+    _crear_clientes(db, 8)
+    for cliente in db.query(Cliente).filter(Cliente.id % 3 == 0):
+        cliente.apellido = None
+    db.commit()
+
+    for orden in ("apellido", "-apellido"):
+        vistos, cursor = [], None
+        while True:
+            pagina, cursor = paginar(
+                db.query(Cliente), Cliente, cursor, 2, orden, {"apellido": Cliente.apellido}
+            )
+            vistos.extend((c.apellido, c.id) for c in pagina)
+            if not cursor:
+                break
+        esperado = sorted(vistos, key=lambda v: (v[0] is None, v[0] or "", v[1]), reverse=orden.startswith("-"))
+        assert vistos == esperado
+        assert len(vistos) == 8
+
+def test_paginacion_rechaza_cursor_invalido(authorized_client):
+    """
+    🇪🇸 Un cursor corrupto o un orden no permitido devuelven 400
+    🇺🇸 A corrupt cursor or a disallowed sort return 400
+    """
+    assert authorized_client.get("/api/v1/clientes/", params={"cursor": "xyz"}).status_code == 400
+    assert authorized_client.get("/api/v1/clientes/", params={"orden": "email"}).status_code == 400
+
+    # 🇪🇸 Cursores bien codificados pero con valores adulterados
+    # 🇺🇸 Well-encoded cursors carrying tampered values
+    adulterados = [
+        (None, {"o": None, "id": "abc"}),
+        ("fecha_registro", {"o": "fecha_registro", "id": 1, "v": "ayer"}),
+    ]
+    for orden, datos in adulterados:
+        response = authorized_client.get(
+            "/api/v1/clientes/", params={"cursor": codificar_cursor(datos), "orden": orden}
+        )
+        assert response.status_code == 400
@@ -0,0 +1,99 @@
+"""
+🇪🇸 Tests para la gestión de pagos
+🇺🇸 Tests for payment management
+"""
+from app.models.pago import EstadoPago
+from app.models.prestamo import EstadoPrestamo
+
+def _crear_prestamo(authorized_client, cliente_id: int, plazo: int = 3) -> dict:
+    response = authorized_client.post("/api/v1/prestamos/", json={
+        "cliente_id": cliente_id,
+        "monto": 300.0,
+        "interes": 0.0,
+        "plazo": plazo,
+        "frecuencia_pago": "semanal"
+    })
+    assert response.status_code == 200
+    return response.json()
+
+def _prestamo(authorized_client, prestamo_id: int) -> dict:
+    return authorized_client.get(f"/api/v1/prestamos/{prestamo_id}").json()
+
+def test_contadores_iniciales_del_prestamo(authorized_client, test_cliente):
+    """
+    🇪🇸 Un préstamo nuevo tiene todas sus cuotas pendientes
+    🇺🇸 A new loan has all its installments pending
+    """
+    prestamo = _crear_prestamo(authorized_client, test_cliente.id)
+    assert prestamo["cuotas_pagadas"] == 0
+    assert prestamo["cuotas_pendientes"] == 3
+    assert prestamo["saldo_pendiente"] == 300.0
+    assert prestamo["fecha_proxima_cuota"] == prestamo["pagos"][0]["fecha_programada"]
+
+def test_pagar_todas_las_cuotas_completa_el_prestamo(authorized_client, test_cliente):
+    """
+    🇪🇸 Cada pago actualiza los contadores y el último completa el préstamo
+    🇺🇸 Each payment updates the counters and the last one completes the loan
+    """
+    prestamo = _crear_prestamo(authorized_client, test_cliente.id)
+    cuotas = prestamo["pagos"]
+
+    for i, cuota in enumerate(cuotas[:-1], start=1):
+        response = authorized_client.put(
+            f"/api/v1/pagos/{cuota['id']}", json={"estado": EstadoPago.PAGADO.value}
+        )
+        assert response.status_code == 200
+        actual = _prestamo(authorized_client, prestamo["id"])
+        assert actual["cuotas_pagadas"] == i
+        assert actual["cuotas_pendientes"] == 3 - i
+        assert actual["saldo_pendiente"] == 300.0 - 100.0 * i
+        assert actual["fecha_proxima_cuota"] == cuotas[i]["fecha_programada"]
+        assert actual["estado"] == EstadoPrestamo.ACTIVO.value
+
+    # 🇪🇸 Repetir un pago ya registrado no altera los contadores
+    # 🇺🇸 Repeating an already recorded payment leaves the counters unchanged
+    authorized_client.put(f"/api/v1/pagos/{cuotas[0]['id']}", json={"estado": EstadoPago.PAGADO.value})
+    assert _prestamo(authorized_client, prestamo["id"])["cuotas_pagadas"] == 2
+
+    authorized_client.put(f"/api/v1/pagos/{cuotas[-1]['id']}", json={"estado": EstadoPago.PAGADO.value})
+    actual = _prestamo(authorized_client, prestamo["id"])
+    assert actual["estado"] == EstadoPrestamo.COMPLETADO.value
+    assert actual["cuotas_pendientes"] == 0
+    assert actual["saldo_pendiente"] == 0.0
+    assert actual["fecha_proxima_cuota"] is None
+
+def test_revertir_pago_reabre_el_prestamo(authorized_client, test_cliente):
+    """
+    🇪🇸 Volver una cuota a atrasada reabre un préstamo completado como atrasado
+    🇺🇸 Moving an installment back to overdue reopens a completed loan as overdue
+    """
+    prestamo = _crear_prestamo(authorized_client, test_cliente.id, plazo=1)
+    cuota, = prestamo["pagos"]
+
+    authorized_client.put(f"/api/v1/pagos/{cuota['id']}", json={"estado": EstadoPago.PAGADO.value})
+    assert _prestamo(authorized_client, prestamo["id"])["estado"] == EstadoPrestamo.COMPLETADO.value
+
+    authorized_client.put(f"/api/v1/pagos/{cuota['id']}", json={"estado": EstadoPago.ATRASADO.value})
+    actual = _prestamo(authorized_client, prestamo["id"])
+    assert actual["estado"] == EstadoPrestamo.ATRASADO.value
+    assert actual["cuotas_pendientes"] == 1
+    assert actual["saldo_pendiente"] == 300.0
+
+def test_crear_pago_suma_cuota_pendiente(authorized_client, test_cliente):
+    """
+    🇪🇸 Registrar una cuota adicional aumenta el saldo pendiente
+    🇺🇸 Registering an extra installment increases the outstanding balance
+    """
+    prestamo = _crear_prestamo(authorized_client, test_cliente.id)
+    response = authorized_client.post("/api/v1/pagos/", json={
+        "prestamo_id": prestamo["id"],
+        "numero_cuota": 4,
+        "monto": 50.0,
+        "fecha_programada": "2000-01-01T00:00:00"
+    })
+    assert response.status_code == 200
+
+    actual = _prestamo(authorized_client, prestamo["id"])
+    assert actual["cuotas_pendientes"] == 4
+    assert actual["saldo_pendiente"] == 350.0
+    assert actual["fecha_proxima_cuota"] == "2000-01-01T00:00:00"
@@ -0,0 +1,135 @@
+"""
+🇪🇸 Tests para la gestión de préstamos
+🇺🇸 Tests for loan management
+"""
+import re
+from contextlib import contextmanager
+from sqlalchemy import event
+from app.models.pago import Pago, EstadoPago
+from app.models.prestamo import EstadoPrestamo, Prestamo
+from app.schemas.prestamo import MAXIMO_PRESTAMOS_LOTE
+
+def test_crear_prestamo_genera_cuotas(authorized_client, test_cliente, db):
+    """
+    🇪🇸 Test de creación de préstamo con su cronograma completo
+    🇺🇸 Test loan creation with its full schedule
+    """
+    prestamo_data = {
+        "cliente_id": test_cliente.id,
+        "monto": 1000.0,
+        "interes": 20.0,
+        "plazo": 24,
+        "frecuencia_pago": "diario"
+    }
+
+    response = authorized_client.post("/api/v1/prestamos/", json=prestamo_data)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["estado"] == EstadoPrestamo.ACTIVO.value
+    assert data["monto_total"] == 1200.0
+    assert len(data["pagos"]) == 24
+    assert [p["numero_cuota"] for p in data["pagos"]] == list(range(1, 25))
+    assert all(p["estado"] == EstadoPago.PENDIENTE.value for p in data["pagos"])
+    assert data["fecha_fin"] == data["pagos"][-1]["fecha_programada"]
+
+def test_crear_prestamos_en_lote(authorized_client, test_cliente, db):
+    """
+    🇪🇸 Test de originación masiva de préstamos
+    🇺🇸 Test bulk loan origination
+    """
+    lote = [
+        {
+            "cliente_id": test_cliente.id,
+            "monto": 500.0 * i,
+            "interes": 10.0,
+            "plazo": 4 * i,
+            "frecuencia_pago": "semanal"
+        }
+        for i in range(1, 4)
+    ]
+
+    response = authorized_client.post("/api/v1/prestamos/lote", json=lote)
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 3
+    for prestamo, esperado in zip(data, lote):
+        assert prestamo["plazo"] == esperado["plazo"]
+        assert db.query(Pago).filter(Pago.prestamo_id == prestamo["id"]).count() == esperado["plazo"]
+
+def test_crear_prestamos_lote_vacio(authorized_client):
+    """
+    🇪🇸 Test de rechazo de un lote vacío
+    🇺🇸 Test rejection of an empty batch
+    """
+    response = authorized_client.post("/api/v1/prestamos/lote", json=[])
+    assert response.status_code == 400
+
+def test_crear_prestamos_lote_excede_maximo(authorized_client, test_cliente, db):
+    """
+    🇪🇸 Un lote con más de MAXIMO_PRESTAMOS_LOTE préstamos se rechaza sin crear ninguno
+    🇺🇸 A batch with more than MAXIMO_PRESTAMOS_LOTE loans is rejected without creating any
+    """
+    prestamo = {
+        "cliente_id": test_cliente.id,
+        "monto": 100.0,
+        "interes": 10.0,
+        "plazo": 2,
+        "frecuencia_pago": "semanal"
+    }
+    response = authorized_client.post(
+        "/api/v1/prestamos/lote", json=[prestamo] * (MAXIMO_PRESTAMOS_LOTE + 1)
+    )
+    assert response.status_code == 422
+    assert db.query(Prestamo).count() == 0
+
+@contextmanager
+def _consultas_prestamos(db):
+    """
+    🇪🇸 Registra los SELECT sobre préstamos, clientes y cuotas ejecutados en el bloque
+    🇺🇸 Records the SELECTs over loans, clients and installments run inside the block
+    """
+    consultas = []
+
+    def registrar(conn, cursor, sentencia, parametros, contexto, executemany):
+        if sentencia.lstrip().upper().startswith("SELECT") and re.search(r"FROM (prestamos|clientes|pagos)\b", sentencia):
+            consultas.append(sentencia)
+
+    motor = db.get_bind()
+    event.listen(motor, "before_cursor_execute", registrar)
+    try:
+        yield consultas
+    finally:
+        event.remove(motor, "before_cursor_execute", registrar)
+
+def test_detalle_de_prestamos_sin_n_mas_1(authorized_client, test_cliente, db):
+    """
+    🇪🇸 El detalle de uno o de muchos préstamos carga clientes y cuotas con un número
+    fijo de consultas
+    🇺🇸 The detail of one or many loans loads clients and installments with a fixed
+    number of queries
+    """
+    cliente_id = test_cliente.id
+    lote = [
+        {"cliente_id": cliente_id, "monto": 100.0, "interes": 0.0, "plazo": 3, "frecuencia_pago": "semanal"}
+        for _ in range(6)
+    ]
+    ids = [p["id"] for p in authorized_client.post("/api/v1/prestamos/lote", json=lote).json()]
+
+    with _consultas_prestamos(db) as consultas:
+        response = authorized_client.get(f"/api/v1/prestamos/{ids[0]}")
+    assert response.status_code == 200
+    assert [p["numero_cuota"] for p in response.json()["pagos"]] == [1, 2, 3]
+    assert len(consultas) == 2
+
+    for limite in (2, 6):
+        with _consultas_prestamos(db) as consultas:
+            response = authorized_client.get("/api/v1/prestamos/detalle", params={"limit": limite})
+        assert response.status_code == 200
+        detalles = response.json()
+        assert [d["id"] for d in detalles] == ids[:limite]
+        assert all(d["cliente"]["id"] == cliente_id and len(d["pagos"]) == 3 for d in detalles)
+        assert len(consultas) == 2
+
+    cursor = authorized_client.get("/api/v1/prestamos/detalle", params={"limit": 4}).headers["X-Next-Cursor"]
+    response = authorized_client.get("/api/v1/prestamos/detalle", params={"limit": 4, "cursor": cursor})
+    assert [d["id"] for d in response.json()] == ids[4:]
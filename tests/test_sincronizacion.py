@@ -0,0 +1,116 @@
+"""
+🇪🇸 Tests de la sincronización por lotes de la app móvil
+🇺🇸 Tests for the mobile app batch sync
+"""
+from datetime import date, datetime
+from app.models.cobranza import Cobranza, EstadoCobranza
+from app.models.pago import Pago, EstadoPago
+from app.models.resumen_cobranza import ResumenCobranzaDiario
+from app.models.usuario import Usuario
+from app.utils.auth import create_access_token
+from app.utils.resumen_cobranzas import recalcular
+
+def test_sincronizar_lote_idempotente(authorized_client, test_user, test_cliente, db):
+    """
+    🇪🇸 El lote aplica cobranzas y pagos en una transacción, informa cada resultado
+    y reenviarlo no cambia nada
+    🇺🇸 The batch applies collections and payments in one transaction, reports each
+    outcome and resending it changes nothing
+    """
+    cobrador_id = test_user.id
+    prestamo = authorized_client.post("/api/v1/prestamos/", json={
+        "cliente_id": test_cliente.id,
+        "monto": 300.0,
+        "interes": 0.0,
+        "plazo": 3,
+        "frecuencia_pago": "semanal"
+    }).json()
+    cuotas = [pago["id"] for pago in prestamo["pagos"]]
+    cobranza_id = authorized_client.post("/api/v1/cobranzas/", json={
+        "pago_id": cuotas[0],
+        "cobrador_id": cobrador_id,
+        "monto_esperado": 100.0,
+        "zona": "Norte",
+        "direccion_cobro": "Calle 1",
+        "fecha_programada": datetime(2024, 5, 3, 9).isoformat(),
+    }).json()["id"]
+
+    lote = {
+        "cobranzas": [
+            {"clave_idempotencia": "c-1", "cobranza_id": cobranza_id,
+             "cambios": {"estado": "completada", "monto_recibido": 100.0, "metodo_pago": "efectivo"}},
+            {"clave_idempotencia": "c-2", "cobranza_id": 999, "cambios": {"notas": "Sin cobertura"}},
+        ],
+        "pagos": [
+            {"clave_idempotencia": "p-1", "pago_id": cuotas[0],
+             "cambios": {"estado": "pagado", "fecha_pago": "2024-05-03T09:15:00"}},
+            {"clave_idempotencia": "p-2", "pago_id": cuotas[1], "cambios": {"estado": "pagado"}},
+            {"clave_idempotencia": "p-1", "pago_id": cuotas[0], "cambios": {"estado": "pagado"}},
+        ],
+    }
+    response = authorized_client.post("/api/v1/sincronizacion/", json=lote)
+    assert response.status_code == 200
+    assert [(r["clave_idempotencia"], r["resultado"]) for r in response.json()["resultados"]] == [
+        ("c-1", "aplicada"), ("c-2", "no_encontrada"), ("p-1", "aplicada"), ("p-2", "aplicada"), ("p-1", "duplicada"),
+    ]
+    assert response.json()["resultados"][1]["detalle"] == "No existe cobranza con id 999"
+
+    db.expire_all()
+    cobranza = db.get(Cobranza, cobranza_id)
+    assert cobranza.estado == EstadoCobranza.COMPLETADA
+    assert cobranza.fecha_realizada is not None
+    assert db.get(Pago, cuotas[0]).fecha_pago == datetime(2024, 5, 3, 9, 15)
+    assert db.get(Pago, cuotas[1]).estado == EstadoPago.PAGADO
+
+    actual = authorized_client.get(f"/api/v1/prestamos/{prestamo['id']}").json()
+    assert (actual["cuotas_pagadas"], actual["cuotas_pendientes"], actual["saldo_pendiente"]) == (2, 1, 100.0)
+
+    # 🇪🇸 Reenviar el lote completo (p. ej. tras perder la respuesta) no aplica nada
+    # 🇺🇸 Resending the whole batch (e.g. after losing the response) applies nothing
+    response = authorized_client.post("/api/v1/sincronizacion/", json=lote)
+    assert {r["resultado"] for r in response.json()["resultados"]} == {"duplicada"}
+    actual = authorized_client.get(f"/api/v1/prestamos/{prestamo['id']}").json()
+    assert actual["cuotas_pagadas"] == 2
+
+    def filas():
+        db.expire_all()
+        return sorted(
+            (r.fecha, r.zona, r.cobrador_id, r.estado, r.cantidad, r.monto_recibido)
+            for r in db.query(ResumenCobranzaDiario).all() if r.cantidad
+        )
+
+    incremental = filas()
+    assert incremental == [(date(2024, 5, 3), "Norte", cobrador_id, EstadoCobranza.COMPLETADA, 1, 100.0)]
+    recalcular(db, date(2024, 5, 1), date(2024, 5, 31))
+    db.commit()
+    assert filas() == incremental
+
+def test_claves_de_idempotencia_por_usuario(authorized_client, test_user, test_cliente, db):
+    """
+    🇪🇸 La misma clave enviada por otro cobrador se aplica: las claves son por usuario
+    🇺🇸 The same key sent by another collector is applied: keys are per user
+    """
+    otro = Usuario(email="otro@example.com", nombre="Otro", hashed_password="x", rol_id=test_user.rol_id)
+    db.add(otro)
+    db.commit()
+    token_otro = create_access_token(data={"sub": otro.email})
+    prestamo = authorized_client.post("/api/v1/prestamos/", json={
+        "cliente_id": test_cliente.id,
+        "monto": 200.0,
+        "interes": 0.0,
+        "plazo": 2,
+        "frecuencia_pago": "semanal"
+    }).json()
+    cuotas = [pago["id"] for pago in prestamo["pagos"]]
+
+    lote = {"pagos": [{"clave_idempotencia": "1", "pago_id": cuotas[0], "cambios": {"estado": "pagado"}}]}
+    response = authorized_client.post("/api/v1/sincronizacion/", json=lote)
+    assert response.json()["resultados"][0]["resultado"] == "aplicada"
+
+    lote = {"pagos": [{"clave_idempotencia": "1", "pago_id": cuotas[1], "cambios": {"estado": "pagado"}}]}
+    response = authorized_client.post(
+        "/api/v1/sincronizacion/", json=lote, headers={"Authorization": f"Bearer {token_otro}"}
+    )
+    assert response.json()["resultados"][0]["resultado"] == "aplicada"
+    db.expire_all()
+    assert db.get(Pago, cuotas[1]).estado == EstadoPago.PAGADO